@@ -1,17 +1,16 @@
 import os
 import constants
-import sqlalchemy
 import nextcord
 from nextcord.ext import commands
-from sqlalchemy import insert
-from sqlalchemy.orm import Session
 
 from dotenv.main import load_dotenv
 
 load_dotenv(override=True)
 
 import database  # noqa: E402
-from utils import logging_utils, discord_utils  # noqa: E402
+from database import cache_sync, repositories  # noqa: E402
+from utils import command_predicates, logging_utils, discord_utils  # noqa: E402
+from utils import emoji_utils, name_index_utils  # noqa: E402
 
 
 def get_prefix(client, message):
@@ -39,10 +38,19 @@ def main():
         if os.path.exists(os.path.join("modules", folder, "cog.py")):
             client.load_extension(f"modules.{folder}.cog")
 
+    def on_cache_change(table: str, server_id: int):
+        """Another process changed the DB, and our caches have been updated"""
+        if table == database.Verifieds.__tablename__:
+            command_predicates.clear_permissions(server_id)
+
+    cache_sync.add_listener(on_cache_change)
+
     @client.event
     async def on_ready():
         """When the bot starts up"""
         await logging_utils.open_session()
+        # Keep our caches up to date with changes made by other processes (test bots, shards...)
+        cache_sync.CACHE_SYNC.start()
         await client.change_presence(
             activity=nextcord.Activity(
                 type=nextcord.ActivityType.watching, name="you solve👀 | ~about"
@@ -52,73 +60,138 @@ def main():
             if guild.id not in database.PREFIXES:
                 database.PREFIXES[guild.id] = constants.DEFAULT_BOT_PREFIX
                 # Add default prefix to DB
-                with Session(database.DATABASE_ENGINE) as session:
-                    stmt = sqlalchemy.insert(database.Prefixes).values(
-                        server_id=guild.id,
-                        server_name=guild.name,
-                        prefix=constants.DEFAULT_BOT_PREFIX,
-                    )
-                    session.execute(stmt)
-                    session.commit()
+                await repositories.add_prefix(
+                    guild.id, guild.name, constants.DEFAULT_BOT_PREFIX
+                )
             print(
                 f"{client.user.name} has connected to the following guild: "
                 f"{guild.name} (id: {guild.id}) with prefix {database.PREFIXES[guild.id]}"
             )
-            # Make sure there are at least empty entries for VERIFIEDS, and CUSTOM_COMMANDS for every guild we're in
+            # Make sure there are at least empty entries for VERIFIEDS for every guild we're in
             if guild.id not in database.VERIFIEDS:
-                database.VERIFIEDS[guild.id] = []
+                database.VERIFIEDS[guild.id] = frozenset()
             if guild.id not in database.TRUSTEDS:
-                database.TRUSTEDS[guild.id] = []
+                database.TRUSTEDS[guild.id] = frozenset()
             if guild.id not in database.SOLVERS:
-                database.SOLVERS[guild.id] = []
+                database.SOLVERS[guild.id] = frozenset()
             if guild.id not in database.TESTERS:
-                database.TESTERS[guild.id] = []
-            if guild.id not in database.CUSTOM_COMMANDS:
-                database.CUSTOM_COMMANDS[guild.id] = {}
-        # Populate default command list
+                database.TESTERS[guild.id] = frozenset()
+        # Populate default command set. Rebuilt (not appended to) so reconnects don't pile up duplicates
+        default_commands = set()
         for command in client.commands:
-            constants.DEFAULT_COMMANDS.append(command.qualified_name.lower())
+            default_commands.add(command.qualified_name.lower())
             for alias in command.aliases:
-                constants.DEFAULT_COMMANDS.append(alias.lower())
+                default_commands.add(alias.lower())
+        constants.DEFAULT_COMMANDS = frozenset(default_commands)
+        # Index every emoji we can see, for ~emoji and ~steal
+        emoji_utils.EMOJI_INDEX.build(client.guilds)
+        # A fresh READY can replace nextcord's guild objects, so rebuild the name indexes as they're needed
+        name_index_utils.NAME_INDEXES.clear()
 
     @client.event
     async def on_guild_join(guild: nextcord.Guild):
         """When the bot joins a new guild, add it to the database for prefixes"""
         print(f"Joining {guild} -- Hi!")
-        with Session(database.DATABASE_ENGINE) as session:
-            stmt = insert(database.Prefixes).values(
-                server_id=guild.id,
-                server_name=guild.name,
-                prefix=constants.DEFAULT_BOT_PREFIX,
-            )
-            session.execute(stmt)
-            session.commit()
+        await repositories.add_prefix(
+            guild.id, guild.name, constants.DEFAULT_BOT_PREFIX
+        )
         database.PREFIXES[guild.id] = constants.DEFAULT_BOT_PREFIX
-        database.VERIFIEDS[guild.id] = []
-        database.TRUSTEDS[guild.id] = []
-        database.SOLVERS[guild.id] = []
-        database.TESTERS[guild.id] = []
-        database.CUSTOM_COMMANDS[guild.id] = {}
+        database.VERIFIEDS[guild.id] = frozenset()
+        database.TRUSTEDS[guild.id] = frozenset()
+        database.SOLVERS[guild.id] = frozenset()
+        database.TESTERS[guild.id] = frozenset()
+        command_predicates.clear_permissions(guild.id)
+        emoji_utils.EMOJI_INDEX.set_guild(guild.id, guild.emojis)
 
     @client.event
     async def on_guild_remove(guild: nextcord.Guild):
         """When the bot leaves a guild, remove all database entries pertaining to that guild"""
         print(f"Leaving {guild} -- Bye bye!")
-        with Session(database.DATABASE_ENGINE) as session:
-            session.query(database.CustomCommands).filter_by(
-                server_id=guild.id
-            ).delete()
-            session.commit()
-            session.query(database.Prefixes).filter_by(server_id=guild.id).delete()
-            session.commit()
-            session.query(database.Verifieds).filter_by(server_id=guild.id).delete()
-            session.commit()
-            session.query(database.SheetTethers).filter_by(server_id=guild.id).delete()
-            session.commit()
+        await repositories.delete_server(guild.id)
         database.PREFIXES.pop(guild.id)
         database.VERIFIEDS.pop(guild.id)
         database.TRUSTEDS.pop(guild.id)
-        database.CUSTOM_COMMANDS.pop(guild.id)
+        database.SOLVERS.pop(guild.id, None)
+        database.TESTERS.pop(guild.id, None)
+        command_predicates.clear_permissions(guild.id)
+        emoji_utils.EMOJI_INDEX.remove_guild(guild.id)
+        name_index_utils.drop_guild(guild.id)
+        database.CUSTOM_COMMANDS.drop_server(guild.id)
+        for chan_or_cat_id, tether in list(database.SHEET_TETHERS.items()):
+            if tether.server_id == guild.id:
+                database.SHEET_TETHERS.pop(chan_or_cat_id)
+
+    @client.event
+    async def on_guild_emojis_update(guild: nextcord.Guild, before, after):
+        """Keep the emoji index up to date when a guild adds, removes or renames emojis"""
+        emoji_utils.EMOJI_INDEX.set_guild(guild.id, after)
+
+    # Keep the name indexes (see name_index_utils) up to date with channels, threads, roles and members
+    @client.event
+    async def on_guild_channel_create(channel: nextcord.abc.GuildChannel):
+        name_index_utils.update_object(channel.guild, "channels", channel)
+
+    @client.event
+    async def on_guild_channel_update(before, after: nextcord.abc.GuildChannel):
+        name_index_utils.update_object(after.guild, "channels", after)
+
+    @client.event
+    async def on_guild_channel_delete(channel: nextcord.abc.GuildChannel):
+        name_index_utils.remove_object(channel.guild, "channels", channel.id)
+
+    @client.event
+    async def on_thread_join(thread: nextcord.Thread):
+        name_index_utils.update_object(thread.guild, "threads", thread)
+
+    @client.event
+    async def on_thread_update(before, after: nextcord.Thread):
+        name_index_utils.update_object(after.guild, "threads", after)
+
+    @client.event
+    async def on_thread_delete(thread: nextcord.Thread):
+        name_index_utils.remove_object(thread.guild, "threads", thread.id)
+
+    @client.event
+    async def on_thread_remove(thread: nextcord.Thread):
+        name_index_utils.remove_object(thread.guild, "threads", thread.id)
+
+    @client.event
+    async def on_guild_role_create(role: nextcord.Role):
+        name_index_utils.update_object(role.guild, "roles", role)
+
+    @client.event
+    async def on_guild_role_update(before, after: nextcord.Role):
+        name_index_utils.update_object(after.guild, "roles", after)
+
+    @client.event
+    async def on_member_join(member: nextcord.Member):
+        name_index_utils.update_object(member.guild, "members", member)
+
+    @client.event
+    async def on_member_remove(member: nextcord.Member):
+        name_index_utils.remove_object(member.guild, "members", member.id)
+
+    @client.event
+    async def on_user_update(before, after: nextcord.User):
+        """Usernames and global names show up in every guild the user is in"""
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member is not None:
+                name_index_utils.update_object(guild, "members", member)
+
+    @client.event
+    async def on_member_update(before: nextcord.Member, after: nextcord.Member):
+        """Work out the member's permissions again next time if their roles changed"""
+        if before.roles != after.roles:
+            command_predicates.clear_permissions(after.guild.id, after.id)
+        # Their nickname may have changed
+        name_index_utils.update_object(after.guild, "members", after)
+
+    @client.event
+    async def on_guild_role_delete(role: nextcord.Role):
+        """Work out the guild's permissions again, its members may have lost the role"""
+        command_predicates.clear_permissions(role.guild.id)
+        name_index_utils.remove_object(role.guild, "roles", role.id)
 
     @client.event
     async def on_message(message: nextcord.Message):
@@ -137,24 +210,19 @@ def main():
                 await client.process_commands(message)
             # Don't use custom commands for DMs also I think this fixes a bug which gets an error when someone
             # uses a command right as the box is starting up.
-            elif (
-                message.guild is not None
-                and message.guild.id in database.CUSTOM_COMMANDS
-            ):
-                command_return = None
-                # check if custom command is in cache for that server
-                if command_name in [
-                    command.lower()
-                    for command in database.CUSTOM_COMMANDS[message.guild.id].keys()
-                ]:
-                    command_return = database.CUSTOM_COMMANDS[message.guild.id][
-                        command_name
-                    ][0]
+            elif message.guild is not None:
+                # check if custom command is in cache for that server, then the global ones.
+                # Keys are always lowercase
+                await database.CUSTOM_COMMANDS.fetch(message.guild.id)
+                cached_command = database.CUSTOM_COMMANDS.get(
+                    message.guild.id, command_name
+                )
 
                 # Command found in cache
-                if command_return is not None:
+                if cached_command is not None:
+                    command_return, is_image = cached_command
                     # Image, so we use normal text.
-                    if database.CUSTOM_COMMANDS[message.guild.id][command_name][1]:
+                    if is_image:
                         await message.channel.send(command_return)
                     # Non-Image, so use embed.
                     else:
@@ -164,42 +232,33 @@ def main():
                         await message.channel.send(embed=embed)
                     return
 
+                # We looked for this recently and it doesn't exist (typos, other bots' commands, ~~strikethrough~~...)
+                if (message.guild.id, command_name) in database.CUSTOM_COMMAND_MISSES:
+                    return
+
                 # The custom command is not in the cache
-                # Query the DB to see if we have a command with that name
-                with Session(database.DATABASE_ENGINE) as session:
-                    # Checking for this server
-                    result = (
-                        session.query(database.CustomCommands)
-                        .filter_by(
-                            server_id_command=f"{message.guild.id} {command_name}"
-                        )
-                        .first()
+                # Query the DB to see if we have a command with that name, for this server or global
+                result = await repositories.find_custom_command(
+                    message.guild.id, command_name
+                )
+                if result is None:
+                    database.CUSTOM_COMMAND_MISSES.add((message.guild.id, command_name))
+                    return
+                # Adds to cache. Global commands go in the global cache, not the server's
+                database.CUSTOM_COMMANDS.set(
+                    database.CUSTOM_COMMANDS.server_id_of(result),
+                    command_name,
+                    result.command_return,
+                    result.image,
+                )
+                if result.image:
+                    await message.channel.send(result.command_return)
+                else:
+                    embed = nextcord.Embed(
+                        description=result.command_return,
+                        color=constants.EMBED_COLOR,
                     )
-                    # Check for global custom commands
-                    # TODO - confirm global cc trigger works
-                    if result is None:
-                        result = (
-                            session.query(database.CustomCommands)
-                            .filter_by(
-                                server_id_command=f"{constants.DB_GLOBAL} {command_name}"
-                            )
-                            .first()
-                        )
-                    if result is not None:
-                        if result.image:
-                            await message.channel.send(result.command_return)
-                            return
-                        else:
-                            embed = nextcord.Embed(
-                                description=result.command_return,
-                                color=constants.EMBED_COLOR,
-                            )
-                            await message.channel.send(embed=embed)
-                        # Adds to cache. NOTE - This adds to cache even if local or global
-                        database.CUSTOM_COMMANDS[message.guild.id][command_name] = (
-                            result.command_return,
-                            result.image,
-                        )
+                    await message.channel.send(embed=embed)
 
     client.run(os.getenv("DISCORD_TOKEN"))
 
@@ -215,19 +274,23 @@ def main():
             command_name = str(ctx.invoked_with).lower() if ctx.invoked_with else None
 
             if command_name:
-                if ctx.guild and command_name in database.CUSTOM_COMMANDS.get(ctx.guild.id, {}):
+                cached_command = (
+                    database.CUSTOM_COMMANDS.get(ctx.guild.id, command_name)
+                    if ctx.guild
+                    else None
+                )
+                if cached_command is not None:
                     embed = discord_utils.create_embed()
                     embed.add_field(
                         name="Thats a custom command!",
                         value=f'The command "{command_name}" is a custom command created for this server! '
                         f"Use `~help Custom Commands` to see how they work!"
-                        f"Your custom command response is: {database.CUSTOM_COMMANDS[ctx.guild.id][command_name]}",
+                        f"Your custom command response is: {cached_command[0]}",
                         inline=False,
                     )
                     await discord_utils.send_message(ctx, embed)
                     return
         # If not a custom command, let the error propagate normally
-        # TODO global custom commands
 
 
 
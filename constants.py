@@ -5,13 +5,23 @@ DEFAULT_BOT_PREFIX = "~"
 EMBED_COLOR = 0xD4E4FF
 
 
-DEFAULT_COMMANDS = []
-CUSTOM_COMMANDS = {}
+# Lowercased names and aliases of every built-in command. Rebuilt in on_ready
+DEFAULT_COMMANDS = frozenset()
 
 # File size restriction
 BYTES_TO_MEGABYTES = 1_048_576  # 1024 squared
 HARDCODED_FILE_SIZE = 10_485_760
 
+# Bulk changes (see discord_utils.run_bulk): max requests in flight at once, and per rate limit bucket
+BULK_MAX_CONCURRENCY = 8
+BULK_ROUTE_CONCURRENCY = 2
+# Bulk changes on at least this many items show a progress message, updated this often (seconds)
+BULK_PROGRESS_THRESHOLD = 10
+BULK_PROGRESS_INTERVAL = 3
+# Discord only lets a channel be renamed this many times per window (seconds). See solved_utils.rename_channel
+CHANNEL_RENAME_LIMIT = 2
+CHANNEL_RENAME_WINDOW = 600
+
 ###########
 # MODULES #
 ###########
@@ -23,6 +33,28 @@ MODULES_DIR = "modules"
 ############
 
 DB_GLOBAL = "global"
+# Connection pool of the async DB engine: connections kept open, extra ones allowed when busy,
+# how long to wait for one (seconds), and how old a connection can get before it's replaced (seconds)
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+DB_POOL_TIMEOUT = 10
+DB_POOL_RECYCLE = 1800
+# Global custom commands are stored under this server id
+DB_GLOBAL_SERVER_ID = -1
+# Max number of servers whose custom commands we keep in memory (None for all of them)
+CUSTOM_COMMAND_CACHE_SERVERS = 512
+# Custom command names we looked up and didn't find are remembered for this long (seconds), up to this many
+CUSTOM_COMMAND_MISS_TTL = 300
+CUSTOM_COMMAND_MISS_CACHE_SIZE = 4096
+# Max number of (server, member) permission lookups remembered by command_predicates before starting over
+PERMISSION_MEMO_SIZE = 10_000
+# Postgres channel the cache change notifications are sent on
+CACHE_SYNC_CHANNEL = "cache_changes"
+# Without LISTEN/NOTIFY (SQLite), how often to check for changes, and how long to keep them (seconds)
+CACHE_SYNC_POLL_INTERVAL = 5
+CACHE_SYNC_RETENTION = 3600
+# How long to wait before listening again after losing the connection (seconds)
+CACHE_SYNC_RECONNECT_DELAY = 30
 
 ############
 # REMINDER #
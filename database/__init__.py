@@ -2,25 +2,39 @@
 
 from database.models import (
     DATABASE_ENGINE,
+    VERIFIED,
+    TRUSTED,
+    SOLVER,
+    TESTER,
     VERIFIED_CATEGORIES,
     Verifieds,
     CustomCommands,
     Prefixes,
     SheetTethers,
+    TimezoneLocations,
+    ArchiveCheckpoints,
+    ArchivedAttachments,
+    MessageActivity,
+    CacheChanges,
 )
 
 from database.database_utils import (
     get_prefixes,
-    get_verifieds,
-    get_trusteds,
-    get_solvers,
-    get_testers,
+    get_permission_roles,
     get_custom_commands,
+    get_custom_command_misses,
+    get_sheet_tethers,
+    get_timezone_locations,
 )
 
 PREFIXES = get_prefixes()
-VERIFIEDS = get_verifieds()
-TRUSTEDS = get_trusteds()
-SOLVERS = get_solvers()
-TESTERS = get_testers()
+PERMISSION_ROLES = get_permission_roles()
+VERIFIEDS = PERMISSION_ROLES[VERIFIED]
+TRUSTEDS = PERMISSION_ROLES[TRUSTED]
+SOLVERS = PERMISSION_ROLES[SOLVER]
+TESTERS = PERMISSION_ROLES[TESTER]
 CUSTOM_COMMANDS = get_custom_commands()
+# (server id, command name) of custom commands we know don't exist
+CUSTOM_COMMAND_MISSES = get_custom_command_misses()
+SHEET_TETHERS = get_sheet_tethers()
+TIMEZONE_LOCATIONS = get_timezone_locations()
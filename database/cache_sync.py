@@ -0,0 +1,367 @@
+import asyncio
+import json
+import time
+import constants
+import database
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from database import database_utils, models
+
+"""
+Keeps this process's DB caches up to date when another process (a test bot, another shard...) changes the DB.
+
+Triggers on the cached tables report every changed row. On Postgres they're sent with NOTIFY and we LISTEN for them,
+otherwise (SQLite) they're written to the cache_changes table, which we poll. Either way, we only re-read the rows
+that changed and update the caches in place, instead of reloading whole tables.
+"""
+
+# table name -> column which identifies the changed row
+WATCHED_TABLES = {
+    models.Prefixes.__tablename__: "server_id",
+    models.Verifieds.__tablename__: "role_id_permissions",
+    models.CustomCommands.__tablename__: "server_id_command",
+    models.SheetTethers.__tablename__: "channel_or_cat_id",
+}
+
+POSTGRES_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION notify_cache_change() RETURNS trigger AS $$
+DECLARE
+    changed jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+    PERFORM pg_notify('{constants.CACHE_SYNC_CHANNEL}', json_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'server_id', changed ->> 'server_id',
+        'key', changed ->> TG_ARGV[0]
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Functions called with (table name, server id) after a change is applied
+LISTENERS = []
+
+
+def add_listener(func):
+    """Call func(table name, server id) whenever a change to one of the WATCHED_TABLES is applied.
+    The server id is None when the whole table was reloaded"""
+    LISTENERS.append(func)
+
+
+def install_triggers(engine):
+    """Create (or replace) the triggers which report changes to the WATCHED_TABLES"""
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(POSTGRES_NOTIFY_FUNCTION))
+            for table, column in WATCHED_TABLES.items():
+                conn.execute(
+                    text(f"DROP TRIGGER IF EXISTS {table}_cache_changes ON {table}")
+                )
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER {table}_cache_changes AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                        f"FOR EACH ROW EXECUTE FUNCTION notify_cache_change('{column}')"
+                    )
+                )
+        else:
+            for table, column in WATCHED_TABLES.items():
+                for op, row in [
+                    ("INSERT", "NEW"),
+                    ("UPDATE", "NEW"),
+                    ("DELETE", "OLD"),
+                ]:
+                    conn.execute(
+                        text(
+                            f"CREATE TRIGGER IF NOT EXISTS {table}_cache_{op.lower()} AFTER {op} ON {table} "
+                            f"BEGIN INSERT INTO {models.CacheChanges.__tablename__} "
+                            f"(table_name, op, server_id, key, changed_at) VALUES "
+                            f"('{table}', '{op}', {row}.server_id, {row}.{column}, CAST(strftime('%s', 'now') AS INTEGER)); END"
+                        )
+                    )
+
+
+def apply_prefix_change(server_id: int, key: str, row):
+    if row is None:
+        database.PREFIXES.pop(int(key), None)
+    else:
+        database.PREFIXES[row.server_id] = row.prefix
+
+
+def apply_verified_change(server_id: int, key: str, row):
+    # Keys look like "<role id>_<Permission Category>"
+    role_id, permissions = key.split("_", 1)
+    role_id = int(role_id)
+    cache = database.PERMISSION_ROLES.get(permissions)
+    if cache is None:
+        return
+    role_ids = cache.get(server_id, frozenset())
+    if row is None:
+        cache[server_id] = role_ids - {role_id}
+    else:
+        cache[server_id] = role_ids | {role_id}
+
+
+def apply_custom_command_change(server_id: int, key: str, row):
+    # Keys look like "<server id> <command name>", or "global <command name>"
+    owner, command_name = key.split(" ", 1)
+    server_id = (
+        constants.DB_GLOBAL_SERVER_ID if owner == constants.DB_GLOBAL else int(owner)
+    )
+    command_name = command_name.lower()
+    if row is None:
+        database.CUSTOM_COMMANDS.update_cached(server_id, command_name)
+    else:
+        database.CUSTOM_COMMANDS.update_cached(
+            server_id, command_name, (row.command_return, row.image)
+        )
+        if server_id == constants.DB_GLOBAL_SERVER_ID:
+            database.CUSTOM_COMMAND_MISSES.clear()
+        else:
+            database.CUSTOM_COMMAND_MISSES.discard((server_id, command_name))
+
+
+def apply_sheet_tether_change(server_id: int, key: str, row):
+    if row is None:
+        database.SHEET_TETHERS.pop(int(key), None)
+    else:
+        database.SHEET_TETHERS[row.channel_or_cat_id] = row
+
+
+# table name -> (model, function to turn a key into the model's primary key, function to apply a change)
+APPLY_CHANGE = {
+    models.Prefixes.__tablename__: (models.Prefixes, int, apply_prefix_change),
+    models.Verifieds.__tablename__: (models.Verifieds, str, apply_verified_change),
+    models.CustomCommands.__tablename__: (
+        models.CustomCommands,
+        str,
+        apply_custom_command_change,
+    ),
+    models.SheetTethers.__tablename__: (
+        models.SheetTethers,
+        int,
+        apply_sheet_tether_change,
+    ),
+}
+
+# Changes and reloads are applied one at a time, in the order they came in
+APPLY_LOCK = asyncio.Lock()
+
+
+def read_changed_rows(keys: list) -> dict:
+    """{(table name, key): the row as it is now, or None if it's gone}. Blocking, so run it in a thread"""
+    rows = {}
+    with Session(models.DATABASE_ENGINE) as session:
+        for table, key in keys:
+            model, primary_key, _ = APPLY_CHANGE[table]
+            try:
+                rows[(table, key)] = session.get(model, primary_key(key))
+            except Exception as e:
+                print(f"Couldn't read change to {table} {key}: {e}")
+        # Detach the rows so they can live in the caches after the session closes
+        session.expunge_all()
+    return rows
+
+
+async def apply_changes(changes: list):
+    """Re-read each changed row (table name, server id, key) and update its cache"""
+    # We read the row's current state, so a row which changed several times only needs reading once
+    latest = {}
+    for table, server_id, key in changes:
+        if table not in APPLY_CHANGE or key is None:
+            continue
+        latest.pop((table, key), None)
+        latest[(table, key)] = server_id
+    if not latest:
+        return
+    async with APPLY_LOCK:
+        rows = await asyncio.to_thread(read_changed_rows, list(latest))
+        for (table, key), server_id in latest.items():
+            if (table, key) not in rows:
+                continue
+            server_id = int(server_id) if server_id is not None else None
+            try:
+                APPLY_CHANGE[table][2](server_id, key, rows[(table, key)])
+            except Exception as e:
+                print(f"Couldn't apply change to {table} {key}: {e}")
+                continue
+            for listener in LISTENERS:
+                listener(table, server_id)
+
+
+def read_all() -> tuple:
+    """Read every watched table from the DB. Blocking, so run it in a thread"""
+    return (
+        database_utils.get_prefixes(),
+        database_utils.get_permission_roles(),
+        database_utils.get_custom_commands(),
+        database_utils.get_sheet_tethers(),
+    )
+
+
+async def reload_all():
+    """Reload every watched cache from scratch. Only for when we may have missed changes"""
+    async with APPLY_LOCK:
+        (
+            prefixes,
+            permission_roles,
+            custom_commands,
+            sheet_tethers,
+        ) = await asyncio.to_thread(read_all)
+        database.PREFIXES.clear()
+        database.PREFIXES.update(prefixes)
+        for permissions, servers in permission_roles.items():
+            database.PERMISSION_ROLES[permissions].clear()
+            database.PERMISSION_ROLES[permissions].update(servers)
+        database.CUSTOM_COMMANDS.replace(custom_commands)
+        database.CUSTOM_COMMAND_MISSES.clear()
+        database.SHEET_TETHERS.clear()
+        database.SHEET_TETHERS.update(sheet_tethers)
+        for table in WATCHED_TABLES:
+            for listener in LISTENERS:
+                listener(table, None)
+
+
+class CacheSync:
+    """
+    Applies other processes' changes to our caches: by LISTENing on Postgres, otherwise by polling cache_changes.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        # Pooled connection we LISTEN on (Postgres only)
+        self.connection = None
+        self.task = None
+        self.last_change_id = None
+
+    def start(self):
+        """Install the triggers and start following changes. Safe to call again (on reconnects)"""
+        if self.task is not None:
+            return
+        self.task = asyncio.create_task(self.run())
+
+    async def run(self):
+        # DDL is blocking, so keep it off the event loop
+        try:
+            await asyncio.to_thread(install_triggers, self.engine)
+        except Exception as e:
+            # They're usually still there from the last start, so follow changes anyway
+            print(f"Couldn't install the cache change triggers: {e}")
+        if self.engine.dialect.name == "postgresql":
+            await self.listen()
+        else:
+            await self.poll()
+
+    async def listen(self):
+        while True:
+            try:
+                await self.listen_once()
+            except Exception as e:
+                print(f"Lost the cache change notifications, listening again soon: {e}")
+            await asyncio.sleep(constants.CACHE_SYNC_RECONNECT_DELAY)
+
+    async def listen_once(self):
+        loop = asyncio.get_running_loop()
+        lost = loop.create_future()
+        self.connection = await asyncio.to_thread(self.engine.raw_connection)
+        connection = self.connection.driver_connection
+        connection.autocommit = True
+        # Changes queued by on_readable, applied in order by the task below
+        queue = asyncio.Queue()
+
+        def on_readable():
+            try:
+                connection.poll()
+            except Exception as e:
+                if not lost.done():
+                    lost.set_exception(e)
+                return
+            changes = []
+            while connection.notifies:
+                payload = json.loads(connection.notifies.pop(0).payload)
+                changes.append((payload["table"], payload["server_id"], payload["key"]))
+            if changes:
+                queue.put_nowait(changes)
+
+        async def apply_queued():
+            while True:
+                changes = await queue.get()
+                try:
+                    await apply_changes(changes)
+                except Exception as e:
+                    print(f"Couldn't apply cache changes: {e}")
+
+        fileno = None
+        applier = None
+        try:
+            await asyncio.to_thread(self.start_listening, connection)
+            # Anything which changed before we were listening (since startup, or while we were disconnected)
+            # is only in the DB, so reload it. Changes from now on are queued up until the reload is done
+            fileno = connection.fileno()
+            loop.add_reader(fileno, on_readable)
+            await reload_all()
+            applier = asyncio.create_task(apply_queued())
+            await lost
+        finally:
+            if fileno is not None:
+                loop.remove_reader(fileno)
+            if applier is not None:
+                applier.cancel()
+            # Don't give a connection in LISTEN mode back to the pool
+            self.connection.invalidate()
+            self.connection = None
+
+    @staticmethod
+    def start_listening(connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {constants.CACHE_SYNC_CHANNEL}")
+
+    async def poll(self):
+        # Note where the change log is before reloading, so nothing which changes since startup is missed
+        self.last_change_id = await asyncio.to_thread(self.get_last_change_id)
+        try:
+            await reload_all()
+        except Exception as e:
+            print(f"Couldn't reload the caches: {e}")
+        while True:
+            await asyncio.sleep(constants.CACHE_SYNC_POLL_INTERVAL)
+            try:
+                await apply_changes(await asyncio.to_thread(self.poll_once))
+            except Exception as e:
+                print(f"Couldn't check for cache changes: {e}")
+
+    def get_last_change_id(self) -> int:
+        with Session(self.engine) as session:
+            return (
+                session.query(models.CacheChanges.id)
+                .order_by(models.CacheChanges.id.desc())
+                .limit(1)
+                .scalar()
+                or 0
+            )
+
+    def poll_once(self) -> list:
+        """The (table name, server id, key) of every change since we last checked. Blocking, so run it in a thread"""
+        with Session(self.engine) as session:
+            rows = (
+                session.query(models.CacheChanges)
+                .filter(models.CacheChanges.id > self.last_change_id)
+                .order_by(models.CacheChanges.id)
+                .all()
+            )
+            if rows:
+                self.last_change_id = rows[-1].id
+            session.query(models.CacheChanges).filter(
+                models.CacheChanges.changed_at
+                < int(time.time()) - constants.CACHE_SYNC_RETENTION
+            ).delete()
+            session.commit()
+            return [(row.table_name, row.server_id, row.key) for row in rows]
+
+
+CACHE_SYNC = CacheSync(models.DATABASE_ENGINE)
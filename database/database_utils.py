@@ -1,5 +1,9 @@
+import constants
+import sys
+import time
+from collections import OrderedDict
 from sqlalchemy.orm import Session
-from database import models
+from database import models, repositories
 
 
 def get_prefixes():
@@ -11,63 +15,227 @@ def get_prefixes():
     return prefixes
 
 
-def get_solvers():
-    solvers = {}
+def get_permission_roles() -> dict:
+    """{Permission Category: {server id: frozenset of the role ids}}, for every Permission Category, in one query"""
+    roles = {permissions: {} for permissions in models.VERIFIED_CATEGORIES}
     with Session(models.DATABASE_ENGINE) as session:
-        result = session.query(models.Verifieds).filter_by(permissions="Solver").all()
-        for row in result:
-            if row.server_id in solvers:
-                solvers[row.server_id].append(row.role_id)
-            else:
-                solvers[row.server_id] = [row.role_id]
-    return solvers
+        result = session.query(
+            models.Verifieds.permissions,
+            models.Verifieds.server_id,
+            models.Verifieds.role_id,
+        ).filter(models.Verifieds.permissions.in_(models.VERIFIED_CATEGORIES))
+        for permissions, server_id, role_id in result:
+            roles[permissions].setdefault(server_id, set()).add(role_id)
+    return {
+        permissions: {
+            server_id: frozenset(role_ids) for server_id, role_ids in servers.items()
+        }
+        for permissions, servers in roles.items()
+    }
 
 
-def get_testers():
-    testers = {}
-    with Session(models.DATABASE_ENGINE) as session:
-        result = session.query(models.Verifieds).filter_by(permissions="Tester").all()
-        for row in result:
-            if row.server_id in testers:
-                testers[row.server_id].append(row.role_id)
-            else:
-                testers[row.server_id] = [row.role_id]
-    return testers
+class CustomCommandCache:
+    """
+    Every server's custom commands, kept compact so memory stays flat as the bot joins more servers.
 
+    - Global commands are stored once. Servers fall back to them instead of getting their own copy.
+    - Each server only holds its own commands, loaded from the DB (by fetch) the first time they're needed.
+    - At most `max_servers` servers are kept (None for no limit). The least recently used ones are dropped
+      and fetched from the DB again when next needed.
+    - Command names and returns are interned, so the same text used in many servers is only stored once.
+    """
 
-def get_verifieds():
-    verifieds = {}
-    with Session(models.DATABASE_ENGINE) as session:
-        result = session.query(models.Verifieds).filter_by(permissions="Verified").all()
-        for row in result:
-            if row.server_id in verifieds:
-                verifieds[row.server_id].append(row.role_id)
-            else:
-                verifieds[row.server_id] = [row.role_id]
-    return verifieds
+    def __init__(self, max_servers: int = None):
+        self.max_servers = max_servers
+        self.globals = {}
+        # server id -> {command name: (command return, image)}
+        self.servers = OrderedDict()
+
+    @staticmethod
+    def server_id_of(row) -> int:
+        """The server a CustomCommands row belongs to (DB_GLOBAL_SERVER_ID for global ones)"""
+        # Some global commands are keyed "global <name>" rather than by server id
+        if row.server_id_command.startswith(f"{constants.DB_GLOBAL} "):
+            return constants.DB_GLOBAL_SERVER_ID
+        return row.server_id
+
+    def _add(self, commands: dict, name: str, command_return: str, image: bool):
+        commands[sys.intern(name.lower())] = (
+            sys.intern(command_return or ""),
+            bool(image),
+        )
+
+    def load(self):
+        """Load the global commands, and every server's too if there's no limit on how many we keep"""
+        with Session(models.DATABASE_ENGINE) as session:
+            for row in session.query(models.CustomCommands).all():
+                server_id = self.server_id_of(row)
+                if server_id == constants.DB_GLOBAL_SERVER_ID:
+                    self._add(
+                        self.globals, row.command_name, row.command_return, row.image
+                    )
+                elif self.max_servers is None:
+                    commands = self.servers.setdefault(server_id, {})
+                    self._add(commands, row.command_name, row.command_return, row.image)
+
+    def _server_commands(self, server_id: int, rows) -> dict:
+        commands = {}
+        for row in rows:
+            if self.server_id_of(row) == server_id:
+                self._add(commands, row.command_name, row.command_return, row.image)
+        return commands
+
+    async def fetch(self, server_id: int):
+        """Make sure the server's commands are in memory, reading them from the DB without blocking the event loop.
+        Call this before indexing the cache for a server"""
+        if server_id == constants.DB_GLOBAL_SERVER_ID:
+            return
+        if server_id in self.servers:
+            self._touch(server_id)
+            return
+        rows = await repositories.get_server_custom_commands(server_id)
+        # Someone else may have loaded them while we waited
+        if server_id not in self.servers:
+            self.servers[server_id] = self._server_commands(server_id, rows)
+        self._touch(server_id)
+
+    def _touch(self, server_id: int):
+        """Mark the server as just used, and drop the least recently used ones if we're over the limit"""
+        self.servers.move_to_end(server_id)
+        if self.max_servers is not None:
+            while len(self.servers) > self.max_servers:
+                self.servers.popitem(last=False)
+
+    def _cached(self, server_id: int) -> dict:
+        """The server's commands if they're in memory (the global ones for DB_GLOBAL_SERVER_ID), else None"""
+        if server_id == constants.DB_GLOBAL_SERVER_ID:
+            return self.globals
+        return self.servers.get(server_id)
+
+    def __getitem__(self, server_id: int) -> dict:
+        """The server's own commands (or the global ones for DB_GLOBAL_SERVER_ID). Don't modify it directly, use set/remove.
+        Never reads the DB: await fetch(server_id) first, or servers which aren't in memory look like they have none"""
+        commands = self._cached(server_id)
+        if commands is None:
+            return {}
+        if server_id != constants.DB_GLOBAL_SERVER_ID:
+            self._touch(server_id)
+        return commands
+
+    def get(self, server_id: int, name: str) -> tuple:
+        """(command return, image) for the server's command, falling back to the global one. None if neither exists"""
+        return self[server_id].get(name) or self.globals.get(name)
+
+    def set(self, server_id: int, name: str, command_return: str, image: bool):
+        self.update_cached(server_id, name.lower(), (command_return, image))
+
+    def remove(self, server_id: int, name: str):
+        self.update_cached(server_id, name.lower())
+
+    def update_cached(self, server_id: int, name: str, command: tuple = None):
+        """Update the (command return, image) if we have the server's commands in memory (None removes it).
+        Servers which aren't in memory get the change when they're loaded from the DB"""
+        commands = self._cached(server_id)
+        if commands is None:
+            return
+        if command is None:
+            commands.pop(name, None)
+        else:
+            self._add(commands, name, *command)
+
+    def replace(self, other: "CustomCommandCache"):
+        """Throw everything away and use the commands from the other (freshly loaded) cache instead"""
+        self.globals = other.globals
+        self.servers = other.servers
+
+    def drop_server(self, server_id: int):
+        """Forget the server's commands (they're reloaded from the DB by the next fetch)"""
+        self.servers.pop(server_id, None)
 
+    def get_stats(self) -> dict:
+        """Rough memory footprint (in bytes) of the cached commands, and what's in it"""
+        seen = set()
 
-def get_trusteds():
-    trusteds = {}
+        def size(obj) -> int:
+            if id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        total = size(self.servers)
+        for commands in [self.globals, *self.servers.values()]:
+            total += size(commands)
+            for name, value in commands.items():
+                total += size(name) + size(value) + size(value[0])
+        return {
+            "servers": len(self.servers),
+            "server_commands": sum(len(c) for c in self.servers.values()),
+            "global_commands": len(self.globals),
+            "bytes": total,
+        }
+
+
+def get_custom_commands():
+    custom_commands = CustomCommandCache(constants.CUSTOM_COMMAND_CACHE_SERVERS)
+    custom_commands.load()
+    return custom_commands
+
+
+class MissCache:
+    """
+    Bounded set of keys we recently looked up and didn't find, so we don't keep asking the DB for them.
+    Entries expire after `ttl` seconds, and the oldest are dropped once there are more than `size`.
+    """
+
+    def __init__(self, ttl: float, size: int):
+        self.ttl = ttl
+        self.size = size
+        # key -> time it expires
+        self.entries = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        expires_at = self.entries.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return False
+        return True
+
+    def add(self, key):
+        self.entries[key] = time.monotonic() + self.ttl
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def discard(self, key):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def get_custom_command_misses():
+    return MissCache(
+        constants.CUSTOM_COMMAND_MISS_TTL, constants.CUSTOM_COMMAND_MISS_CACHE_SIZE
+    )
+
+
+def get_sheet_tethers():
+    sheet_tethers = {}
     with Session(models.DATABASE_ENGINE) as session:
-        result = session.query(models.Verifieds).filter_by(permissions="Trusted").all()
+        result = session.query(models.SheetTethers).all()
         for row in result:
-            if row.server_id in trusteds:
-                trusteds[row.server_id].append(row.role_id)
-            else:
-                trusteds[row.server_id] = [row.role_id]
-    return trusteds
+            # Detach the row so it can live in the cache after the session closes
+            session.expunge(row)
+            sheet_tethers[row.channel_or_cat_id] = row
+    return sheet_tethers
 
 
-def get_custom_commands():
-    custom_commands = {}
+def get_timezone_locations():
+    timezone_locations = {}
     with Session(models.DATABASE_ENGINE) as session:
-        result = session.query(models.CustomCommands).all()
+        result = session.query(models.TimezoneLocations).all()
         for row in result:
-            if row.server_id not in custom_commands:
-                custom_commands[row.server_id] = {}
-            custom_commands[row.server_id][row.command_name.lower()] = (
-                row.command_return,
-                row.image,
-            )
-    return custom_commands
+            timezone_locations[row.location] = row.timezone_id
+    return timezone_locations
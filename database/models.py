@@ -1,7 +1,9 @@
 import os
-from sqlalchemy import Column, create_engine
+import constants
+from sqlalchemy import Column, Index, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql.sqltypes import BIGINT, Boolean, String
+from sqlalchemy.sql.sqltypes import BIGINT, Boolean, Integer, String
 
 # Your link may use postgres:// everywhere but it's deprecated by SQLAlchemy.
 uri = os.getenv("DATABASE_URL")
@@ -10,6 +12,33 @@ if uri and uri.startswith("postgres://"):
 
 print(uri)
 DATABASE_ENGINE = create_engine(uri, echo=False, future=True)
+
+
+def get_async_uri(uri: str) -> str:
+    """The same DB, through an asyncio driver (asyncpg for Postgres, aiosqlite for SQLite)"""
+    if uri.startswith("postgresql://"):
+        # asyncpg calls sslmode ssl
+        return uri.replace("postgresql://", "postgresql+asyncpg://", 1).replace(
+            "sslmode=", "ssl="
+        )
+    if uri.startswith("sqlite://"):
+        return uri.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return uri
+
+
+# For use from coroutines, so a slow DB doesn't block the event loop. See database/repositories.py
+if uri.startswith("postgresql://"):
+    ASYNC_DATABASE_ENGINE = create_async_engine(
+        get_async_uri(uri),
+        echo=False,
+        pool_size=constants.DB_POOL_SIZE,
+        max_overflow=constants.DB_MAX_OVERFLOW,
+        pool_timeout=constants.DB_POOL_TIMEOUT,
+        pool_recycle=constants.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+else:
+    ASYNC_DATABASE_ENGINE = create_async_engine(get_async_uri(uri), echo=False)
 Base = declarative_base()
 
 
@@ -22,6 +51,11 @@ class Verifieds(Base):
     permissions = Column(String)
     role_id_permissions = Column(String, primary_key=True)
 
+    __table_args__ = (
+        # Loading and deleting a server's roles, optionally for one Permission Category
+        Index("ix_verifieds_server_id_permissions", "server_id", "permissions"),
+    )
+
 
 # enum for the different permissions in Verifieds
 VERIFIED = "Verified"
@@ -40,6 +74,11 @@ class CustomCommands(Base):
     command_return = Column(String)
     image = Column(Boolean)  # Flag for whether or not we need to send an embed
 
+    __table_args__ = (
+        # Loading and deleting a server's commands
+        Index("ix_custom_commands_server_id_command_name", "server_id", "command_name"),
+    )
+
 
 class SheetTethers(Base):
     __tablename__ = "sheet_tethers"
@@ -49,6 +88,15 @@ class SheetTethers(Base):
     channel_or_cat_name = Column(String)
     sheet_link = Column(String)
 
+    __table_args__ = (
+        # Loading and deleting a server's tethers, and pruning them channel by channel
+        Index(
+            "ix_sheet_tethers_server_id_channel_or_cat_id",
+            "server_id",
+            "channel_or_cat_id",
+        ),
+    )
+
 
 class Prefixes(Base):
     __tablename__ = "prefixes"
@@ -57,4 +105,56 @@ class Prefixes(Base):
     prefix = Column(String)
 
 
+class TimezoneLocations(Base):
+    __tablename__ = "timezone_locations"
+    location = Column(
+        String, primary_key=True
+    )  # normalized location (lowercase, single spaces)
+    timezone_id = Column(String)  # IANA timezone id, e.g. America/New_York
+
+
+class ArchiveCheckpoints(Base):
+    __tablename__ = "archive_checkpoints"
+    channel_id = Column(BIGINT, primary_key=True)
+    server_id = Column(BIGINT)
+    channel_name = Column(String)
+    last_message_id = Column(BIGINT)  # newest message included in the last archive
+
+
+class ArchivedAttachments(Base):
+    __tablename__ = "archived_attachments"
+    channel_id = Column(BIGINT, primary_key=True)
+    sha256 = Column(String, primary_key=True)  # hash of the attachment's contents
+
+
+class MessageActivity(Base):
+    __tablename__ = "message_activity"
+    server_id = Column(BIGINT)
+    channel_id = Column(
+        BIGINT, primary_key=True
+    )  # threads count towards their parent channel
+    author_id = Column(BIGINT, primary_key=True)
+    bucket = Column(BIGINT, primary_key=True)  # unix time of the start of the hour
+    count = Column(Integer)
+    first_seen = Column(
+        BIGINT
+    )  # unix time of the first/last message counted in this row
+    last_seen = Column(BIGINT)
+
+
+class CacheChanges(Base):
+    # Written by triggers on DBs without LISTEN/NOTIFY (SQLite), and polled by database/cache_sync.py
+    __tablename__ = "cache_changes"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String)
+    op = Column(String)  # INSERT, UPDATE or DELETE
+    server_id = Column(BIGINT)
+    key = Column(String)  # primary key of the changed row
+    changed_at = Column(BIGINT)  # unix time
+
+
 Base.metadata.create_all(DATABASE_ENGINE)
+# create_all only adds indexes along with new tables, so add any missing ones to the tables we already have
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        index.create(DATABASE_ENGINE, checkfirst=True)
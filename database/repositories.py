@@ -0,0 +1,391 @@
+import constants
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from database import models
+
+"""
+Async queries for the tables the bot reads and writes while it's running (Prefixes, Verifieds, CustomCommands,
+SheetTethers, TimezoneLocations, ArchiveCheckpoints, MessageActivity...). They go through the async engine's
+connection pool, so a slow DB doesn't block the event loop.
+The rows they return are detached and can be kept around (e.g. in the caches).
+"""
+
+# Rows stay readable after the commit, so we can return them
+async_session = async_sessionmaker(models.ASYNC_DATABASE_ENGINE, expire_on_commit=False)
+
+
+def get_upsert():
+    """The engine's insert, which supports on_conflict_do_update (Postgres, otherwise SQLite)"""
+    if models.ASYNC_DATABASE_ENGINE.dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
+############
+# PREFIXES #
+############
+
+
+async def get_prefix(server_id: int) -> models.Prefixes:
+    async with async_session() as session:
+        return await session.get(models.Prefixes, server_id)
+
+
+async def add_prefix(server_id: int, server_name: str, prefix: str):
+    async with async_session() as session:
+        await session.execute(
+            insert(models.Prefixes).values(
+                server_id=server_id, server_name=server_name, prefix=prefix
+            )
+        )
+        await session.commit()
+
+
+async def set_prefix(server_id: int, prefix: str):
+    async with async_session() as session:
+        await session.execute(
+            update(models.Prefixes)
+            .where(models.Prefixes.server_id == server_id)
+            .values(prefix=prefix)
+        )
+        await session.commit()
+
+
+#############
+# VERIFIEDS #
+#############
+
+
+async def get_verified(role_id_permissions: str) -> models.Verifieds:
+    async with async_session() as session:
+        return await session.get(models.Verifieds, role_id_permissions)
+
+
+async def get_server_verifieds(server_id: int) -> list:
+    async with async_session() as session:
+        result = await session.scalars(
+            select(models.Verifieds).filter_by(server_id=server_id)
+        )
+        return list(result)
+
+
+async def add_verified(
+    server_id: int, server_name: str, role_id: int, role_name: str, permissions: str
+):
+    async with async_session() as session:
+        await session.execute(
+            insert(models.Verifieds).values(
+                role_id=role_id,
+                role_name=role_name,
+                server_id=server_id,
+                server_name=server_name,
+                permissions=permissions,
+                role_id_permissions=f"{role_id}_{permissions}",
+            )
+        )
+        await session.commit()
+
+
+async def remove_verified(server_id: int, role_id_permissions: str) -> bool:
+    """Returns whether there was such a role to remove"""
+    async with async_session() as session:
+        result = await session.execute(
+            delete(models.Verifieds).filter_by(
+                server_id=server_id, role_id_permissions=role_id_permissions
+            )
+        )
+        await session.commit()
+        return result.rowcount > 0
+
+
+###################
+# CUSTOM COMMANDS #
+###################
+
+
+async def get_custom_command(server_id_command: str) -> models.CustomCommands:
+    async with async_session() as session:
+        return await session.get(models.CustomCommands, server_id_command)
+
+
+async def find_custom_command(
+    server_id: int, command_name: str
+) -> models.CustomCommands:
+    """The server's command, or else the global one. None if neither exists"""
+    async with async_session() as session:
+        result = await session.get(models.CustomCommands, f"{server_id} {command_name}")
+        if result is None:
+            result = await session.scalar(
+                select(models.CustomCommands)
+                .where(
+                    models.CustomCommands.server_id_command.in_(
+                        [
+                            f"{constants.DB_GLOBAL_SERVER_ID} {command_name}",
+                            f"{constants.DB_GLOBAL} {command_name}",
+                        ]
+                    )
+                )
+                .limit(1)
+            )
+        return result
+
+
+async def get_server_custom_commands(server_id: int) -> list:
+    async with async_session() as session:
+        result = await session.scalars(
+            select(models.CustomCommands).filter_by(server_id=server_id)
+        )
+        return list(result)
+
+
+async def add_custom_command(
+    server_id: int,
+    server_name: str,
+    command_name: str,
+    command_return: str,
+    image: bool,
+):
+    async with async_session() as session:
+        await session.execute(
+            insert(models.CustomCommands).values(
+                server_id=server_id,
+                server_name=server_name,
+                server_id_command=f"{server_id} {command_name}",
+                command_name=command_name,
+                command_return=command_return,
+                image=image,
+            )
+        )
+        await session.commit()
+
+
+async def set_custom_command_return(server_id_command: str, command_return: str):
+    async with async_session() as session:
+        await session.execute(
+            update(models.CustomCommands)
+            .where(models.CustomCommands.server_id_command == server_id_command)
+            .values(command_return=command_return)
+        )
+        await session.commit()
+
+
+async def delete_custom_commands(server_id_commands: list):
+    async with async_session() as session:
+        await session.execute(
+            delete(models.CustomCommands).where(
+                models.CustomCommands.server_id_command.in_(server_id_commands)
+            )
+        )
+        await session.commit()
+
+
+#################
+# SHEET TETHERS #
+#################
+
+
+async def get_sheet_tethers(server_id: int = None) -> list:
+    """Every sheet tether, or just the server's"""
+    async with async_session() as session:
+        query = select(models.SheetTethers)
+        if server_id is not None:
+            query = query.filter_by(server_id=server_id)
+        return list(await session.scalars(query))
+
+
+async def set_sheet_tether(
+    server_id: int,
+    server_name: str,
+    channel_or_cat_id: int,
+    channel_or_cat_name: str,
+    sheet_link: str,
+):
+    """Tether the channel or category to the sheet, replacing any sheet it was tethered to"""
+    async with async_session() as session:
+        result = await session.get(models.SheetTethers, channel_or_cat_id)
+        # If there is already an entry, we just need to update it.
+        if result is not None:
+            result.sheet_link = sheet_link
+        # Otherwise, we need to create an entry
+        else:
+            await session.execute(
+                insert(models.SheetTethers).values(
+                    server_id=server_id,
+                    server_name=server_name,
+                    channel_or_cat_name=channel_or_cat_name,
+                    channel_or_cat_id=channel_or_cat_id,
+                    sheet_link=sheet_link,
+                )
+            )
+        await session.commit()
+
+
+async def delete_sheet_tethers(channel_or_cat_ids: list):
+    async with async_session() as session:
+        await session.execute(
+            delete(models.SheetTethers).where(
+                models.SheetTethers.channel_or_cat_id.in_(channel_or_cat_ids)
+            )
+        )
+        await session.commit()
+
+
+######################
+# TIMEZONE LOCATIONS #
+######################
+
+
+async def set_timezone_location(location: str, timezone_id: str):
+    """Remember the location's timezone, replacing any we had for it"""
+    stmt = get_upsert()(models.TimezoneLocations).values(
+        location=location, timezone_id=timezone_id
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["location"],
+        set_={"timezone_id": stmt.excluded.timezone_id},
+    )
+    async with async_session() as session:
+        await session.execute(stmt)
+        await session.commit()
+
+
+############
+# ARCHIVES #
+############
+
+
+async def get_archive_checkpoint(channel_id: int) -> tuple:
+    """
+    Where the last archive of the channel stopped.
+    :return: (id of the newest archived message or None, set of sha256 hashes of attachments already archived)
+    """
+    async with async_session() as session:
+        checkpoint = await session.get(models.ArchiveCheckpoints, channel_id)
+        hashes = set(
+            await session.scalars(
+                select(models.ArchivedAttachments.sha256).filter_by(
+                    channel_id=channel_id
+                )
+            )
+        )
+        return (checkpoint.last_message_id if checkpoint else None), hashes
+
+
+async def save_archive_checkpoint(
+    server_id: int,
+    channel_id: int,
+    channel_name: str,
+    last_message_id: int,
+    new_hashes: set,
+):
+    """Remember where this archive of the channel stopped, so the next incremental archive starts from there"""
+    async with async_session() as session:
+        checkpoint = await session.get(models.ArchiveCheckpoints, channel_id)
+        if checkpoint is None:
+            session.add(
+                models.ArchiveCheckpoints(
+                    channel_id=channel_id,
+                    server_id=server_id,
+                    channel_name=channel_name,
+                    last_message_id=last_message_id,
+                )
+            )
+        elif last_message_id is not None:
+            checkpoint.channel_name = channel_name
+            checkpoint.last_message_id = max(
+                checkpoint.last_message_id or 0, last_message_id
+            )
+        for sha256 in new_hashes:
+            await session.merge(
+                models.ArchivedAttachments(channel_id=channel_id, sha256=sha256)
+            )
+        await session.commit()
+
+
+####################
+# MESSAGE ACTIVITY #
+####################
+
+
+async def add_message_activity(rows: list):
+    """
+    Add the MessageActivity rows (dicts of its columns) to the DB. Rows which are already there get the counts
+    added, and keep the earliest first_seen and latest last_seen.
+    """
+    if not rows:
+        return
+    if models.ASYNC_DATABASE_ENGINE.dialect.name == "postgresql":
+        least, greatest = func.least, func.greatest
+    else:
+        # SQLite's min/max with several arguments return the smallest/largest of them
+        least, greatest = func.min, func.max
+    stmt = get_upsert()(models.MessageActivity).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["channel_id", "author_id", "bucket"],
+        set_={
+            "count": models.MessageActivity.count + stmt.excluded.count,
+            "first_seen": least(
+                models.MessageActivity.first_seen, stmt.excluded.first_seen
+            ),
+            "last_seen": greatest(
+                models.MessageActivity.last_seen, stmt.excluded.last_seen
+            ),
+        },
+    )
+    async with async_session() as session:
+        await session.execute(stmt)
+        await session.commit()
+
+
+async def get_first_seen(channel_id: int) -> int:
+    """Unix time of the oldest message we've counted in the channel, or None"""
+    async with async_session() as session:
+        return await session.scalar(
+            select(func.min(models.MessageActivity.first_seen)).filter_by(
+                channel_id=channel_id
+            )
+        )
+
+
+async def get_message_activity(channel_ids: list, since_bucket: int) -> list:
+    """
+    Message counts for the channels from the bucket onwards.
+    :return: list of (channel id, author id, message count, unix time of their last message)
+    """
+    async with async_session() as session:
+        result = await session.execute(
+            select(
+                models.MessageActivity.channel_id,
+                models.MessageActivity.author_id,
+                func.sum(models.MessageActivity.count),
+                func.max(models.MessageActivity.last_seen),
+            )
+            .where(
+                models.MessageActivity.channel_id.in_(channel_ids),
+                models.MessageActivity.bucket >= since_bucket,
+            )
+            .group_by(
+                models.MessageActivity.channel_id,
+                models.MessageActivity.author_id,
+            )
+        )
+        return [tuple(row) for row in result]
+
+
+###########
+# SERVERS #
+###########
+
+
+async def delete_server(server_id: int):
+    """Remove everything the bot stored for the server"""
+    async with async_session() as session:
+        for table in [
+            models.CustomCommands,
+            models.Prefixes,
+            models.Verifieds,
+            models.SheetTethers,
+        ]:
+            await session.execute(delete(table).filter_by(server_id=server_id))
+        await session.commit()
@@ -0,0 +1,19 @@
+##################
+#### ACTIVITY ####
+##################
+
+# Size (seconds) of the time buckets message counts are kept in
+BUCKET_SIZE = 3600
+# How often (seconds) counted messages are written to the database
+FLUSH_INTERVAL = 60
+# After this many flushes in a row fail, the unwritten counts are dropped rather than kept piling up
+MAX_FLUSH_FAILURES = 10
+# Max rows written to the database in one statement
+WRITE_BATCH_SIZE = 1000
+
+# Default/max window (hours) for ~activity
+DEFAULT_HOURS = 24
+MAX_HOURS = 24 * 30
+# Default/max number of days ~backfillactivity reads back
+DEFAULT_BACKFILL_DAYS = 14
+MAX_BACKFILL_DAYS = 90
@@ -0,0 +1,73 @@
+from database import repositories
+from modules.activity import activity_constants
+import constants
+import nextcord
+
+
+def is_human_message(msg: nextcord.Message) -> bool:
+    """Only count messages from humans (not bots), and not bot calls"""
+    return not msg.author.bot and not msg.content.startswith(
+        constants.DEFAULT_BOT_PREFIX
+    )
+
+
+def get_bucket(timestamp: float) -> int:
+    return int(timestamp // activity_constants.BUCKET_SIZE) * (
+        activity_constants.BUCKET_SIZE
+    )
+
+
+def record_message(counts: dict, server_id: int, channel_id: int, msg):
+    """
+    Count the message in counts, which maps (channel id, author id, bucket) -> [server id, count, first seen, last seen]
+    """
+    timestamp = int(msg.created_at.timestamp())
+    key = (channel_id, msg.author.id, get_bucket(timestamp))
+    row = counts.get(key)
+    if row is None:
+        counts[key] = [server_id, 1, timestamp, timestamp]
+    else:
+        row[1] += 1
+        row[2] = min(row[2], timestamp)
+        row[3] = max(row[3], timestamp)
+
+
+async def write_counts(counts: dict):
+    """Add the counts (see record_message) to the database"""
+    rows = [
+        {
+            "server_id": server_id,
+            "channel_id": channel_id,
+            "author_id": author_id,
+            "bucket": bucket,
+            "count": count,
+            "first_seen": first_seen,
+            "last_seen": last_seen,
+        }
+        for (channel_id, author_id, bucket), (
+            server_id,
+            count,
+            first_seen,
+            last_seen,
+        ) in counts.items()
+    ]
+    # Keep each statement well under the DB's limit on bound parameters
+    for i in range(0, len(rows), activity_constants.WRITE_BATCH_SIZE):
+        await repositories.add_message_activity(
+            rows[i : i + activity_constants.WRITE_BATCH_SIZE]
+        )
+
+
+async def get_first_seen(channel_id: int):
+    """Unix time of the oldest message we've counted in the channel, or None"""
+    return await repositories.get_first_seen(channel_id)
+
+
+async def get_activity(channel_ids: list, since: float) -> list:
+    """
+    Message counts for the channels since the given unix time (rounded down to the bucket).
+    :return: list of (channel id, author id, message count, unix time of their last message)
+    """
+    if not channel_ids:
+        return []
+    return await repositories.get_message_activity(channel_ids, get_bucket(since))
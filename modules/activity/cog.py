@@ -0,0 +1,271 @@
+import asyncio
+import datetime
+import nextcord
+import time
+from collections import Counter
+from nextcord.ext import commands
+from nextcord.ext.tasks import loop
+from modules.activity import activity_constants, activity_utils
+from utils import command_predicates, discord_utils, logging_utils
+
+"""
+Activity module. Keeps a running count of who's talking where, so activity summaries don't need to read channel histories.
+"""
+
+
+class ActivityCog(commands.Cog, name="Activity"):
+    """
+    Message activity per channel and per person
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.lock = asyncio.Lock()
+        # Counts not written to the DB yet. See activity_utils.record_message
+        self.pending = {}
+        # Flushes in a row which couldn't write to the DB
+        self.flush_failures = 0
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """When discord is connected"""
+        if not self.flush_activity.is_running():
+            self.flush_activity.start()
+
+    @commands.Cog.listener()
+    async def on_message(self, message: nextcord.Message):
+        if message.guild is None or not activity_utils.is_human_message(message):
+            return
+        # Threads count towards their parent channel
+        channel_id = getattr(message.channel, "parent_id", None) or message.channel.id
+        activity_utils.record_message(
+            self.pending, message.guild.id, channel_id, message
+        )
+
+    @loop(seconds=activity_constants.FLUSH_INTERVAL)
+    async def flush_activity(self):
+        """Function which runs periodically to write the counted messages to the DB"""
+        await self.flush()
+
+    async def flush(self):
+        """Write the pending counts to the DB. If that fails, they're kept for the next try"""
+        async with self.lock:
+            counts, self.pending = self.pending, {}
+            try:
+                await activity_utils.write_counts(counts)
+            except Exception as e:
+                self.flush_failures += 1
+                if self.flush_failures >= activity_constants.MAX_FLUSH_FAILURES:
+                    print(
+                        f"Couldn't write message activity {self.flush_failures} times in a row, "
+                        f"dropping {len(counts)} counts: {e}"
+                    )
+                    self.flush_failures = 0
+                    return
+                print(f"Couldn't write message activity, retrying next time: {e}")
+                # Put them back for the next try
+                for key, row in counts.items():
+                    pending_row = self.pending.get(key)
+                    if pending_row is None:
+                        self.pending[key] = row
+                    else:
+                        pending_row[1] += row[1]
+                        pending_row[2] = min(pending_row[2], row[2])
+                        pending_row[3] = max(pending_row[3], row[3])
+            else:
+                self.flush_failures = 0
+
+    async def get_categories(self, ctx, category_names: list) -> list:
+        """Find the categories, or the current one if none are given. Sends an error and returns None if we can't"""
+        embed = discord_utils.create_embed()
+        if not category_names:
+            currcat = ctx.message.channel.category
+            if currcat is None:
+                embed.add_field(
+                    name="Failed",
+                    value="You must call this command from a channel in a category, or specify category names.",
+                )
+                await discord_utils.send_message(ctx, embed)
+                return None
+            return [currcat]
+
+        categories = []
+        for cat_name in category_names:
+            cat = await discord_utils.find_category(ctx, cat_name)
+            if cat is None:
+                embed.add_field(
+                    name="Failed",
+                    value=f"I cannot find category `{cat_name}`. Perhaps check your spelling and try again.",
+                )
+                await discord_utils.send_message(ctx, embed)
+                return None
+            categories.append(cat)
+        return categories
+
+    @command_predicates.is_solver()
+    @commands.command(name="activity", aliases=["activitycat", "activitycategory"])
+    async def activity(self, ctx, *args):
+        """Summarise how many messages were sent in one or more categories over the last `hours` hours,
+        per channel and per person. `hours` caps off at 720 (30 days).
+        Only counts messages from humans (not bots). Thread messages count towards their channel.
+        Only knows about messages from when the bot started counting, see `~backfillactivity`.
+
+        Permission Category : Solver Roles only.
+        Usage: `~activity [category names] [hours]`
+        Usage: `~activity` (current category, last 24 hours)
+        Usage: `~activity 3` (current category, last 3 hours)
+        Usage: `~activity "Cat 1" "Cat 2" 48` (multiple categories, last 48 hours)
+        """
+        await logging_utils.log_command("activity", ctx.guild, ctx.channel, ctx.author)
+
+        hours = activity_constants.DEFAULT_HOURS
+        category_names = list(args)
+        if args:
+            # Check if last arg is an integer (hours)
+            try:
+                hours = int(args[-1])
+                category_names = list(args[:-1])
+            except ValueError:
+                pass
+        hours = max(1, min(hours, activity_constants.MAX_HOURS))
+
+        categories = await self.get_categories(ctx, category_names)
+        if categories is None:
+            return
+
+        # Include whatever was said since the last flush
+        await self.flush()
+        channels = {ch.id: ch for cat in categories for ch in cat.text_channels}
+        rows = await activity_utils.get_activity(
+            list(channels), time.time() - hours * 3600
+        )
+
+        channel_counts = Counter()
+        author_counts = Counter()
+        channel_last_seen = {}
+        for channel_id, author_id, count, last_seen in rows:
+            channel_counts[channel_id] += count
+            author_counts[author_id] += count
+            channel_last_seen[channel_id] = max(
+                channel_last_seen.get(channel_id, 0), last_seen
+            )
+
+        cat_names = ", ".join([f"`{cat.name}`" for cat in categories])
+        embed = discord_utils.create_embed()
+        embed.add_field(
+            name="Summary",
+            value=f"{sum(channel_counts.values())} human messages in the last {hours} hour{'s' if hours != 1 else ''} "
+            f"across {len(channels)} channels in {len(categories)} categor{'ies' if len(categories) > 1 else 'y'} ({cat_names}).",
+            inline=False,
+        )
+        if channel_counts:
+            embed.add_field(
+                name="By channel",
+                value="\n".join(
+                    f"- {channels[channel_id].mention}: {count} message{'s' if count != 1 else ''}, "
+                    f"last <t:{channel_last_seen[channel_id]}:R>"
+                    for channel_id, count in channel_counts.most_common()
+                ),
+                inline=False,
+            )
+            embed.add_field(
+                name="By author",
+                value="\n".join(
+                    f"- <@{author_id}>: {count} message{'s' if count != 1 else ''}"
+                    for author_id, count in author_counts.most_common()
+                ),
+                inline=False,
+            )
+        await discord_utils.send_message(ctx, embed)
+
+    @command_predicates.is_bot_owner_or_admin()
+    @commands.command(name="backfillactivity")
+    async def backfillactivity(self, ctx, *args):
+        """Count the older messages in one or more categories from their channel history, for channels
+        that existed before the bot started counting. Reads back at most `days` days (max 90).
+        Safe to run again: it only reads messages older than the ones already counted.
+        Thread messages are only counted from when the bot started counting.
+
+        Permission Category : Admin or Bot Owner Roles only.
+        Usage: `~backfillactivity [category names] [days]`
+        Usage: `~backfillactivity` (current category, last 14 days)
+        Usage: `~backfillactivity "Cat 1" "Cat 2" 30`
+        """
+        await logging_utils.log_command(
+            "backfillactivity", ctx.guild, ctx.channel, ctx.author
+        )
+
+        days = activity_constants.DEFAULT_BACKFILL_DAYS
+        category_names = list(args)
+        if args:
+            # Check if last arg is an integer (days)
+            try:
+                days = int(args[-1])
+                category_names = list(args[:-1])
+            except ValueError:
+                pass
+        days = max(1, min(days, activity_constants.MAX_BACKFILL_DAYS))
+
+        categories = await self.get_categories(ctx, category_names)
+        if categories is None:
+            return
+
+        start_embed = discord_utils.create_embed()
+        start_embed.add_field(
+            name="Backfill Started",
+            value=f"Counting up to {days} days of older messages in "
+            f"{', '.join([f'`{cat.name}`' for cat in categories])}. This may take a while.",
+            inline=False,
+        )
+        start_msgs = await discord_utils.send_message(ctx, start_embed)
+
+        # So every message already counted live has its first_seen in the DB
+        await self.flush()
+        oldest = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            days=days
+        )
+        total = 0
+        failed = []
+        for cat in categories:
+            for ch in cat.text_channels:
+                # Only read what's older than anything we've counted, so nothing is counted twice
+                first_seen = await activity_utils.get_first_seen(ch.id)
+                before = (
+                    datetime.datetime.fromtimestamp(first_seen, datetime.timezone.utc)
+                    if first_seen is not None
+                    else datetime.datetime.now(datetime.timezone.utc)
+                )
+                counts = {}
+                try:
+                    async for msg in ch.history(
+                        limit=None, before=before, after=oldest
+                    ):
+                        if activity_utils.is_human_message(msg):
+                            activity_utils.record_message(
+                                counts, ctx.guild.id, ch.id, msg
+                            )
+                            total += 1
+                except nextcord.Forbidden:
+                    failed.append(ch.mention)
+                    continue
+                await activity_utils.write_counts(counts)
+
+        for msg in start_msgs:
+            await msg.delete()
+        embed = discord_utils.create_embed()
+        embed.add_field(
+            name="Success",
+            value=f"Counted {total} older messages.",
+            inline=False,
+        )
+        if failed:
+            embed.add_field(
+                name="Failed",
+                value=f"I don't have access to {', '.join(failed)}.",
+                inline=False,
+            )
+        await discord_utils.send_message(ctx, embed)
+
+
+def setup(bot):
+    bot.add_cog(ActivityCog(bot))
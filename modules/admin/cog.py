@@ -1,11 +1,9 @@
 import nextcord
-import sqlalchemy
 import database
 import constants
 from nextcord.ext import commands
-from sqlalchemy.orm import Session
-from utils import discord_utils, logging_utils, command_predicates
-from database import models
+from utils import discord_utils, google_utils, logging_utils, command_predicates
+from database import models, repositories
 from typing import Union
 
 """
@@ -70,54 +68,43 @@ class AdminCog(commands.Cog, name="Admin"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        with Session(database.DATABASE_ENGINE) as session:
-            result = (
-                session.query(database.Verifieds)
-                .filter_by(
-                    role_id_permissions=f"{role_to_assign.id}_{role_permissions}"
-                )
-                .first()
+        result = await repositories.get_verified(
+            f"{role_to_assign.id}_{role_permissions}"
+        )
+        if result is not None:
+            embed = discord_utils.create_embed()
+            embed.add_field(
+                name="Failed",
+                value=f"Role {role_to_assign.mention} is already `{result.permissions}`!",
             )
-            if result is None:
-                stmt = sqlalchemy.insert(database.Verifieds).values(
-                    role_id=role_to_assign.id,
-                    role_name=role_to_assign.name,
-                    server_id=ctx.guild.id,
-                    server_name=ctx.guild.name,
-                    permissions=role_permissions,
-                    role_id_permissions=f"{role_to_assign.id}_{role_permissions}",
-                )
-                session.execute(stmt)
-                session.commit()
-            else:
-                embed = discord_utils.create_embed()
-                embed.add_field(
-                    name="Failed",
-                    value=f"Role {role_to_assign.mention} is already `{result.permissions}`!",
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
+            await discord_utils.send_message(ctx, embed)
+            return
+        await repositories.add_verified(
+            ctx.guild.id,
+            ctx.guild.name,
+            role_to_assign.id,
+            role_to_assign.name,
+            role_permissions,
+        )
 
         if role_permissions == models.VERIFIED:
-            if ctx.guild.id in database.VERIFIEDS:
-                database.VERIFIEDS[ctx.guild.id].append(role_to_assign.id)
-            else:
-                database.VERIFIEDS[ctx.guild.id] = [role_to_assign.id]
+            database.VERIFIEDS[ctx.guild.id] = database.VERIFIEDS.get(
+                ctx.guild.id, frozenset()
+            ) | {role_to_assign.id}
         elif role_permissions == models.TRUSTED:
-            if ctx.guild.id in database.TRUSTEDS:
-                database.TRUSTEDS[ctx.guild.id].append(role_to_assign.id)
-            else:
-                database.TRUSTEDS[ctx.guild.id] = [role_to_assign.id]
+            database.TRUSTEDS[ctx.guild.id] = database.TRUSTEDS.get(
+                ctx.guild.id, frozenset()
+            ) | {role_to_assign.id}
         elif role_permissions == models.SOLVER:
-            if ctx.guild.id in database.SOLVERS:
-                database.SOLVERS[ctx.guild.id].append(role_to_assign.id)
-            else:
-                database.SOLVERS[ctx.guild.id] = [role_to_assign.id]
+            database.SOLVERS[ctx.guild.id] = database.SOLVERS.get(
+                ctx.guild.id, frozenset()
+            ) | {role_to_assign.id}
         elif role_permissions == models.TESTER:
-            if ctx.guild.id in database.TESTERS:
-                database.TESTERS[ctx.guild.id].append(role_to_assign.id)
-            else:
-                database.TESTERS[ctx.guild.id] = [role_to_assign.id]
+            database.TESTERS[ctx.guild.id] = database.TESTERS.get(
+                ctx.guild.id, frozenset()
+            ) | {role_to_assign.id}
+
+        command_predicates.clear_permissions(ctx.guild.id)
 
         embed.add_field(
             name="Success",
@@ -218,54 +205,46 @@ class AdminCog(commands.Cog, name="Admin"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        with Session(database.DATABASE_ENGINE) as session:
-            result = (
-                session.query(database.Verifieds)
-                .filter_by(
-                    server_id=ctx.guild.id,
-                    role_id_permissions=f"{role_to_remove.id}_{role_permissions}",
-                )
-                .first()
+        if not await repositories.remove_verified(
+            ctx.guild.id, f"{role_to_remove.id}_{role_permissions}"
+        ):
+            embed.add_field(
+                name="Failed",
+                value=f"Role {role_to_remove.mention} is not `{role_permissions}` in `{ctx.guild.name}`",
             )
-            if result is None:
-                embed.add_field(
-                    name="Failed",
-                    value=f"Role {role_to_remove.mention} is not `{role_permissions}` in `{ctx.guild.name}`",
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
-            else:
-                session.delete(result)
-                session.commit()
+            await discord_utils.send_message(ctx, embed)
+            return
 
         if (
             role_permissions == models.VERIFIED
             and role_to_remove.id in database.VERIFIEDS[ctx.guild.id]
         ):
-            database.VERIFIEDS[ctx.guild.id].pop(
-                database.VERIFIEDS[ctx.guild.id].index(role_to_remove.id)
-            )
+            database.VERIFIEDS[ctx.guild.id] = database.VERIFIEDS[ctx.guild.id] - {
+                role_to_remove.id
+            }
         elif (
             role_permissions == models.TRUSTED
             and role_to_remove.id in database.TRUSTEDS[ctx.guild.id]
         ):
-            database.TRUSTEDS[ctx.guild.id].pop(
-                database.TRUSTEDS[ctx.guild.id].index(role_to_remove.id)
-            )
+            database.TRUSTEDS[ctx.guild.id] = database.TRUSTEDS[ctx.guild.id] - {
+                role_to_remove.id
+            }
         elif (
             role_permissions == models.SOLVER
             and role_to_remove.id in database.SOLVERS[ctx.guild.id]
         ):
-            database.SOLVERS[ctx.guild.id].pop(
-                database.SOLVERS[ctx.guild.id].index(role_to_remove.id)
-            )
+            database.SOLVERS[ctx.guild.id] = database.SOLVERS[ctx.guild.id] - {
+                role_to_remove.id
+            }
         elif (
             role_permissions == models.TESTER
             and role_to_remove.id in database.TESTERS[ctx.guild.id]
         ):
-            database.TESTERS[ctx.guild.id].pop(
-                database.TESTERS[ctx.guild.id].index(role_to_remove.id)
-            )
+            database.TESTERS[ctx.guild.id] = database.TESTERS[ctx.guild.id] - {
+                role_to_remove.id
+            }
+
+        command_predicates.clear_permissions(ctx.guild.id)
 
         embed.add_field(
             name="Success",
@@ -465,11 +444,7 @@ class AdminCog(commands.Cog, name="Admin"):
         await logging_utils.log_command("setprefix", ctx.guild, ctx.channel, ctx.author)
         embed = discord_utils.create_embed()
 
-        with Session(database.DATABASE_ENGINE) as session:
-            session.query(database.Prefixes).filter_by(server_id=ctx.guild.id).update(
-                {"prefix": prefix}
-            )
-            session.commit()
+        await repositories.set_prefix(ctx.guild.id, prefix)
         database.PREFIXES[ctx.message.guild.id] = prefix
         embed.add_field(
             name="Success",
@@ -497,68 +472,144 @@ class AdminCog(commands.Cog, name="Admin"):
         )
         embed = discord_utils.create_embed()
 
-        # Reset custom commands, verifieds, and prefixes for that server
-        database.CUSTOM_COMMANDS[ctx.guild.id] = {}
-        database.VERIFIEDS[ctx.guild.id] = []
-        database.TRUSTEDS[ctx.guild.id] = []
-        database.SOLVERS[ctx.guild.id] = []
-        database.TESTERS[ctx.guild.id] = []
-
-        with Session(database.DATABASE_ENGINE) as session:
-            custom_command_result = (
-                session.query(database.CustomCommands)
-                .filter_by(server_id=ctx.guild.id)
-                .all()
-            )
-            if custom_command_result is not None:
-                for custom_command in custom_command_result:
-                    # Populate custom command dict
-                    database.CUSTOM_COMMANDS[ctx.guild.id][
-                        custom_command.command_name.lower()
-                    ] = (custom_command.command_return, custom_command.image)
-            embed.add_field(
-                name="Success",
-                value="Successfully reloaded command cache.",
-                inline=False,
-            )
+        # Reset custom commands, verifieds, prefixes and sheet tethers for that server
+        database.CUSTOM_COMMANDS.drop_server(ctx.guild.id)
+        database.CUSTOM_COMMAND_MISSES.clear()
 
-            verified_result = (
-                session.query(database.Verifieds)
-                .filter_by(server_id=ctx.guild.id)
-                .all()
-            )
-            if verified_result is not None:
-                for verified in verified_result:
-                    if verified.permissions == models.VERIFIED:
-                        database.VERIFIEDS[ctx.guild.id].append(verified.role_id)
-                    elif verified.permissions == models.TRUSTED:
-                        database.TRUSTEDS[ctx.guild.id].append(verified.role_id)
-                    elif verified.permissions == models.SOLVER:
-                        database.SOLVERS[ctx.guild.id].append(verified.role_id)
-                    elif verified.permissions == models.TESTER:
-                        database.TESTERS[ctx.guild.id].append(verified.role_id)
+        embed.add_field(
+            name="Success",
+            value="Successfully reloaded command cache.",
+            inline=False,
+        )
+
+        verified_result = await repositories.get_server_verifieds(ctx.guild.id)
+        role_ids = {category: set() for category in database.VERIFIED_CATEGORIES}
+        for verified in verified_result:
+            if verified.permissions in role_ids:
+                role_ids[verified.permissions].add(verified.role_id)
+        database.VERIFIEDS[ctx.guild.id] = frozenset(role_ids[models.VERIFIED])
+        database.TRUSTEDS[ctx.guild.id] = frozenset(role_ids[models.TRUSTED])
+        database.SOLVERS[ctx.guild.id] = frozenset(role_ids[models.SOLVER])
+        database.TESTERS[ctx.guild.id] = frozenset(role_ids[models.TESTER])
+        command_predicates.clear_permissions(ctx.guild.id)
+        embed.add_field(
+            name="Success",
+            value="Successfully reloaded verifieds cache.",
+            inline=False,
+        )
+
+        prefix_result = await repositories.get_prefix(ctx.guild.id)
+        if prefix_result is not None:
+            database.PREFIXES[ctx.guild.id] = prefix_result.prefix
+        else:
+            database.PREFIXES[ctx.guild.id] = constants.DEFAULT_BOT_PREFIX
+        embed.add_field(
+            name="Success",
+            value="Successfully reloaded prefixes cache.",
+            inline=False,
+        )
+
+        tether_result = await repositories.get_sheet_tethers(ctx.guild.id)
+        for chan_or_cat_id, tether in list(database.SHEET_TETHERS.items()):
+            if tether.server_id == ctx.guild.id:
+                database.SHEET_TETHERS.pop(chan_or_cat_id)
+        for tether in tether_result:
+            database.SHEET_TETHERS[tether.channel_or_cat_id] = tether
+        embed.add_field(
+            name="Success",
+            value="Successfully reloaded sheet tethers cache.",
+            inline=False,
+        )
+        await discord_utils.send_message(ctx, embed)
+
+    ######################
+    # BOT STATS COMMANDS #
+    ######################
+
+    @command_predicates.is_bot_owner()
+    @commands.command(name="sheetsstats", aliases=["sheetstats", "gspreadstats"])
+    async def sheetsstats(self, ctx):
+        """Shows how busy the Google Sheets executor is, how long each kind of Sheets call takes, how well the spreadsheet cache is doing, and how the write scheduler is batching.
+
+        Permission Category : Bot Owner Roles only.
+        Usage: `~sheetsstats`
+        """
+        await logging_utils.log_command(
+            "sheetsstats", ctx.guild, ctx.channel, ctx.author
+        )
+        embed = discord_utils.create_embed()
+
+        stats = google_utils.ASYNC_GSPREAD_CLIENT.get_stats()
+        embed.add_field(
+            name="Executor",
+            value=f"Workers: `{stats['workers']}`\n"
+            f"Running: `{stats['running']}`\n"
+            f"Queued: `{stats['queued']}`",
+            inline=False,
+        )
+        embed.add_field(
+            name="Spreadsheet cache",
+            value=f"Cached spreadsheets: `{stats['cached_spreadsheets']}`\n"
+            f"Hits: `{stats['cache_hits']}`\n"
+            f"Misses: `{stats['cache_misses']}`",
+            inline=False,
+        )
+        writes = stats["writes"]
+        embed.add_field(
+            name="Write scheduler",
+            value=f"Batch updates submitted: `{writes['payloads']}`\n"
+            f"batchUpdate calls sent: `{writes['batch_calls']}`\n"
+            f"Merge ratio: `{writes['merge_ratio']:.2f}`\n"
+            f"Avg quota wait: `{writes['avg_wait'] * 1000:.0f}ms`\n"
+            f"Retries (429/503): `{writes['retries']}`",
+            inline=False,
+        )
+        if stats["calls"]:
+            call_lines = [
+                f"`{name}` - {call['count']} calls ({call['errors']} errors), "
+                f"avg {call['avg'] * 1000:.0f}ms, max {call['max'] * 1000:.0f}ms, "
+                f"avg wait {call['avg_wait'] * 1000:.0f}ms"
+                for name, call in sorted(
+                    stats["calls"].items(), key=lambda item: -item[1]["count"]
+                )
+            ]
             embed.add_field(
-                name="Success",
-                value="Successfully reloaded verifieds cache.",
+                name="Calls",
+                value="\n".join(call_lines),
                 inline=False,
             )
-
-            prefix_result = (
-                session.query(database.Prefixes)
-                .filter_by(server_id=ctx.guild.id)
-                .first()
-            )
-            if prefix_result is not None:
-                database.PREFIXES[ctx.guild.id] = prefix_result.prefix
-            else:
-                database.PREFIXES[ctx.guild.id] = constants.DEFAULT_BOT_PREFIX
+        else:
             embed.add_field(
-                name="Success",
-                value="Successfully reloaded prefixes cache.",
+                name="Calls",
+                value="No Sheets calls have been made yet.",
                 inline=False,
             )
         await discord_utils.send_message(ctx, embed)
 
+    @command_predicates.is_bot_owner()
+    @commands.command(name="cachestats", aliases=["ccstats", "customcommandstats"])
+    async def cachestats(self, ctx):
+        """Shows how many custom commands are cached, and roughly how much memory they take up.
+
+        Permission Category : Bot Owner Roles only.
+        Usage: `~cachestats`
+        """
+        await logging_utils.log_command(
+            "cachestats", ctx.guild, ctx.channel, ctx.author
+        )
+        embed = discord_utils.create_embed()
+
+        stats = database.CUSTOM_COMMANDS.get_stats()
+        embed.add_field(
+            name="Custom command cache",
+            value=f"Servers cached: `{stats['servers']}` (max `{constants.CUSTOM_COMMAND_CACHE_SERVERS}`)\n"
+            f"Server commands: `{stats['server_commands']}`\n"
+            f"Global commands: `{stats['global_commands']}`\n"
+            f"Memory: `{stats['bytes'] / 1024:.1f} KB`",
+            inline=False,
+        )
+        await discord_utils.send_message(ctx, embed)
+
 
 def setup(bot):
     bot.add_cog(AdminCog(bot))
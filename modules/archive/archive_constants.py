@@ -6,3 +6,9 @@ ARCHIVE = "archive"
 IMAGES = "images"
 TEXT_LOG_PATH = "text_log.txt"
 THREADS = "threads"
+# How many channels we archive at once, across all archive commands
+CHANNEL_CONCURRENCY = 4
+# How many attachments we download at once while archiving a channel
+DOWNLOAD_CONCURRENCY = 8
+# How often (seconds) we update the progress message while archiving
+PROGRESS_INTERVAL = 10
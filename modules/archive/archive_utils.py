@@ -1,7 +1,17 @@
+from database import repositories
+from datetime import datetime
 from modules.archive import archive_constants
 from utils import discord_utils
+import aiohttp
+import asyncio
+import constants
+import hashlib
+import nextcord
 import os
 import shutil
+import tempfile
+import time
+import zipfile
 
 
 def get_delay_embed():
@@ -16,8 +26,199 @@ def get_delay_embed():
 
 
 def reset_archive_dir():
-    # Remove the archive directory and remake
+    # Remove the archive directory (and any workspaces left behind by a crash) and remake
     if os.path.exists(archive_constants.ARCHIVE):
         shutil.rmtree(archive_constants.ARCHIVE)
     os.mkdir(archive_constants.ARCHIVE)
-    os.mkdir(os.path.join(archive_constants.ARCHIVE, archive_constants.IMAGES))
+
+
+async def get_checkpoint(channel_id: int) -> tuple:
+    """
+    Where the last archive of the channel stopped.
+    :return: (id of the newest archived message or None, set of sha256 hashes of attachments already archived)
+    """
+    return await repositories.get_archive_checkpoint(channel_id)
+
+
+async def save_checkpoint(channel, last_message_id: int, new_hashes: set):
+    """Remember where this archive of the channel stopped, so the next incremental archive starts from there"""
+    await repositories.save_archive_checkpoint(
+        channel.guild.id, channel.id, channel.name, last_message_id, new_hashes
+    )
+
+
+def create_workspace(name: str) -> str:
+    """Make a fresh scratch directory for archiving one channel, so concurrent archives can't clash"""
+    os.makedirs(archive_constants.ARCHIVE, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{name}_", dir=archive_constants.ARCHIVE)
+
+
+def remove_workspace(workspace: str):
+    shutil.rmtree(workspace, ignore_errors=True)
+
+
+class ChannelArchiver:
+    """
+    Streams a channel's archive straight into a zip while we walk its history.
+
+    Attachments are downloaded concurrently (at most DOWNLOAD_CONCURRENCY at a time, which also bounds
+    how many are held in memory) and written into the zip as soon as they arrive, so there's no second
+    pass over a scratch directory at the end.
+
+    Attachments whose contents hash to something in known_hashes (already archived, or already in this zip)
+    are left out of the zip. The chat log still names them.
+    """
+
+    def __init__(
+        self,
+        workspace: str,
+        zip_path: str,
+        compression: int,
+        status_msg: nextcord.Message = None,
+        name: str = None,
+        known_hashes: set = None,
+    ):
+        self.workspace = workspace
+        self.zip_path = zip_path
+        self.zf = zipfile.ZipFile(zip_path, mode="w")
+        self.compression = compression
+        # zipfile can only write one entry at a time
+        self.zip_lock = asyncio.Lock()
+        self.download_slots = asyncio.Semaphore(archive_constants.DOWNLOAD_CONCURRENCY)
+        self.downloads = set()
+        # Names already used in the zip, so duplicate filenames get renamed instead of overwritten
+        self.used_names = set()
+        self.known_hashes = set(known_hashes or ())
+        # Hashes of the attachments this archive added, and the newest message it saw (for checkpoints)
+        self.new_hashes = set()
+        self.last_message_id = None
+
+        # Progress reporting
+        self.status_msg = status_msg
+        self.name = name or os.path.basename(zip_path)
+        self.started_at = time.monotonic()
+        self.last_report = self.started_at
+        self.messages = 0
+        self.attachments = 0
+        self.failed_attachments = 0
+        self.skipped_attachments = 0
+        self.bytes_downloaded = 0
+
+    def _unique_name(self, filename: str) -> str:
+        """img.png would become img (1).png if we already have an img.png"""
+        original_name = os.path.join(
+            archive_constants.ARCHIVE, archive_constants.IMAGES, filename
+        )
+        root, ext = os.path.splitext(original_name)
+        proposed_name = original_name
+        dupe_counter = 1
+        while proposed_name in self.used_names:
+            proposed_name = f"{root} ({dupe_counter}){ext}"
+            dupe_counter += 1
+        self.used_names.add(proposed_name)
+        return proposed_name
+
+    async def add_attachment(self, attachment: nextcord.Attachment):
+        """Start downloading the attachment into the zip. Waits only if we're already at DOWNLOAD_CONCURRENCY"""
+        arcname = self._unique_name(attachment.filename)
+        await self.download_slots.acquire()
+        download = asyncio.ensure_future(self._download(attachment, arcname))
+        self.downloads.add(download)
+        download.add_done_callback(self.downloads.discard)
+
+    async def _download(self, attachment: nextcord.Attachment, arcname: str):
+        try:
+            try:
+                data = await attachment.read()
+            except (
+                nextcord.HTTPException,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                OSError,
+            ):
+                # Deleted, unavailable or the connection dropped. The chat log still has the filename
+                self.failed_attachments += 1
+                return
+            self.bytes_downloaded += len(data)
+            sha256 = hashlib.sha256(data).hexdigest()
+            if sha256 in self.known_hashes:
+                self.skipped_attachments += 1
+                return
+            self.known_hashes.add(sha256)
+            self.new_hashes.add(sha256)
+            async with self.zip_lock:
+                try:
+                    await asyncio.to_thread(
+                        self.zf.writestr, arcname, data, compress_type=self.compression
+                    )
+                except OSError:
+                    # e.g. the disk filled up. Not archived, so don't remember its hash either
+                    self.known_hashes.discard(sha256)
+                    self.new_hashes.discard(sha256)
+                    self.failed_attachments += 1
+                    return
+            self.attachments += 1
+        except Exception as e:
+            # Nobody awaits a finished download, so count and log anything unexpected rather than lose it
+            self.failed_attachments += 1
+            print(f"Couldn't archive attachment {attachment.filename}: {e}")
+        finally:
+            self.download_slots.release()
+
+    async def add_file(self, path: str):
+        """Add a file we wrote ourselves in the workspace (e.g. a chat log) to the zip"""
+        arcname = os.path.join(
+            archive_constants.ARCHIVE, os.path.relpath(path, self.workspace)
+        )
+        async with self.zip_lock:
+            await asyncio.to_thread(
+                self.zf.write, path, arcname, compress_type=self.compression
+            )
+
+    async def close(self) -> int:
+        """Wait for the remaining downloads and finish the zip. Returns the size of the zip"""
+        try:
+            await asyncio.gather(*self.downloads)
+        finally:
+            self.abort()
+        print(
+            f"[ {datetime.now().strftime('%m-%d-%Y, %H:%M:%S')} ] Archived {self.name}: "
+            f"{self.get_progress()}"
+        )
+        return os.path.getsize(self.zip_path)
+
+    def abort(self):
+        """Stop any downloads still running and close the zip"""
+        for download in self.downloads:
+            download.cancel()
+        self.zf.close()
+
+    def get_progress(self) -> str:
+        elapsed = time.monotonic() - self.started_at
+        megabytes = self.bytes_downloaded / constants.BYTES_TO_MEGABYTES
+        return (
+            f"{self.messages} messages, {self.attachments} attachments "
+            f"({megabytes:.2f}MB, {self.skipped_attachments} already archived, "
+            f"{self.failed_attachments} failed) in {elapsed:.0f}s "
+            f"({megabytes / max(elapsed, 1):.2f}MB/s)"
+        )
+
+    async def report_progress(self, force: bool = False):
+        """Update the status message, at most once every PROGRESS_INTERVAL seconds"""
+        now = time.monotonic()
+        if self.status_msg is None or (
+            not force and now - self.last_report < archive_constants.PROGRESS_INTERVAL
+        ):
+            return
+        self.last_report = now
+        embed = discord_utils.create_embed()
+        embed.add_field(
+            name=f"Archiving {self.name}",
+            value=self.get_progress(),
+            inline=False,
+        )
+        try:
+            await self.status_msg.edit(embed=embed)
+        except nextcord.HTTPException:
+            # Progress is best effort, don't fail the archive over it
+            pass
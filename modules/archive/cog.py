@@ -26,12 +26,15 @@ class ArchiveCog(commands.Cog, name="Archive"):
     def __init__(self, bot):
         self.bot = bot
         self.compression = zipfile.ZIP_DEFLATED
-        self.lock = asyncio.Lock()
+        # Each channel is archived in its own workspace, so several can run at once
+        self.channel_slots = asyncio.Semaphore(archive_constants.CHANNEL_CONCURRENCY)
 
         archive_utils.reset_archive_dir()
 
     @staticmethod
-    async def archive_message(f: TextIO, msg: nextcord.Message):
+    async def archive_message(
+        f: TextIO, msg: nextcord.Message, archiver: archive_utils.ChannelArchiver
+    ):
         f.write(
             f"[ {msg.created_at.strftime('%m-%d-%Y, %H:%M:%S')} ] "
             f"{msg.author.display_name.rjust(25, ' ')}: "
@@ -39,39 +42,22 @@ class ArchiveCog(commands.Cog, name="Archive"):
         )
         for attachment in msg.attachments:
             f.write(f" {attachment.filename}")
-            # change duplicate filenames
-            # img.png would become img (1).png
-            original_path = os.path.join(
-                archive_constants.ARCHIVE,
-                archive_constants.IMAGES,
-                attachment.filename,
-            )
-            proposed_path = original_path
-            dupe_counter = 1
-            while os.path.exists(proposed_path):
-                proposed_path = (
-                    original_path.split(".")[0]
-                    + f" ({dupe_counter})."
-                    + original_path.split(".")[1]
-                )
-                dupe_counter += 1
-            # The discord filenames can get too long and throw an OSError
-            try:
-                await attachment.save(proposed_path)
-            except OSError:
-                await attachment.save(
-                    f"path_too_long_{dupe_counter}.{original_path.split('.')[1]}"
-                )
+            # Downloads in the background, straight into the zip
+            await archiver.add_attachment(attachment)
         # Important: Write the newline after each comment is done
         f.write("\n")
+        archiver.messages += 1
+        await archiver.report_progress()
 
     @staticmethod
-    async def archive_thread(f: TextIO, thread: nextcord.Thread) -> int:
+    async def archive_thread(
+        f: TextIO, thread: nextcord.Thread, archiver: archive_utils.ChannelArchiver
+    ) -> int:
         thread_txt_size = 0
         f.write(f"[  {thread.id} ] {'THREAD'.rjust(25, ' ')}: ")
         f.write(thread.name + "\n")
         thread_dir = os.path.join(
-            archive_constants.ARCHIVE,
+            archiver.workspace,
             f"{thread.parent.name}_{archive_constants.THREADS}",
         )
         # The thread "name" is by default the original message content. Slugify and truncate if necessary
@@ -87,64 +73,99 @@ class ArchiveCog(commands.Cog, name="Archive"):
         thread_log_path = os.path.join(thread_dir, norm_thread_name + ".txt")
         with open(thread_log_path, "w") as thread_f:
             async for t_msg in thread.history(limit=None, oldest_first=True):
-                await ArchiveCog.archive_message(thread_f, t_msg)
-            thread_txt_size += f.tell()
+                await ArchiveCog.archive_message(thread_f, t_msg, archiver)
+            thread_txt_size += thread_f.tell()
+        await archiver.add_file(thread_log_path)
 
         return thread_txt_size
 
     async def archive_one_channel(
         self,
         channel: Union[nextcord.TextChannel, nextcord.ForumChannel, nextcord.Thread],
-    ) -> Tuple[nextcord.File, int, nextcord.File, int]:
-        """Download a channel's history"""
+        workspace: str,
+        status_msg: nextcord.Message = None,
+        after: int = None,
+        known_hashes: set = None,
+    ) -> Tuple[nextcord.File, int, nextcord.File, int, archive_utils.ChannelArchiver]:
+        """
+        Download a channel's history into the workspace. Progress is shown on status_msg (if given)
+        If after (a message id) is given, only messages newer than that are archived (forums are always archived in full),
+        and attachments in known_hashes are left out of the zip.
+        """
         # Write the chat log. Replace attachments with their filename (for easy reference)
         text_log_path = os.path.join(
-            archive_constants.ARCHIVE,
+            workspace,
             channel.name + "_" + archive_constants.TEXT_LOG_PATH,
         )
+        ZIP_FILENAME = os.path.join(workspace, channel.name + "_archive.zip")
+        # Attachments and thread logs go into the zip as we go, the chat log goes in once it's complete
+        archiver = archive_utils.ChannelArchiver(
+            workspace,
+            ZIP_FILENAME,
+            self.compression,
+            status_msg,
+            f"#{channel.name}",
+            known_hashes,
+        )
         total_thread_txt_size = 0
-        with open(text_log_path, "w") as f:
-            if hasattr(channel, "history"):
-                channel = cast(nextcord.TextChannel | nextcord.Thread, channel)
-                async for msg in channel.history(limit=None, oldest_first=True):
-                    await self.archive_message(f, msg)
-                    # Threads are attached to normal messages
-                    if msg.flags.has_thread and msg.thread:
+        try:
+            with open(text_log_path, "w") as f:
+                if hasattr(channel, "history"):
+                    channel = cast(nextcord.TextChannel | nextcord.Thread, channel)
+                    if after is not None:
+                        f.write(
+                            f"Messages after "
+                            f"{nextcord.utils.snowflake_time(after).strftime('%m-%d-%Y, %H:%M:%S')} "
+                            f"(the previous archive)\n"
+                        )
+                    async for msg in channel.history(
+                        limit=None,
+                        oldest_first=True,
+                        after=nextcord.Object(id=after) if after is not None else None,
+                    ):
+                        await self.archive_message(f, msg, archiver)
+                        archiver.last_message_id = msg.id
+                        # Threads are attached to normal messages
+                        if msg.flags.has_thread and msg.thread:
+                            total_thread_txt_size += await self.archive_thread(
+                                f, msg.thread, archiver
+                            )
+
+                elif channel.type == nextcord.ChannelType.forum:
+                    channel = cast(nextcord.ForumChannel, channel)
+                    for thread in channel.threads:
                         total_thread_txt_size += await self.archive_thread(
-                            f, msg.thread
+                            f, thread, archiver
+                        )
+                    async for thread in channel.archived_threads(limit=None):
+                        total_thread_txt_size += await self.archive_thread(
+                            f, thread, archiver
                         )
 
-            elif channel.type == nextcord.ChannelType.forum:
-                channel = cast(nextcord.ForumChannel, channel)
-                for thread in channel.threads:
-                    total_thread_txt_size += await self.archive_thread(f, thread)
-                async for thread in channel.archived_threads(limit=None):
-                    total_thread_txt_size += await self.archive_thread(f, thread)
-
-            text_file_size = f.tell()
-
-        ZIP_FILENAME = os.path.join(
-            archive_constants.ARCHIVE, channel.name + "_archive.zip"
-        )
-        # Create a zipfile and then walk through all the saved chatlogs and images, and zip em up
-        with zipfile.ZipFile(ZIP_FILENAME, mode="w") as zf:
-            for root, directories, files in os.walk(archive_constants.ARCHIVE):
-                for filename in files:
-                    if filename == ZIP_FILENAME.split("/")[-1]:  # Don't include self
-                        continue
-                    zf.write(
-                        os.path.join(root, filename), compress_type=self.compression
-                    )
-            zf_file_size = zf.fp.tell()
+                text_file_size = f.tell()
+            await archiver.add_file(text_log_path)
+        except BaseException:
+            archiver.abort()
+            raise
+        zf_file_size = await archiver.close()
+        await archiver.report_progress(force=True)
         return (
             nextcord.File(ZIP_FILENAME),
             zf_file_size,
             nextcord.File(text_log_path),
             text_file_size + total_thread_txt_size,
+            archiver,
         )
 
     def get_file_and_embed(
-        self, channel, filesize_limit, zip_file, zip_file_size, textfile, textfile_size
+        self,
+        channel,
+        workspace,
+        filesize_limit,
+        zip_file,
+        zip_file_size,
+        textfile,
+        textfile_size,
     ):
         """Check if zipfile and textfile can be sent or not, create embed with message"""
         embed = discord_utils.create_embed()
@@ -171,97 +192,58 @@ class ArchiveCog(commands.Cog, name="Archive"):
                     f"`{(zip_file_size / constants.BYTES_TO_MEGABYTES):.2f}MB`. I'll only be able to send you the chat log.",
                     inline=False,
                 )
-                ZIP_FILENAME = os.path.join(
-                    archive_constants.ARCHIVE, channel.name + "_archive.zip"
-                )
+                ZIP_FILENAME = os.path.join(workspace, channel.name + "_archive.zip")
                 with zipfile.ZipFile(ZIP_FILENAME, mode="w") as zf:
+                    text_log_name = channel.name + "_" + archive_constants.TEXT_LOG_PATH
                     zf.write(
-                        os.path.join(
-                            archive_constants.ARCHIVE,
-                            channel.name + "_" + archive_constants.TEXT_LOG_PATH,
-                        ),
+                        os.path.join(workspace, text_log_name),
+                        os.path.join(archive_constants.ARCHIVE, text_log_name),
                         compress_type=self.compression,
                     )
 
                     thread_dir = Path(
-                        archive_constants.ARCHIVE,
+                        workspace,
                         f"{channel.name}_{archive_constants.THREADS}",
                     )
 
                     # Glob only succeeds if thread_dir exists
                     for thread_file in thread_dir.glob("*.txt"):
-                        zf.write(thread_file, compress_type=self.compression)
+                        zf.write(
+                            thread_file,
+                            os.path.join(
+                                archive_constants.ARCHIVE,
+                                thread_file.relative_to(workspace),
+                            ),
+                            compress_type=self.compression,
+                        )
                 file = zip_file
         else:
             file = zip_file
             embed = None
         return file, embed
 
-    @command_predicates.is_verified()
-    @commands.command(name="archivechannel", aliases=["archivechan", "archivethread"])
-    async def archivechannel(self, ctx, *args: Union[nextcord.TextChannel, str]):
-        """Command to download channel's history
-
-        Permission Category : Verified Roles only.
-        Usage: `~archivechannel #channel`
-        Usage: `~archivechannel #channel1 "channel2"`
+    async def archive_and_send(self, ctx, channel, incremental: bool = False):
         """
-        await logging_utils.log_command(
-            "archivechannel", ctx.guild, ctx.channel, ctx.author
-        )
-        embed = discord_utils.create_embed()
-
-        # Check if the user supplied a channel
-        if len(args) < 1:
-            # No arguments provided
-            embed = discord_utils.create_no_argument_embed("channel")
-            await discord_utils.send_message(ctx, embed)
-            return
-        # If we don't have the lock, let the user know it may take a while.
-        msg = None
-
-        for channelname in args:
-            if self.lock.locked():
-                embed = archive_utils.get_delay_embed()
-                msgs = await discord_utils.send_message(ctx, embed)
-                msg = msgs[0]
-            # LOCK EVERYTHING
-            async with self.lock:
-                # If we sent a message about being delayed bc of lock, we can delete that now.
-                if msg:
-                    await msg.delete()
-                    msg = None
-                archive_utils.reset_archive_dir()
-                if isinstance(channelname, nextcord.TextChannel):
-                    channel = channelname
-                else:
-                    channel = await discord_utils.find_chan_or_thread(ctx, channelname)
-                    if channel is None:
-                        embed.add_field(
-                            name="ERROR: Cannot find channel",
-                            value=f"Sorry, I cannot find a channel with name {channelname}. Try mentioning the channel (e.g. `#{channelname}`)",
-                            inline=False,
-                        )
-                        await discord_utils.send_message(ctx, embed)
-                        return
-                    if channel.type.name not in [
-                        "text",
-                        "public_thread",
-                        "private_thread",
-                        "forum",
-                    ]:
-                        embed.add_field(
-                            name="ERROR: Cannot archive non-text channels",
-                            value=f"Sorry! I can only archive text channels, but "
-                            f"{channel} is a {channel.type} channel.",
-                            inline=False,
-                        )
-                        await discord_utils.send_message(ctx, embed)
-                        return
-                # If we've gotten to this point, we know we have a channel so we should probably let the user know.
-                start_embed = await self.get_start_embed(channel)
-                msgs = await discord_utils.send_message(ctx, start_embed)
-                msg = msgs[0]
+        Archive one channel in its own workspace and send the result.
+        At most CHANNEL_CONCURRENCY of these run at once (across all commands), the rest wait their turn.
+        If incremental, only what's new since the channel's last archive is included.
+        Either way, we save a checkpoint for the next incremental archive.
+        """
+        after, known_hashes = None, set()
+        if incremental:
+            after, known_hashes = await archive_utils.get_checkpoint(channel.id)
+        async with self.channel_slots:
+            workspace = archive_utils.create_workspace(channel.name)
+            status_msg = None
+            zip_file, textfile = None, None
+            try:
+                embed = discord_utils.create_embed()
+                embed.add_field(
+                    name=f"Archiving #{channel.name}",
+                    value="Starting...",
+                    inline=False,
+                )
+                status_msg = await ctx.send(embed=embed)
                 try:
                     # zipfile, textfile
                     (
@@ -269,19 +251,33 @@ class ArchiveCog(commands.Cog, name="Archive"):
                         zip_file_size,
                         textfile,
                         textfile_size,
-                    ) = await self.archive_one_channel(channel)
+                        archiver,
+                    ) = await self.archive_one_channel(
+                        channel, workspace, status_msg, after, known_hashes
+                    )
                 except nextcord.errors.Forbidden:
+                    embed = discord_utils.create_embed()
                     embed.add_field(
                         name="ERROR: No access",
-                        value=f"Sorry! I don't have access to {channel}. You'll need "
+                        value=f"Sorry! I don't have access to {channel.mention}. You'll need "
                         f"to give me permission to view the channel if you want "
                         f"to archive it",
                         inline=False,
                     )
                     await discord_utils.send_message(ctx, embed)
                     return
+                if after is not None and archiver.messages == 0:
+                    embed = discord_utils.create_embed()
+                    embed.add_field(
+                        name="Nothing New",
+                        value=f"There's nothing new in {channel.mention} since it was last archived.",
+                        inline=False,
+                    )
+                    await discord_utils.send_message(ctx, embed)
+                    return
                 file, embed = self.get_file_and_embed(
                     channel,
+                    workspace,
                     ctx.guild.filesize_limit * 0 + constants.HARDCODED_FILE_SIZE,
                     zip_file,
                     zip_file_size,
@@ -292,20 +288,116 @@ class ArchiveCog(commands.Cog, name="Archive"):
                 # So adding this try/catch for runtime to catch this. I don't think it's a deterministic error
                 try:
                     await ctx.send(file=file, embed=embed)
+                    # Forums have no history of their own, so there's nothing to resume from.
+                    # If the attachments were too big to send (embed is the warning), keep the old checkpoint,
+                    # so the next incremental archive picks those messages and their attachments up again
+                    if (
+                        hasattr(channel, "history")
+                        and file is not None
+                        and embed is None
+                    ):
+                        await archive_utils.save_checkpoint(
+                            channel, archiver.last_message_id, archiver.new_hashes
+                        )
                 except RuntimeError:
+                    embed = discord_utils.create_embed()
                     embed.add_field(
                         name="ERROR: Failed to send archive",
                         value=f"Sorry! I had trouble sending you the archived file for "
-                        f"{channel.mention}. Please try again later, and let kev know if this "
-                        f"issue persists",
+                        f"{channel.mention}. Please try again later with {ctx.prefix}archivechannel, "
+                        f"and let kev know if this issue persists",
+                        inline=False,
+                    )
+                    await discord_utils.send_message(ctx, embed)
+            finally:
+                if status_msg:
+                    try:
+                        await status_msg.delete()
+                    except nextcord.HTTPException:
+                        pass
+                for file in (zip_file, textfile):
+                    if file:
+                        file.close()
+                # Clean up this channel's workspace
+                archive_utils.remove_workspace(workspace)
+
+    async def archive_channels(self, ctx, args, incremental: bool = False):
+        """Find each of the channels the user gave us and archive them one by one"""
+        embed = discord_utils.create_embed()
+
+        # Check if the user supplied a channel
+        if len(args) < 1:
+            # No arguments provided
+            embed = discord_utils.create_no_argument_embed("channel")
+            await discord_utils.send_message(ctx, embed)
+            return
+
+        for channelname in args:
+            if isinstance(channelname, nextcord.TextChannel):
+                channel = channelname
+            else:
+                channel = await discord_utils.find_chan_or_thread(ctx, channelname)
+                if channel is None:
+                    embed.add_field(
+                        name="ERROR: Cannot find channel",
+                        value=f"Sorry, I cannot find a channel with name {channelname}. Try mentioning the channel (e.g. `#{channelname}`)",
                         inline=False,
                     )
                     await discord_utils.send_message(ctx, embed)
-                if msg:
-                    await msg.delete()
-                    msg = None
-            # Clean up the archive dir
-            archive_utils.reset_archive_dir()
+                    return
+                if channel.type.name not in [
+                    "text",
+                    "public_thread",
+                    "private_thread",
+                    "forum",
+                ]:
+                    embed.add_field(
+                        name="ERROR: Cannot archive non-text channels",
+                        value=f"Sorry! I can only archive text channels, but "
+                        f"{channel} is a {channel.type} channel.",
+                        inline=False,
+                    )
+                    await discord_utils.send_message(ctx, embed)
+                    return
+            # If all the archive slots are taken, let the user know it may take a while.
+            if self.channel_slots.locked():
+                await discord_utils.send_message(ctx, archive_utils.get_delay_embed())
+            # If we've gotten to this point, we know we have a channel so we should probably let the user know.
+            start_embed = await self.get_start_embed(channel)
+            msgs = await discord_utils.send_message(ctx, start_embed)
+            await self.archive_and_send(ctx, channel, incremental)
+            for msg in msgs:
+                await msg.delete()
+
+    @command_predicates.is_verified()
+    @commands.command(name="archivechannel", aliases=["archivechan", "archivethread"])
+    async def archivechannel(self, ctx, *args: Union[nextcord.TextChannel, str]):
+        """Command to download channel's history
+
+        Permission Category : Verified Roles only.
+        Usage: `~archivechannel #channel`
+        Usage: `~archivechannel #channel1 "channel2"`
+        """
+        await logging_utils.log_command(
+            "archivechannel", ctx.guild, ctx.channel, ctx.author
+        )
+        await self.archive_channels(ctx, args)
+
+    @command_predicates.is_verified()
+    @commands.command(name="archiveupdate", aliases=["archivenew", "archivedelta"])
+    async def archiveupdate(self, ctx, *args: Union[nextcord.TextChannel, str]):
+        """Command to download only what's new in a channel since its last archive.
+        Attachments that were already archived are left out of the zip.
+        Threads are only included if their first message is new.
+
+        Permission Category : Verified Roles only.
+        Usage: `~archiveupdate #channel`
+        Usage: `~archiveupdate #channel1 "channel2"`
+        """
+        await logging_utils.log_command(
+            "archiveupdate", ctx.guild, ctx.channel, ctx.author
+        )
+        await self.archive_channels(ctx, args, incremental=True)
 
     @command_predicates.is_verified()
     @commands.command(name="archivecategory", aliases=["archivecat"])
@@ -327,83 +419,42 @@ class ArchiveCog(commands.Cog, name="Archive"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        # If we don't have the lock, let the user know it may take a while.
-        msg = None
-        if self.lock.locked():
-            embed = archive_utils.get_delay_embed()
+        category = await discord_utils.find_category(ctx, " ".join(args))
+        if category is None:
+            embed.add_field(
+                name="ERROR: Cannot find category",
+                value=f"Sorry, I cannot find a category with name {' '.join(args)}. "
+                f"Please make sure the spelling and capitalization are correct!",
+                inline=False,
+            )
             await discord_utils.send_message(ctx, embed)
-        # LOCK EVERYTHING
-        async with self.lock:
-            if msg:
-                await msg.delete()
-                msg = None
-            category = await discord_utils.find_category(ctx, " ".join(args))
-            if category is None:
-                embed.add_field(
-                    name="ERROR: Cannot find category",
-                    value=f"Sorry, I cannot find a category with name {' '.join(args)}. "
-                    f"Please make sure the spelling and capitalization are correct!",
-                    inline=False,
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
+            return
 
-            start_embed = await self.get_start_embed(category, category.text_channels)
-            msgs = await discord_utils.send_message(ctx, start_embed)
+        # If all the archive slots are taken, let the user know it may take a while.
+        if self.channel_slots.locked():
+            await discord_utils.send_message(ctx, archive_utils.get_delay_embed())
 
-            for text_channel in category.text_channels:
-                archive_utils.reset_archive_dir()
-                try:
-                    (
-                        zip_file,
-                        zip_file_size,
-                        textfile,
-                        textfile_size,
-                    ) = await self.archive_one_channel(text_channel)
-                    file, embed = self.get_file_and_embed(
-                        text_channel,
-                        ctx.guild.filesize_limit * 0 + constants.HARDCODED_FILE_SIZE,
-                        zip_file,
-                        zip_file_size,
-                        textfile,
-                        textfile_size,
-                    )
-                    await ctx.send(file=file, embed=embed)
-                except nextcord.errors.Forbidden:
-                    embed.add_field(
-                        name="ERROR: No access",
-                        value=f"Sorry! I don't have access to {text_channel.mention}. You'll need "
-                        f"to give me permission to view the channel if you want "
-                        f"to archive it",
-                        inline=False,
-                    )
-                    await discord_utils.send_message(ctx, embed)
-                    continue
-                # There has been an issue with AIO HTTP message sending fails, in which case discord.py crashes?
-                # So adding this try/catch for runtime to catch this. I don't think it's a deterministic error
-                except RuntimeError:
-                    embed = discord_utils.create_embed()
-                    embed.add_field(
-                        name="ERROR: Failed to send archive",
-                        value=f"Sorry! I had trouble sending you the archived file for "
-                        f"{text_channel.mention}. Perhaps you can try again with {ctx.prefix}archivechannel"
-                        f" after I've finished archiving {category.mention}.",
-                        inline=False,
-                    )
-                    await discord_utils.send_message(ctx, embed)
-                    continue
-            if msgs:
-                for msg in msgs:
-                    await msg.delete()
-            embed = discord_utils.create_embed()
+        start_embed = await self.get_start_embed(category, category.text_channels)
+        msgs = await discord_utils.send_message(ctx, start_embed)
+
+        failed = await self.archive_in_parallel(ctx, category.text_channels)
+        if msgs:
+            for msg in msgs:
+                await msg.delete()
+        embed = discord_utils.create_embed()
+        embed.add_field(
+            name="All Done!",
+            value=f"Successfully archived {category}",
+            inline=False,
+        )
+        if failed:
             embed.add_field(
-                name="All Done!",
-                value=f"Successfully archived {category}",
+                name="Failed",
+                value=f"Something went wrong archiving {', '.join(failed)}. Please try those again "
+                f"with {ctx.prefix}archivechannel",
                 inline=False,
             )
-            await discord_utils.send_message(ctx, embed)
-        # Clean up the archive dir
-        archive_utils.reset_archive_dir()
+        await discord_utils.send_message(ctx, embed)
 
     @command_predicates.is_bot_owner_or_admin()
     @commands.command(name="archiveserver")
@@ -417,61 +468,46 @@ class ArchiveCog(commands.Cog, name="Archive"):
         await logging_utils.log_command(
             "archiveserver", ctx.guild, ctx.channel, ctx.author
         )
-        embed = discord_utils.create_embed()
 
-        # If we don't have the lock, let the user know it may take a while.
-        msg = None
-        if self.lock.locked():
-            msg = await ctx.send(embed=archive_utils.get_delay_embed())
+        # If all the archive slots are taken, let the user know it may take a while.
+        if self.channel_slots.locked():
+            await discord_utils.send_message(ctx, archive_utils.get_delay_embed())
 
-        # LOCK EVERYTHING
-        async with self.lock:
-            start_embed = await self.get_start_embed(ctx.guild, ctx.guild.text_channels)
-            if msg:
-                await msg.delete()
-                msg = None
+        start_embed = await self.get_start_embed(ctx.guild, ctx.guild.text_channels)
+        msgs = await discord_utils.send_message(ctx, start_embed)
 
-            msgs = await discord_utils.send_message(ctx, start_embed)
-            for text_channel in ctx.guild.text_channels:
-                archive_utils.reset_archive_dir()
-                try:
-                    (
-                        zip_file,
-                        zip_file_size,
-                        textfile,
-                        textfile_size,
-                    ) = await self.archive_one_channel(text_channel)
-                    file, embed = self.get_file_and_embed(
-                        text_channel,
-                        ctx.guild.filesize_limit * 0 + constants.HARDCODED_FILE_SIZE,
-                        zip_file,
-                        zip_file_size,
-                        textfile,
-                        textfile_size,
-                    )
-                    await ctx.send(file=file, embed=embed)
-                except nextcord.errors.Forbidden:
-                    embed.add_field(
-                        name="ERROR: No access",
-                        value=f"Sorry! I don't have access to {text_channel.mention}. You'll need "
-                        f"to give me permission to view the channel if you want "
-                        f"to archive it",
-                        inline=False,
-                    )
-                    await discord_utils.send_message(ctx, embed)
-                    continue
-            if msgs:
-                for msg in msgs:
-                    await msg.delete()
-            embed = discord_utils.create_embed()
+        failed = await self.archive_in_parallel(ctx, ctx.guild.text_channels)
+        if msgs:
+            for msg in msgs:
+                await msg.delete()
+        embed = discord_utils.create_embed()
+        embed.add_field(
+            name="All Done!",
+            value=f"Successfully archived {ctx.guild}",
+            inline=False,
+        )
+        if failed:
             embed.add_field(
-                name="All Done!",
-                value=f"Successfully archived {ctx.guild}",
+                name="Failed",
+                value=f"Something went wrong archiving {', '.join(failed)}. Please try those again "
+                f"with {ctx.prefix}archivechannel",
                 inline=False,
             )
-            await discord_utils.send_message(ctx, embed)
-        # Clean up the archive dir
-        archive_utils.reset_archive_dir()
+        await discord_utils.send_message(ctx, embed)
+
+    async def archive_in_parallel(self, ctx, channels: list) -> list:
+        """Archive and send every channel, in parallel (up to CHANNEL_CONCURRENCY at a time).
+        One channel failing doesn't stop the others. Returns the mentions of the channels that failed"""
+        results = await asyncio.gather(
+            *[self.archive_and_send(ctx, channel) for channel in channels],
+            return_exceptions=True,
+        )
+        failed = []
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                print(f"Couldn't archive {channel.name}: {result!r}")
+                failed.append(channel.mention)
+        return failed
 
     async def get_start_embed(self, channel_or_guild, multiple_channels=None):
         owner = await self.bot.fetch_user(os.getenv("BOT_OWNER_DISCORD_ID"))
@@ -1,10 +1,9 @@
 import database
 import constants
 import os
+from database import repositories
 from utils import discord_utils, logging_utils, command_predicates
 from nextcord.ext import commands
-from sqlalchemy.orm import Session
-from sqlalchemy import insert
 
 """
 Custom command module. Allows users to set their own "custom command" of saveable image/embed/messages making a lot of easy to retrieve utility.
@@ -31,47 +30,39 @@ class CustomCommandCog(commands.Cog, name="Custom Commands"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        if not is_global and command_name in database.CUSTOM_COMMANDS[ctx.guild.id]:
+        # Global commands: Guild id = -1
+        target_id = constants.DB_GLOBAL_SERVER_ID if is_global else ctx.guild.id
+        await database.CUSTOM_COMMANDS.fetch(target_id)
+        if not is_global and command_name in database.CUSTOM_COMMANDS[target_id]:
             embed.add_field(
                 name="Failed",
                 value=f"The command `{ctx.prefix}{command_name}` already exists in `{ctx.guild.name}` with value "
-                f"`{database.CUSTOM_COMMANDS[ctx.guild.id][command_name][0]}`. If you'd like to replace "
+                f"`{database.CUSTOM_COMMANDS[target_id][command_name][0]}`. If you'd like to replace "
                 f"`{ctx.prefix}{command_name}`, please use `{ctx.prefix}editcustomcommand {command_name} "
                 f"{command_return}`",
             )
             await discord_utils.send_message(ctx, embed)
             return
 
-        with Session(database.DATABASE_ENGINE) as session:
-            result = (
-                session.query(database.CustomCommands)
-                .filter_by(server_id_command=f"{ctx.guild.id} {command_name}")
-                .first()
+        result = await repositories.get_custom_command(f"{target_id} {command_name}")
+        if result is None:
+            await repositories.add_custom_command(
+                target_id, ctx.guild.name, command_name, command_return, is_image
             )
-            if result is None:
-                stmt = insert(database.CustomCommands).values(
-                    server_id=ctx.guild.id,
-                    server_name=ctx.guild.name,
-                    server_id_command=f"{ctx.guild.id} {command_name}",
-                    command_name=command_name,
-                    command_return=command_return,
-                    image=is_image,
-                )
-                session.execute(stmt)
-                session.commit()
-
-                embed.add_field(
-                    name="Success",
-                    value=f"Added `{ctx.prefix}{command_name}` with value `{command_return}`",
-                )
-            # Command exists in the DB but not in our constants.
-            else:
-                command_return = result.command_return
-            # update constants dict
-            database.CUSTOM_COMMANDS[ctx.guild.id][command_name] = (
-                command_return,
-                is_image,
+            embed.add_field(
+                name="Success",
+                value=f"Added `{ctx.prefix}{command_name}` with value `{command_return}`",
             )
+        # Command exists in the DB but not in our constants.
+        else:
+            command_return = result.command_return
+        # update constants dict
+        database.CUSTOM_COMMANDS.set(target_id, command_name, command_return, is_image)
+        # Forget that we ever failed to find it
+        if is_global:
+            database.CUSTOM_COMMAND_MISSES.clear()
+        else:
+            database.CUSTOM_COMMAND_MISSES.discard((ctx.guild.id, command_name))
         await discord_utils.send_message(ctx, embed)
 
     @command_predicates.is_trusted()
@@ -201,10 +192,8 @@ class CustomCommandCog(commands.Cog, name="Custom Commands"):
 
         # Guild custom command
         guildid = ctx.guild.id
-        if (
-            guildid in database.CUSTOM_COMMANDS
-            and len(database.CUSTOM_COMMANDS[guildid]) > 0
-        ):
+        await database.CUSTOM_COMMANDS.fetch(guildid)
+        if len(database.CUSTOM_COMMANDS[guildid]) > 0:
             cclist = database.CUSTOM_COMMANDS[guildid].keys()
             custom_commands = "\n".join(sorted(cclist))
             embed.add_field(
@@ -220,12 +209,9 @@ class CustomCommandCog(commands.Cog, name="Custom Commands"):
             )
 
         # Global commands: Guild id = -1
-        guildid = -1
+        guildid = constants.DB_GLOBAL_SERVER_ID
         owner = await self.bot.fetch_user(os.getenv("BOT_OWNER_DISCORD_ID"))
-        if (
-            guildid in database.CUSTOM_COMMANDS
-            and len(database.CUSTOM_COMMANDS[guildid]) > 0
-        ):
+        if len(database.CUSTOM_COMMANDS[guildid]) > 0:
             cclist = database.CUSTOM_COMMANDS[guildid].keys()
             custom_commands = (
                 "\n".join(sorted(cclist))
@@ -269,39 +255,34 @@ class CustomCommandCog(commands.Cog, name="Custom Commands"):
         command_name = command_name.lower()
         command_return = " ".join(args)
 
+        await database.CUSTOM_COMMANDS.fetch(ctx.guild.id)
         if command_name in database.CUSTOM_COMMANDS[ctx.guild.id]:
+            # Read it now, the server's commands may be dropped from the cache while we wait on the DB
+            is_image = database.CUSTOM_COMMANDS[ctx.guild.id][command_name][1]
             # Update command in DB
-            with Session(database.DATABASE_ENGINE) as session:
-                session.query(database.CustomCommands).filter_by(
-                    server_id_command=f"{ctx.guild.id} {command_name}"
-                ).update({"command_return": command_return})
-                session.commit()
+            await repositories.set_custom_command_return(
+                f"{ctx.guild.id} {command_name}", command_return
+            )
             embed.add_field(
                 name="Success",
                 value=f"Edited command `{ctx.prefix}{command_name}` to have return value "
                 f"`{command_return}`",
             )
-            database.CUSTOM_COMMANDS[ctx.guild.id][command_name] = (
+            database.CUSTOM_COMMANDS.set(
+                ctx.guild.id,
+                command_name,
                 command_return,
-                database.CUSTOM_COMMANDS[ctx.guild.id][command_name][1],
+                is_image,
             )
         else:
             # If the command does not exist yet, just add it to DB.
-            with Session(database.DATABASE_ENGINE) as session:
-                stmt = insert(database.CustomCommands).values(
-                    server_id=ctx.guild.id,
-                    server_name=ctx.guild.name,
-                    server_id_command=f"{ctx.guild.id} {command_name}",
-                    command_name=command_name,
-                    command_return=command_return,
-                    image=False,
-                )
-                session.execute(stmt)
-                session.commit()
-            database.CUSTOM_COMMANDS[ctx.guild.id][command_name] = (
-                command_return,
-                False,
+            await repositories.add_custom_command(
+                ctx.guild.id, ctx.guild.name, command_name, command_return, False
+            )
+            database.CUSTOM_COMMANDS.set(
+                ctx.guild.id, command_name, command_return, False
             )
+            database.CUSTOM_COMMAND_MISSES.discard((ctx.guild.id, command_name))
             embed.add_field(
                 name="Success",
                 value=f"Added command `{ctx.prefix}{command_name}` with return value "
@@ -328,29 +309,25 @@ class CustomCommandCog(commands.Cog, name="Custom Commands"):
 
         command_name = command_name.lower()
         guildid = ctx.guild.id
+        database.CUSTOM_COMMAND_MISSES.discard((guildid, command_name))
+        await database.CUSTOM_COMMANDS.fetch(guildid)
         if command_name in database.CUSTOM_COMMANDS[guildid]:
-            del database.CUSTOM_COMMANDS[guildid][command_name]
-            with Session(database.DATABASE_ENGINE) as session:
-                session.query(database.CustomCommands).filter_by(
-                    server_id_command=f"{guildid} {command_name}"
-                ).delete()
-                session.commit()
+            database.CUSTOM_COMMANDS.remove(guildid, command_name)
+            await repositories.delete_custom_commands([f"{guildid} {command_name}"])
             embed.add_field(
                 name="Success",
                 value=f"Deleted custom command `{ctx.prefix}{command_name}`",
             )
         elif (
             await ctx.bot.is_owner(ctx.author)
-            and command_name in database.CUSTOM_COMMANDS[-1]
+            and command_name in database.CUSTOM_COMMANDS[constants.DB_GLOBAL_SERVER_ID]
         ):
             # Global commands: Guild id = -1
-            guildid = -1
-            del database.CUSTOM_COMMANDS[guildid][command_name]
-            with Session(database.DATABASE_ENGINE) as session:
-                session.query(database.CustomCommands).filter_by(
-                    server_id_command=f"{guildid} {command_name}"
-                ).delete()
-                session.commit()
+            guildid = constants.DB_GLOBAL_SERVER_ID
+            database.CUSTOM_COMMANDS.remove(guildid, command_name)
+            await repositories.delete_custom_commands(
+                [f"{guildid} {command_name}", f"{constants.DB_GLOBAL} {command_name}"]
+            )
             embed.add_field(
                 name="Success",
                 value=f"Deleted global command `{ctx.prefix}{command_name}`",
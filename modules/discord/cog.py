@@ -1,10 +1,9 @@
-import typing
 import nextcord
 import aiohttp
 import io
 import emoji
 from nextcord.ext import commands
-from utils import discord_utils, logging_utils, command_predicates
+from utils import discord_utils, emoji_utils, logging_utils, command_predicates
 
 """
 Discord module. Functions and commands related specificially to discord functionality, that does not intersect with any other modules.
@@ -331,18 +330,30 @@ class DiscordCog(commands.Cog, name="Discord"):
 
     @command_predicates.is_verified()
     @commands.command(name="steal")
-    async def steal(
-        self, ctx, *emojis: typing.Union[nextcord.Emoji, nextcord.PartialEmoji]
-    ):
+    async def steal(self, ctx, *emoji_strs: str):
         """Steals an emote from another server and uploads it to this server with the same name.
 
         Permission Category : Verified Roles only.
         Usage: `~steal :emote1: :emote2:`
+        Usage: `~steal emote_name` (if it's in another server I'm in)
         """
         await logging_utils.log_command("steal", ctx.guild, ctx.channel, ctx.author)
         embed = discord_utils.create_embed()
 
-        for to_steal in emojis:
+        for emoji_str in emoji_strs:
+            to_steal = emoji_utils.find_any_custom_emoji(emoji_str)
+            if to_steal is None:
+                suggestions = emoji_utils.EMOJI_INDEX.suggest(emoji_str.strip(":"))
+                embed.add_field(
+                    name="Failed",
+                    value=f"Could not find emote `{emoji_str}`."
+                    + (
+                        f" Did you mean {', '.join([f'`{name}`' for name in suggestions])}?"
+                        if suggestions and not emoji_str.startswith("<")
+                        else ""
+                    ),
+                )
+                continue
             url = str(to_steal.url)
             name = to_steal.name
             async with aiohttp.ClientSession() as ses:
@@ -3,7 +3,7 @@ import asyncio
 from typing import Union
 from utils import sheets_constants
 from nextcord.ext import commands
-from utils import discord_utils, logging_utils, command_predicates
+from utils import channel_order_utils, discord_utils, logging_utils, command_predicates
 
 """
 Discord Channel management module. Bundle of all discord functions and commands related to managing a specific discord channel and managing it.
@@ -172,40 +172,40 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
                     inline=False,
                 )
                 continue
-            # Move the channels
-            try:
-                await chan.edit(category=new_category)
-                channels_moved.append(chan)
-            except nextcord.Forbidden:
+            channels_moved.append(chan)
+
+        # Move the channels, all in one request
+        moves = channel_order_utils.ChannelMoves(ctx.guild)
+        moves.move_to_category(channels_moved, new_category)
+        try:
+            await moves.apply()
+        except nextcord.Forbidden:
+            embed.insert_field_at(
+                0,
+                name="Failed",
+                value="Forbidden! Have you checked if the bot has the required permissions?",
+                inline=False,
+            )
+            await discord_utils.send_message(ctx, embed)
+            return
+        except (
+            nextcord.HTTPException
+        ) as e:  # If category was filled externally/some other error
+            if "Maximum number of channels in category reached (50)" in str(e):
                 embed.insert_field_at(
                     0,
                     name="Failed",
-                    value="Forbidden! Have you checked if the bot has the required permissions?",
+                    value=f"Someone filled up category `{new_category}` while I was moving channels!",
                     inline=False,
                 )
-                await discord_utils.send_message(ctx, embed)
-                return
-
-            except (
-                nextcord.HTTPException
-            ) as e:  # If category was filled externally/some other error
-                if "Maximum number of channels in category reached (50)" in str(e):
-                    embed.insert_field_at(
-                        0,
-                        name="Failed",
-                        value=f"Someone filled up category `{new_category}` while I was moving channels!",
-                        inline=False,
-                    )
-                    await discord_utils.send_message(ctx, embed)
-                else:
-                    embed.insert_field_at(
-                        0,
-                        name="Failed",
-                        value=f"Could not move channel {chan.mention}: {str(e)}",
-                        inline=False,
-                    )
-                    await discord_utils.send_message(ctx, embed)
-            continue
+            else:
+                embed.insert_field_at(
+                    0,
+                    name="Failed",
+                    value=f"Could not move channels: {str(e)}",
+                    inline=False,
+                )
+            channels_moved = []
 
         if len(channels_moved) < 1:
             embed.insert_field_at(
@@ -217,7 +217,8 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
         else:
             embed.add_field(
                 name="Success",
-                value=f"Moved these channels to `{new_category.name}` : {', '.join([chan.mention for chan in channels_moved])}",
+                value=f"Moved these channels to `{new_category.name}` : {', '.join([chan.mention for chan in channels_moved])}\n"
+                f"{moves.summary()}",
                 inline=False,
             )
         await discord_utils.send_message(ctx, embed)
@@ -641,8 +642,14 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
             pos_to_shift_to = chan_shifting_to.position + 1
 
         # Move channels
+        moves = channel_order_utils.ChannelMoves(ctx.guild)
+        moves.order(
+            channel_order_utils.shifted_order(
+                chan_to_shift, None if pos_to_shift_to == 0 else chan_shifting_to
+            )
+        )
         try:
-            await chan_to_shift.edit(position=pos_to_shift_to)
+            await moves.apply()
         except nextcord.Forbidden:
             embed.add_field(
                 name="Failed",
@@ -654,12 +661,14 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
         if pos_to_shift_to == 0:
             embed.add_field(
                 name="Success",
-                value=f"Succesfully moved channel {chan_to_shift.mention} to top of category {chan_to_shift.category}",
+                value=f"Succesfully moved channel {chan_to_shift.mention} to top of category {chan_to_shift.category}\n"
+                f"{moves.summary()}",
             )
         else:
             embed.add_field(
                 name="Success",
-                value=f"Succesfully moved channel {chan_to_shift.mention} to just below {chan_shifting_to.mention}",
+                value=f"Succesfully moved channel {chan_to_shift.mention} to just below {chan_shifting_to.mention}\n"
+                f"{moves.summary()}",
             )
         await discord_utils.send_message(ctx, embed)
 
@@ -756,37 +765,22 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
 
         channel_list = self.sort_channels(category.text_channels)
 
-        start_embed = discord_utils.create_embed()
-        start_embed.add_field(
-            name="Sort Started",
-            value=f"Your sort of category `{category.name}` has begun! "
-            f"This may take a while. If I run into any errors, I'll let you know.",
-            inline=False,
-        )
-        start_embed_msgs = await discord_utils.send_message(ctx, start_embed)
-        start_embed_msg = start_embed_msgs[0]
-
-        for idx, channel in enumerate(channel_list):
-            # Skip channels already in correct place.
-            if channel.position == idx:
-                continue
-            try:
-                await channel.edit(position=idx)
-            except nextcord.Forbidden:
-                if start_embed_msg:
-                    await start_embed_msg.delete()
-                embed.add_field(
-                    name="Failed",
-                    value=f"Unable to sort `{channel.mention}`. Do I have the correct `manage_channel` positions?",
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
+        # Only the channels out of place move, all in one request
+        moves = channel_order_utils.ChannelMoves(ctx.guild)
+        moves.order(channel_list)
+        try:
+            await moves.apply()
+        except nextcord.Forbidden:
+            embed.add_field(
+                name="Failed",
+                value=f"Unable to sort `{category.name}`. Do I have the correct `manage_channel` positions?",
+            )
+            await discord_utils.send_message(ctx, embed)
+            return
 
-        if start_embed_msg:
-            await start_embed_msg.delete()
         embed.add_field(
             name="Success",
-            value=f"Sorted the channels in `{category.name}`!",
+            value=f"Sorted the channels in `{category.name}`! {moves.summary()}",
         )
         await discord_utils.send_message(ctx, embed)
 
@@ -898,38 +892,30 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
             await discord_utils.send_message(ctx, embed)
             return
 
-        start_embed = discord_utils.create_embed()
-        start_embed.add_field(
-            name="Sync Started",
-            value=f"Your syncing of category `{category.name}`"
-            f" has begun! This may take a while. If I run into "
-            f"any errors, I'll let you know.",
-            inline=False,
-        )
-        start_msgs = await discord_utils.send_message(ctx, start_embed)
-        start_msg = start_msgs[0]
+        async def sync(channel):
+            await channel.edit(sync_permissions=True)
 
-        try:
-            for channel in category.channels:
-                await channel.edit(sync_permissions=True)
-        except nextcord.Forbidden:
-            if start_msg:
-                await start_msg.delete()
+        # Each channel's edits are rate limited separately
+        succeeded, failed = await discord_utils.run_bulk(
+            category.channels,
+            sync,
+            route=lambda channel: channel.id,
+            ctx=ctx,
+            progress_name=f"Syncing category `{category.name}`",
+        )
+        if not succeeded and not failed:
             embed.add_field(
-                name="Failed",
-                value="Forbidden! Have you checked if the bot has the required permisisons?",
+                name="Success",
+                value=f"Category `{category.name}` has no channels to sync.",
                 inline=False,
             )
-            # reply to user
-            await discord_utils.send_message(ctx, embed)
-            return
-
-        if start_msg:
-            await start_msg.delete()
-        embed.add_field(
-            name="Success",
-            value=f"All channels in category `{category.name}` successfully synced to Category!",
-            inline=False,
+        discord_utils.add_bulk_summary(
+            embed,
+            succeeded,
+            failed,
+            lambda synced: f"Synced {len(synced)} channel{'s' if len(synced) != 1 else ''} "
+            f"in category `{category.name}` to the Category!",
+            describe=lambda channel: channel.mention,
         )
         await discord_utils.send_message(ctx, embed)
 
@@ -1008,8 +994,14 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
                 return
             pos_to_shift_to = cat_shifting_to.position + 1
 
+        moves = channel_order_utils.ChannelMoves(ctx.guild)
+        moves.order(
+            channel_order_utils.shifted_order(
+                cat_to_shift, None if pos_to_shift_to == 0 else cat_shifting_to
+            )
+        )
         try:
-            await cat_to_shift.edit(position=pos_to_shift_to)
+            await moves.apply()
         except nextcord.Forbidden:
             embed.add_field(
                 name="Failed",
@@ -1022,13 +1014,13 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
         if pos_to_shift_to == 0:
             embed.add_field(
                 name="Success",
-                value=f"Succesfully moved Category `{cat_to_shift}` to top of the server.",
+                value=f"Succesfully moved Category `{cat_to_shift}` to top of the server. {moves.summary()}",
                 inline=False,
             )
         else:
             embed.add_field(
                 name="Success",
-                value=f"Succesfully moved Category `{cat_to_shift}` to just below Category `{cat_shifting_to}`",
+                value=f"Succesfully moved Category `{cat_to_shift}` to just below Category `{cat_shifting_to}`. {moves.summary()}",
                 inline=False,
             )
         await discord_utils.send_message(ctx, embed)
@@ -1124,11 +1116,26 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
                 await discord_utils.send_message(ctx, embed)
                 return
 
+        # Roles given by name need to be the Role itself from here on
+        origRole = origRole_or_none
+        if targetRole_or_none is not None:
+            targetRole = targetRole_or_none
+
         targetCat = await discord_utils.find_category(ctx, targetCatName)
+        # origRole's overwrite in origCat, to give targetRole in targetCat
+        overwrite = None
+        if origRole is not None and origRole in origCat.overwrites:
+            overwrite = origCat.overwrites[origRole]
         try:
             # if targetCat doesn't exist, create it
             if targetCat is None:
-                targetCat = await origCat.clone(name=targetCatName)
+                overwrites = dict(origCat.overwrites)
+                # Created with targetRole's overwrite, so it doesn't need a request of its own
+                if overwrite is not None:
+                    overwrites[targetRole] = overwrite
+                targetCat = await ctx.guild.create_category(
+                    targetCatName, overwrites=overwrites
+                )
                 await targetCat.edit(position=origCat.position + 1)
                 embed.add_field(
                     name="Success",
@@ -1142,13 +1149,11 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
                     value=f"Nothing to do. Category `{origCat}` and `{targetCat}` already exist, and no roles were given to sync.",
                     inline=False,
                 )
+            elif overwrite is not None:
+                await targetCat.set_permissions(targetRole, overwrite=overwrite)
 
             if origRole is not None:
-                if origRole in origCat.overwrites:
-                    await targetCat.set_permissions(
-                        targetRole, overwrite=origCat.overwrites[origRole]
-                    )
-                    # await targetCat.set_permissions(origRole, overwrite=None)
+                if overwrite is not None:
                     embed.add_field(
                         name="Success",
                         value=f"Synced {targetRole.mention}'s permissions in `{targetCat}` with {origRole.mention}'s in `{origCat}`",
@@ -1304,26 +1309,56 @@ class DiscordChannelManagementCog(commands.Cog, name="Discord Channel Management
             )
             # delete category
             if react.emoji == confirm_emoji:
-                try:
-                    for channel in channel_list:
-                        await channel.delete()
-                    await category.delete()
-                    final_embed.add_field(
-                        name="Success",
-                        value=f"The category named `{category.name}` has been deleted!",
-                        inline=False,
-                    )
+
+                async def delete(channel):
+                    await channel.delete()
+
+                # Don't show progress in a channel we're deleting
+                succeeded, failed = await discord_utils.run_bulk(
+                    channel_list,
+                    delete,
+                    route=lambda channel: channel.id,
+                    ctx=ctx if ctx.channel not in channel_list else None,
+                    progress_name=f"Deleting category `{category.name}`",
+                )
+                if succeeded:
                     final_embed.add_field(
                         name="Channels deleted",
-                        value=f"{chr(10).join(channels)}",
+                        value=f"{chr(10).join([f'#{chan.name}' for chan in succeeded])}",
                         inline=False,
                     )
-                except:
-                    final_embed.add_field(
+                if failed:
+                    # The category stays, so the channels we couldn't delete aren't left without one
+                    final_embed.insert_field_at(
+                        0,
                         name="Failed",
-                        value=f"The category named `{category.name}` could not be deleted!",
+                        value=f"The category named `{category.name}` could not be deleted, "
+                        f"because some of its channels couldn't be.",
                         inline=False,
                     )
+                    discord_utils.add_bulk_summary(
+                        final_embed,
+                        [],
+                        failed,
+                        describe=lambda channel: f"#{channel.name}",
+                    )
+                else:
+                    try:
+                        await category.delete()
+                        final_embed.insert_field_at(
+                            0,
+                            name="Success",
+                            value=f"The category named `{category.name}` has been deleted!",
+                            inline=False,
+                        )
+                    except nextcord.HTTPException as e:
+                        final_embed.insert_field_at(
+                            0,
+                            name="Failed",
+                            value=f"The category named `{category.name}` could not be deleted! "
+                            f"{discord_utils.describe_http_error(e)}",
+                            inline=False,
+                        )
             else:
                 final_embed.add_field(
                     name="Canceled",
@@ -103,7 +103,7 @@ class DiscordRoleManagementCog(commands.Cog, name="Discord Role Management"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        users_with_role_list = []
+        users_to_assign = []
         for unclean_username in args:
             if isinstance(unclean_username, nextcord.Member):
                 user = unclean_username
@@ -126,18 +126,30 @@ class DiscordRoleManagementCog(commands.Cog, name="Discord Role Management"):
                     value=f"{user.mention} already has {role_to_assign.mention} role. No need to assign.",
                     inline=False,
                 )
-            else:
-                try:
-                    await user.add_roles(role_to_assign)
-                    users_with_role_list.append(user)
-                except nextcord.Forbidden:
-                    embed.add_field(
-                        name="Error Assigning Role!",
-                        value=f"I could not assign {role_to_assign.mention} to `{user.mention}`. Either this role is "
-                        f"too high up on the roles list for them, or I do not have permissions to give "
-                        f"them this role. Please ensure I have the `manage_roles` permission.",
-                        inline=False,
-                    )
+            elif user not in users_to_assign:
+                users_to_assign.append(user)
+
+        async def assign(user):
+            await user.add_roles(role_to_assign)
+
+        # Role changes share one rate limit per server, so they all go on the same route
+        users_with_role_list, failed = await discord_utils.run_bulk(
+            users_to_assign,
+            assign,
+            ctx=ctx,
+            progress_name=f"Assigning role {role_to_assign.name}",
+        )
+        for user, error in failed:
+            embed.add_field(
+                name="Error Assigning Role!",
+                value=f"I could not assign {role_to_assign.mention} to `{user.mention}`. Either this role is "
+                f"too high up on the roles list for them, or I do not have permissions to give "
+                f"them this role. Please ensure I have the `manage_roles` permission."
+                if isinstance(error, nextcord.Forbidden)
+                else f"I could not assign {role_to_assign.mention} to `{user.mention}`. "
+                f"{discord_utils.describe_http_error(error)}",
+                inline=False,
+            )
         if len(users_with_role_list) < 1:
             embed.insert_field_at(
                 0,
@@ -216,7 +228,7 @@ class DiscordRoleManagementCog(commands.Cog, name="Discord Role Management"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        users_with_role_list = []
+        users_to_unassign = []
         for unclean_username in args:
             if isinstance(unclean_username, nextcord.Member):
                 user = unclean_username
@@ -233,24 +245,36 @@ class DiscordRoleManagementCog(commands.Cog, name="Discord Role Management"):
                     continue
 
             # Unassign the role
-            try:
-                if role_to_unassign not in user.roles:
-                    embed.add_field(
-                        name="Error Unassigning Role!",
-                        value=f"{user.mention} does not have {role_to_unassign.mention} role to unassign.",
-                        inline=False,
-                    )
-                else:
-                    await user.remove_roles(role_to_unassign)
-                    users_with_role_list.append(user)
-            except nextcord.Forbidden:
+            if role_to_unassign not in user.roles:
                 embed.add_field(
                     name="Error Unassigning Role!",
-                    value=f"I could not unsassign {role_to_unassign.mention} from `{user.mention}`. Either this role is "
-                    f"too high up on the roles list for them, or I do not have permissions to give "
-                    f"them this role. Please ensure I have the `manage_roles` permission.",
+                    value=f"{user.mention} does not have {role_to_unassign.mention} role to unassign.",
                     inline=False,
                 )
+            elif user not in users_to_unassign:
+                users_to_unassign.append(user)
+
+        async def unassign(user):
+            await user.remove_roles(role_to_unassign)
+
+        # Role changes share one rate limit per server, so they all go on the same route
+        users_with_role_list, failed = await discord_utils.run_bulk(
+            users_to_unassign,
+            unassign,
+            ctx=ctx,
+            progress_name=f"Unassigning role {role_to_unassign.name}",
+        )
+        for user, error in failed:
+            embed.add_field(
+                name="Error Unassigning Role!",
+                value=f"I could not unsassign {role_to_unassign.mention} from `{user.mention}`. Either this role is "
+                f"too high up on the roles list for them, or I do not have permissions to give "
+                f"them this role. Please ensure I have the `manage_roles` permission."
+                if isinstance(error, nextcord.Forbidden)
+                else f"I could not unassign {role_to_unassign.mention} from `{user.mention}`. "
+                f"{discord_utils.describe_http_error(error)}",
+                inline=False,
+            )
         if len(users_with_role_list) < 1:
             embed.insert_field_at(
                 0,
@@ -20,14 +20,15 @@ class HelpCommand(commands.MinimalHelpCommand):
         """Intercept ~help a_custom_command errors"""
         command_name = string.lower()
 
-        if self.context.guild and command_name in database.CUSTOM_COMMANDS.get(
-            self.context.guild.id, {}
+        if (
+            self.context.guild
+            and database.CUSTOM_COMMANDS.get(self.context.guild.id, command_name)
+            is not None
         ):
             # Return special marker that we'll catch in send_error_message
             return f"__CUSTOM_COMMAND__{command_name}"
 
         return f"No command called '{string}' found."
-        # TODO global custom commands
 
     async def send_error_message(self, error):
         """Override to send custom command info as embed"""
@@ -38,7 +39,7 @@ class HelpCommand(commands.MinimalHelpCommand):
                 name="That's a custom command!",
                 value=f'The command "{command_name}" is a custom command created for this server!\n\n'
                 f"Use `~help Custom Commands` to see how they work!\n\n"
-                f"Your custom command response is: {database.CUSTOM_COMMANDS[self.context.guild.id][command_name]}",
+                f"Your custom command response is: {database.CUSTOM_COMMANDS.get(self.context.guild.id, command_name)[0]}",
                 inline=False,
             )
             await self.get_destination().send(embed=embed)
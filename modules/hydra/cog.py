@@ -2,7 +2,6 @@ import nextcord
 import constants
 import gspread
 import asyncio
-import heapq
 import shlex
 import re
 import emoji
@@ -36,7 +35,7 @@ class HydraCog(commands.Cog, name="Hydra"):
         self.bot = bot
         self.lock = asyncio.Lock()
         self.gdrive_credentials = google_utils.get_gdrive_credentials()
-        self.gspread_client = google_utils.create_gspread_client()
+        self.gspread_client = google_utils.ASYNC_GSPREAD_CLIENT
 
     ###################
     # HYDRA COMMANDS  #
@@ -68,8 +67,10 @@ class HydraCog(commands.Cog, name="Hydra"):
         try:
             if round_name is None:
                 # If no arg passed, retrieve current round and tell user
-                current_round = overview_sheet.worksheet.acell(
-                    round_col + str(row_to_find)
+                current_round = (
+                    await self.gspread_client.run(
+                        overview_sheet.worksheet.acell, round_col + str(row_to_find)
+                    )
                 ).value
                 if current_round is None:
                     embed.add_field(
@@ -86,13 +87,16 @@ class HydraCog(commands.Cog, name="Hydra"):
                 await discord_utils.send_message(ctx, embed)
             else:
                 # Update round instead
-                current_round = overview_sheet.worksheet.acell(
-                    round_col + str(row_to_find)
+                current_round = (
+                    await self.gspread_client.run(
+                        overview_sheet.worksheet.acell, round_col + str(row_to_find)
+                    )
                 ).value
 
-                overview_sheet.worksheet.update_acell(
-                    round_col + str(row_to_find), round_name
+                await self.gspread_client.update_acell(
+                    overview_sheet.worksheet, round_col + str(row_to_find), round_name
                 )
+                overview_sheet.set_cell_value(round_col + str(row_to_find), round_name)
 
                 if current_round:
                     embed.add_field(
@@ -154,8 +158,10 @@ class HydraCog(commands.Cog, name="Hydra"):
         try:
             if notes is None:
                 # If no arg passed, retrieve current notes and tell user
-                current_notes = overview_sheet.worksheet.acell(
-                    notes_col + str(row_to_find)
+                current_notes = (
+                    await self.gspread_client.run(
+                        overview_sheet.worksheet.acell, notes_col + str(row_to_find)
+                    )
                 ).value
                 if current_notes is None:
                     embed.add_field(
@@ -172,13 +178,16 @@ class HydraCog(commands.Cog, name="Hydra"):
                 await discord_utils.send_message(ctx, embed)
             else:
                 # Update notes instead
-                current_notes = overview_sheet.worksheet.acell(
-                    notes_col + str(row_to_find)
+                current_notes = (
+                    await self.gspread_client.run(
+                        overview_sheet.worksheet.acell, notes_col + str(row_to_find)
+                    )
                 ).value
 
-                overview_sheet.worksheet.update_acell(
-                    notes_col + str(row_to_find), notes
+                await self.gspread_client.update_acell(
+                    overview_sheet.worksheet, notes_col + str(row_to_find), notes
                 )
+                overview_sheet.set_cell_value(notes_col + str(row_to_find), notes)
 
                 if current_notes:
                     embed.add_field(
@@ -249,10 +258,9 @@ class HydraCog(commands.Cog, name="Hydra"):
             allsheets = []
 
             # Group all channels sharing the same tethered sheet. Now find the right cell
+            tethers = sheet_utils.findsheettethers(allchans)
             for currchan in allchans:
-                result, _ = sheet_utils.findsheettether(
-                    str(currchan.category_id), str(currchan.id)
-                )
+                result, _ = tethers[currchan.id]
                 if result is None:
                     continue  # Silently skip channels with no tether
                 curr_sheet_link = result.sheet_link
@@ -721,8 +729,10 @@ class HydraCog(commands.Cog, name="Hydra"):
                         # Get tab name from the appropriate column
                         # Get the cell formula from column D
                         try:
-                            tab_name = overview_ws.acell(
-                                f"D{row_to_find}"
+                            tab_name = (
+                                await self.gspread_client.run(
+                                    overview_ws.acell, f"D{row_to_find}"
+                                )
                             ).value  # FIXME - hardcoded
                             tab_name_found = True
                         except gspread.exceptions.APIError:
@@ -738,18 +748,19 @@ class HydraCog(commands.Cog, name="Hydra"):
                 if tab_name_found and tab_name:
                     tab_deleted = False
                     try:
-                        sh = self.gspread_client.open_by_url(curr_sheet_link)
+                        sh = await self.gspread_client.open_by_url(curr_sheet_link)
 
                         # Try to find and delete worksheet
                         ws_to_delete = None
                         if tab_name:
+                            worksheets = await self.gspread_client.worksheets(sh)
                             ws_to_delete = next(
-                                (ws for ws in sh.worksheets() if ws.title == tab_name),
+                                (ws for ws in worksheets if ws.title == tab_name),
                                 None,
                             )
 
                         if ws_to_delete:
-                            sh.del_worksheet(ws_to_delete)
+                            await self.gspread_client.del_worksheet(sh, ws_to_delete)
                             tab_deleted = True
                     except gspread.exceptions.APIError:  # Report in final message
                         pass
@@ -763,10 +774,16 @@ class HydraCog(commands.Cog, name="Hydra"):
                         overview_ws = overview_sheet.worksheet
 
                         # Get the row values
-                        row_values = overview_ws.row_values(row_to_find)
+                        row_values = await self.gspread_client.run(
+                            overview_ws.row_values, row_to_find
+                        )
 
                         if row_values:
-                            overview_ws.delete_rows(row_to_find)
+                            await self.gspread_client.delete_rows(
+                                overview_ws, row_to_find
+                            )
+                            # Every row below has moved up, so the shared snapshot is useless now
+                            sheet_utils.OverviewSheet.invalidate(curr_sheet_link)
                             # A new row probably should be created here, but
                             # the filter on the overview sheet doesnt apply
                             # properly, so we'll just trust the users good
@@ -909,71 +926,17 @@ class HydraCog(commands.Cog, name="Hydra"):
         embed = discord_utils.create_embed()
 
         try:
-            # 1. Fetch initial messages from each channel across categories given
-            channel_histories = []
-            for cat in categories:
-                for ch in cat.text_channels:
-                    try:
-                        history = []
-                        async for m in ch.history(
-                            limit=hydra_constants.HISTORY_FETCH_LIMIT
-                        ):
-                            history.append(m)
-                        if history:
-                            channel_histories.append(
-                                (ch, history, 0)
-                            )  # (channel, messages, current_index)
-                    except Exception:
-                        # Skip channels we can't read
-                        continue
-
-            # 2. Initialize Min-Heap with the first message from each channel
-            min_heap = []
-            for ch, history, idx in channel_histories:
-                if history:
-                    msg = history[idx]
-                    # Push (timestamp, channel_index, message) - using negative timestamp for max-heap behavior
-                    heapq.heappush(
-                        min_heap,
-                        (-msg.created_at.timestamp(), len(min_heap), ch, history, idx),
-                    )
-
-            # 3. Extract human messages and non bot calls until we have enough
-            msgs = []
-            channel_indices = {ch: i for i, (ch, _, _) in enumerate(channel_histories)}
-
-            while min_heap and len(msgs) < limit:
-                # Get the most recent message
-                _, _, ch, history, idx = heapq.heappop(min_heap)
-                current_msg = history[idx]
-
-                # Check if it's from a human (not a bot)
-                if not current_msg.author.bot and not current_msg.content.startswith(
-                    constants.DEFAULT_BOT_PREFIX
-                ):
-                    msgs.append(
-                        (
-                            current_msg.created_at,
-                            ch,
-                            current_msg.author,
-                            current_msg.content,
-                        )
-                    )
-
-                # Refill the heap from the same channel
-                next_idx = idx + 1
-                if next_idx < len(history):
-                    next_msg = history[next_idx]
-                    heapq.heappush(
-                        min_heap,
-                        (
-                            -next_msg.created_at.timestamp(),
-                            channel_indices.get(ch, 0),
-                            ch,
-                            history,
-                            next_idx,
-                        ),
-                    )
+            # Merge the channels' histories newest first, keeping human messages and non bot calls
+            channels = [ch for cat in categories for ch in cat.text_channels]
+            msgs = [
+                (msg.created_at, ch, msg.author, msg.content)
+                for ch, msg in await hydra_discord_utils.newest_messages(
+                    channels,
+                    limit,
+                    lambda msg: not msg.author.bot
+                    and not msg.content.startswith(constants.DEFAULT_BOT_PREFIX),
+                )
+            ]
 
         except Exception as e:
             embed.add_field(
@@ -1221,13 +1184,13 @@ class HydraCog(commands.Cog, name="Hydra"):
         # Move the sheet tab into the active section
         tab_embed = discord_utils.create_embed()
         try:
-            curr_sheet = self.gspread_client.open_by_url(curr_sheet_link)
+            curr_sheet = await self.gspread_client.open_by_url(curr_sheet_link)
 
             # Find index by looking for last occurrence of a sheet ending with "Template".
 
             template_index = 0
             found_template = False
-            for sheet in curr_sheet.worksheets():
+            for sheet in await self.gspread_client.worksheets(curr_sheet):
                 if sheet.title.endswith("Template"):
                     template_index = sheet.index
                     found_template = True
@@ -1238,8 +1201,11 @@ class HydraCog(commands.Cog, name="Hydra"):
             if not found_template:
                 template_index = 0  # Move to start if no templates found
 
-            tab_to_move = curr_sheet.get_worksheet_by_id(int(sheet_tab_id))
-            tab_to_move.update_index(template_index + 1)  # Move to after last template
+            tab_to_move = await self.gspread_client.get_worksheet_by_id(
+                curr_sheet, int(sheet_tab_id)
+            )
+            # Move to after last template
+            await self.gspread_client.update_index(tab_to_move, template_index + 1)
             tab_embed.add_field(
                 name="Success",
                 value=f"Successfully moved the sheet tab for {ctx.channel.mention} to the active section.",
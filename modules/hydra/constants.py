@@ -5,6 +5,8 @@ SUMMARY_CHUNK_SIZE = 12  # number of fields per summary message (catsummary)
 WATCH_DEFAULT_LIMIT = 100
 WATCH_MAX_LIMIT = 250
 HISTORY_FETCH_LIMIT = 100  # per-channel history fetch for watchcategory
+HISTORY_FIRST_PAGE_SIZE = 10  # first page per channel, later pages only if needed
+HISTORY_FETCH_CONCURRENCY = 8  # history pages fetched at once
 
 # Confirmation timeouts
 DELETE_CONFIRM_TIMEOUT = 15.0  # seconds to wait for confirmation reactions
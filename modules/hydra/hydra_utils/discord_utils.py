@@ -1,4 +1,7 @@
+from modules.hydra import constants as hydra_constants
 from utils import discord_utils
+import asyncio
+import heapq
 import nextcord
 from nextcord.ext.commands import Context
 
@@ -48,10 +51,7 @@ async def category_move_to_archive(ctx: Context, archive_name: str):
             candidate = " ".join(cat_name_words[:i]) + " Archive"
             candidates.append(candidate)
 
-        for cand in candidates:
-            archive_category = await discord_utils.find_category(ctx, cand)
-            if archive_category:
-                break
+        archive_category = await discord_utils.find_first_category(ctx, candidates)
 
     else:
         archive_category = await discord_utils.find_category(ctx, archive_name)
@@ -143,3 +143,73 @@ async def category_move_to_archive(ctx: Context, archive_name: str):
         inline=False,
     )
     await discord_utils.send_message(ctx, embed)
+
+
+async def channel_history(
+    channel: nextcord.TextChannel,
+    fetch_slots: asyncio.Semaphore,
+    limit: int = hydra_constants.HISTORY_FETCH_LIMIT,
+):
+    """Yields the channel's messages, newest first. Starts with a small page, and only fetches more
+    (full pages) as they're asked for. Each page fetch waits for one of the fetch_slots."""
+    fetched = 0
+    before = None
+    page_size = hydra_constants.HISTORY_FIRST_PAGE_SIZE
+    while fetched < limit:
+        async with fetch_slots:
+            page = [
+                msg
+                async for msg in channel.history(
+                    limit=min(page_size, limit - fetched), before=before
+                )
+            ]
+        for msg in page:
+            yield msg
+        if len(page) < min(page_size, limit - fetched):
+            # Reached the start of the channel
+            return
+        fetched += len(page)
+        before = page[-1]
+        page_size = 100
+
+
+async def newest_messages(channels: list, limit: int, keep) -> list:
+    """
+    Find the `limit` newest messages across all the channels for which keep(message) is true, newest first.
+    Channels are read concurrently and merged lazily, so we stop fetching as soon as we have enough.
+    Channels we can't read are skipped.
+    :return: list of (channel, message)
+    """
+    fetch_slots = asyncio.Semaphore(hydra_constants.HISTORY_FETCH_CONCURRENCY)
+    histories = [channel_history(channel, fetch_slots) for channel in channels]
+
+    async def next_message(history):
+        try:
+            return await anext(history, None)
+        except (nextcord.Forbidden, nextcord.HTTPException):
+            return None
+
+    results = []
+    try:
+        # Start the heap with each channel's newest message. These first pages are fetched concurrently
+        first_msgs = await asyncio.gather(*[next_message(h) for h in histories])
+        # (negative timestamp so the newest pops first, channel index, message)
+        heap = [
+            (-msg.created_at.timestamp(), i, msg)
+            for i, msg in enumerate(first_msgs)
+            if msg is not None
+        ]
+        heapq.heapify(heap)
+
+        while heap and len(results) < limit:
+            _, i, msg = heapq.heappop(heap)
+            if keep(msg):
+                results.append((channels[i], msg))
+            # Refill from the same channel. Usually already fetched, otherwise this fetches its next page
+            next_msg = await next_message(histories[i])
+            if next_msg is not None:
+                heapq.heappush(heap, (-next_msg.created_at.timestamp(), i, next_msg))
+    finally:
+        for history in histories:
+            await history.aclose()
+    return results
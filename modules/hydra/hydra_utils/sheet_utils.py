@@ -51,7 +51,7 @@ async def create_puzzle_channel_from_template(
 
     # Open the spreadsheet and choose template tab
     try:
-        curr_sheet = gspread_client.open_by_url(curr_sheet_link)
+        curr_sheet = await gspread_client.open_by_url(curr_sheet_link)
     except gspread.exceptions.APIError as e:
         error_json = e.response.json()
         error_status = error_json.get("error", {}).get("status")
@@ -75,10 +75,10 @@ async def create_puzzle_channel_from_template(
     used_fallback = False
 
     try:
-        template_ws = curr_sheet.worksheet(desired_template_tab)
+        template_ws = await gspread_client.worksheet(curr_sheet, desired_template_tab)
     except gspread.exceptions.WorksheetNotFound:
         try:
-            template_ws = curr_sheet.worksheet("Template")
+            template_ws = await gspread_client.worksheet(curr_sheet, "Template")
             used_fallback = True
         except gspread.exceptions.WorksheetNotFound:
             embed.add_field(
@@ -104,7 +104,7 @@ async def create_puzzle_channel_from_template(
 
     # Make sure tab_name does not exist
     try:
-        curr_sheet.worksheet(tab_name)
+        await gspread_client.worksheet(curr_sheet, tab_name)
         # If there is a tab with the given name, that's an error!
         embed = discord_utils.create_embed()
         embed.add_field(
@@ -122,7 +122,8 @@ async def create_puzzle_channel_from_template(
 
     # Try to duplicate the template tab and rename it to the given name
     try:
-        newsheet = curr_sheet.duplicate_sheet(
+        newsheet = await gspread_client.duplicate_sheet(
+            curr_sheet,
             source_sheet_id=template_id,
             new_sheet_name=tab_name,
             insert_sheet_index=template_index
@@ -195,70 +196,89 @@ async def create_puzzle_channel_from_template(
     await new_chan.edit(topic=f"Tab Link - {final_sheet_link}")
 
     # tether channel
-    addsheettethergeneric(gspread_client, curr_sheet_link, ctx.message.guild, new_chan)
+    await addsheettethergeneric(
+        gspread_client, curr_sheet_link, ctx.message.guild, new_chan
+    )
 
     # update overview and new sheet
     try:
-        overview = OverviewSheet(gspread_client, curr_sheet_link)
-        overview_id = overview.worksheet.id
-        first_empty = len(overview.overview_data) + 1
+        async with OverviewSheet.append_lock(curr_sheet_link):
+            # Always re-read here, since we're about to append a row after the last one
+            overview = await OverviewSheet.open(
+                gspread_client, curr_sheet_link, max_age=0
+            )
+            overview_id = overview.worksheet.id
+            first_empty = len(overview.overview_data) + 1
 
-        discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
-        sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
-        puzzle_name_col = overview.get_cell_value(
-            sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
-        )
-        status_col = overview.get_cell_value(sheets_constants.STATUS_COLUMN_LOCATION)
-        answer_col = overview.get_cell_value(sheets_constants.ANSWER_COLUMN_LOCATION)
+            discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
+            sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
+            puzzle_name_col = overview.get_cell_value(
+                sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
+            )
+            status_col = overview.get_cell_value(
+                sheets_constants.STATUS_COLUMN_LOCATION
+            )
+            answer_col = overview.get_cell_value(
+                sheets_constants.ANSWER_COLUMN_LOCATION
+            )
 
-        batch = batch_update_utils.BatchUpdateBuilder()
-        batch.update_cell_by_label(
-            sheet_id=overview_id,
-            label=puzzle_name_col + str(first_empty),
-            value=f'=HYPERLINK("{final_sheet_link}", "{puzzle_name}")',
-            is_formula=True,
-        )
+            batch = batch_update_utils.BatchUpdateBuilder()
+            batch.update_cell_by_label(
+                sheet_id=overview_id,
+                label=puzzle_name_col + str(first_empty),
+                value=f'=HYPERLINK("{final_sheet_link}", "{puzzle_name}")',
+                is_formula=True,
+            )
 
-        batch.update_cell_by_label(
-            sheet_id=overview_id,
-            label=discord_channel_id_col + str(first_empty),
-            value=str(new_chan.id),
-        )
-        batch.update_cell_by_label(
-            sheet_id=overview_id,
-            label=sheet_tab_id_col + str(first_empty),
-            value=str(newsheet.id),
-        )
+            batch.update_cell_by_label(
+                sheet_id=overview_id,
+                label=discord_channel_id_col + str(first_empty),
+                value=str(new_chan.id),
+            )
+            batch.update_cell_by_label(
+                sheet_id=overview_id,
+                label=sheet_tab_id_col + str(first_empty),
+                value=str(newsheet.id),
+            )
 
-        unstarted = sheets_constants.UNSTARTED_NAME
-        batch.update_cell_by_label(
-            sheet_id=overview_id,
-            label=status_col + str(first_empty),
-            value=unstarted,
-        )
+            unstarted = sheets_constants.UNSTARTED_NAME
+            batch.update_cell_by_label(
+                sheet_id=overview_id,
+                label=status_col + str(first_empty),
+                value=unstarted,
+            )
 
-        tab_ans_loc = sheets_constants.TAB_ANSWER_LOCATION
-        chan_name_loc = sheets_constants.TAB_CHAN_NAME_LOCATION
-        url_loc = sheets_constants.TAB_URL_LOCATION
+            tab_ans_loc = sheets_constants.TAB_ANSWER_LOCATION
+            chan_name_loc = sheets_constants.TAB_CHAN_NAME_LOCATION
+            url_loc = sheets_constants.TAB_URL_LOCATION
 
-        batch.update_cell_by_label(
-            sheet_id=overview_id,
-            label=answer_col + str(first_empty),
-            value="='{}'!{}".format(tab_name.replace("'", "''"), tab_ans_loc),
-            is_formula=True,
-        )
+            batch.update_cell_by_label(
+                sheet_id=overview_id,
+                label=answer_col + str(first_empty),
+                value="='{}'!{}".format(tab_name.replace("'", "''"), tab_ans_loc),
+                is_formula=True,
+            )
 
-        batch.update_cell_by_label(
-            sheet_id=newsheet.id,
-            label=chan_name_loc,
-            value=puzzle_name,
-        )
-        if puzzle_url:
             batch.update_cell_by_label(
-                sheet_id=newsheet.id, label=url_loc, value=puzzle_url
+                sheet_id=newsheet.id,
+                label=chan_name_loc,
+                value=puzzle_name,
             )
+            if puzzle_url:
+                batch.update_cell_by_label(
+                    sheet_id=newsheet.id, label=url_loc, value=puzzle_url
+                )
 
-        gspread_client.open_by_url(curr_sheet_link).batch_update(batch.build())
+            await gspread_client.batch_update(overview.spreadsheet, batch.build())
+            # Keep the shared Overview snapshot in sync with the row we just added
+            overview.set_cell_value(puzzle_name_col + str(first_empty), puzzle_name)
+            overview.set_cell_value(
+                discord_channel_id_col + str(first_empty), str(new_chan.id)
+            )
+            overview.set_cell_value(
+                sheet_tab_id_col + str(first_empty), str(newsheet.id)
+            )
+            overview.set_cell_value(status_col + str(first_empty), unstarted)
 
     except gspread.exceptions.APIError as e:
         # surface a concise error back to user
@@ -298,7 +318,7 @@ async def findchanidcell(
 ) -> list[tuple[int, Worksheet, list]] | None:
     """Find the cell with the discord channel id based on overview (moved from HydraCog)."""
     try:
-        overview_wrapper = OverviewSheet(gspread_client, sheet_link)
+        overview_wrapper = await OverviewSheet.open(gspread_client, sheet_link)
     except gspread.exceptions.APIError as e:
         embed = discord_utils.create_embed()
         embed.add_field(
@@ -329,22 +349,17 @@ async def findchanidcell(
         return None
 
     overview_values = overview_wrapper.overview_data
-    id_to_row = {
-        str(row[0]): idx + 1
-        for idx, row in enumerate(overview_values)
-        if row and row[0]
-    }
 
     all_chan_ids = []
     for channel_id in list_channel_id:
-        rownum = id_to_row.get(str(channel_id))
+        rownum = overview_wrapper.channel_rows.get(str(channel_id))
         all_chan_ids.append((rownum, overview_wrapper.worksheet, overview_values))
     return all_chan_ids
 
 
-def firstemptyrow(worksheet):
+async def firstemptyrow(gspread_client, worksheet):
     """Finds the first empty row in a worksheet (moved from HydraCog)."""
-    return len(worksheet.get_values()) + 1
+    return len(await gspread_client.run(worksheet.get_values)) + 1
 
 
 async def get_overview(
@@ -352,7 +367,7 @@ async def get_overview(
 ) -> OverviewSheet | None:
     """Open an OverviewSheet with improved error messages (moved from HydraCog)."""
     try:
-        overview_sheet = OverviewSheet(gspread_client, sheet_link)
+        overview_sheet = await OverviewSheet.open(gspread_client, sheet_link)
     except gspread.exceptions.APIError as e:
         error_json = e.response.json()
         error_status = error_json.get("error", {}).get("status")
@@ -417,7 +432,7 @@ async def sheet_move_to_archive(gspread_client, ctx: Context):
     tab_id = overview_sheet.get_cell_value(sheet_tab_id_col + str(row_to_find))
 
     try:
-        worksheets = overview_sheet.spreadsheet.worksheets()
+        worksheets = await gspread_client.worksheets(overview_sheet.spreadsheet)
         puzzle_tab = next((w for w in worksheets if w.id == int(tab_id)), None)
         if puzzle_tab is None:
             embed.add_field(
@@ -426,7 +441,7 @@ async def sheet_move_to_archive(gspread_client, ctx: Context):
                 inline=False,
             )
         else:
-            puzzle_tab.update_index(len(worksheets))
+            await gspread_client.update_index(puzzle_tab, len(worksheets))
             embed.add_field(
                 name="Success",
                 value="Moved tab to the end of the sheet!",
@@ -477,11 +492,13 @@ async def batch_create_puzzle_channels(
     curr_sheet_link = str(result.sheet_link)
 
     try:
-        spreadsheet = gspread_client.open_by_url(curr_sheet_link)
-        template_sheet = spreadsheet.worksheet("Template")
+        spreadsheet = await gspread_client.open_by_url(curr_sheet_link)
+        template_sheet = await gspread_client.worksheet(spreadsheet, "Template")
 
         # Fetch all existing worksheet names once (single API call)
-        existing_sheet_names = {ws.title for ws in spreadsheet.worksheets()}
+        existing_sheet_names = {
+            ws.title for ws in await gspread_client.worksheets(spreadsheet)
+        }
     except gspread.exceptions.WorksheetNotFound:
         embed = discord_utils.create_embed()
         embed.add_field(
@@ -572,7 +589,9 @@ async def batch_create_puzzle_channels(
         )
 
     try:
-        batch_response = spreadsheet.batch_update({"requests": requests})  # noqa: F841
+        batch_response = await gspread_client.batch_update(  # noqa: F841
+            spreadsheet, {"requests": requests}
+        )
     except gspread.exceptions.APIError as e:
         error_json = e.response.json()
         error_status = error_json.get("error", {}).get("status")
@@ -610,148 +629,170 @@ async def batch_create_puzzle_channels(
         return []
 
     # Refresh and get the newly created sheets
-    spreadsheet = gspread_client.open_by_url(curr_sheet_link)
+    spreadsheet = await gspread_client.open_by_url(curr_sheet_link)
     worksheets = []
 
     for _, tab_name, _, _ in channels:
         try:
-            ws = spreadsheet.worksheet(tab_name)
+            ws = await gspread_client.worksheet(spreadsheet, tab_name)
             worksheets.append(ws)
         except Exception:
             worksheets.append(None)
 
     # Get overview wrapper and constants
-    overview_wrapper = OverviewSheet(gspread_client, curr_sheet_link)
-    overview_values = overview_wrapper.overview_data
-    first_empty_row = len(overview_values) + 1
-    overview_id = overview_wrapper.worksheet.id
+    async with OverviewSheet.append_lock(curr_sheet_link):
+        # Always re-read here, since we're about to append rows after the last one
+        overview_wrapper = await OverviewSheet.open(
+            gspread_client, curr_sheet_link, max_age=0
+        )
+        overview_values = overview_wrapper.overview_data
+        first_empty_row = len(overview_values) + 1
+        overview_id = overview_wrapper.worksheet.id
 
-    # Get column labels
-    puzzle_name_col = overview_wrapper.get_cell_value(
-        sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
-    )
-    status_col = overview_wrapper.get_cell_value(
-        sheets_constants.STATUS_COLUMN_LOCATION
-    )
-    answer_col = overview_wrapper.get_cell_value(
-        sheets_constants.ANSWER_COLUMN_LOCATION
-    )
-    discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
-    sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
+        # Get column labels
+        puzzle_name_col = overview_wrapper.get_cell_value(
+            sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
+        )
+        status_col = overview_wrapper.get_cell_value(
+            sheets_constants.STATUS_COLUMN_LOCATION
+        )
+        answer_col = overview_wrapper.get_cell_value(
+            sheets_constants.ANSWER_COLUMN_LOCATION
+        )
+        discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
+        sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
 
-    # Build batch update for overview and new sheets
-    batch = batch_update_utils.BatchUpdateBuilder()
+        # Build batch update for overview and new sheets
+        batch = batch_update_utils.BatchUpdateBuilder()
 
-    for idx, (puzzle_name, tab_name, puzzle_url, channel) in enumerate(channels):
-        if worksheets[idx] is None:
-            continue
-        try:
-            row_num = first_empty_row + idx
-            newsheet = worksheets[idx]
-            final_sheet_link = curr_sheet_link + "/edit#gid=" + str(newsheet.id)
-
-            # Batch update overview row
-            overview_updates = {
-                puzzle_name_col + str(row_num): (
-                    f'=HYPERLINK("{final_sheet_link}", "{puzzle_name}")',
-                    True,  # is_formula
-                ),
-                discord_channel_id_col + str(row_num): (str(channel.id), False),
-                sheet_tab_id_col + str(row_num): (str(newsheet.id), False),
-                status_col + str(row_num): (sheets_constants.UNSTARTED_NAME, False),
-                answer_col + str(row_num): (
-                    "='{}'!{}".format(
-                        tab_name.replace("'", "''"),
-                        sheets_constants.TAB_ANSWER_LOCATION,
+        for idx, (puzzle_name, tab_name, puzzle_url, channel) in enumerate(channels):
+            if worksheets[idx] is None:
+                continue
+            try:
+                row_num = first_empty_row + idx
+                newsheet = worksheets[idx]
+                final_sheet_link = curr_sheet_link + "/edit#gid=" + str(newsheet.id)
+
+                # Batch update overview row
+                overview_updates = {
+                    puzzle_name_col + str(row_num): (
+                        f'=HYPERLINK("{final_sheet_link}", "{puzzle_name}")',
+                        True,  # is_formula
                     ),
-                    True,  # is_formula
-                ),
-            }
+                    discord_channel_id_col + str(row_num): (str(channel.id), False),
+                    sheet_tab_id_col + str(row_num): (str(newsheet.id), False),
+                    status_col + str(row_num): (sheets_constants.UNSTARTED_NAME, False),
+                    answer_col + str(row_num): (
+                        "='{}'!{}".format(
+                            tab_name.replace("'", "''"),
+                            sheets_constants.TAB_ANSWER_LOCATION,
+                        ),
+                        True,  # is_formula
+                    ),
+                }
 
-            for label, (value, is_formula) in overview_updates.items():
-                batch.update_cell_by_label(
-                    sheet_id=overview_id,
-                    label=label,
-                    value=value,
-                    is_formula=is_formula,
+                for label, (value, is_formula) in overview_updates.items():
+                    batch.update_cell_by_label(
+                        sheet_id=overview_id,
+                        label=label,
+                        value=value,
+                        is_formula=is_formula,
+                    )
+
+                # Batch update new sheet
+                new_sheet_updates = {
+                    sheets_constants.TAB_CHAN_NAME_LOCATION: puzzle_name,
+                }
+                if puzzle_url:
+                    new_sheet_updates[sheets_constants.TAB_URL_LOCATION] = puzzle_url
+
+                for label, value in new_sheet_updates.items():
+                    batch.update_cell_by_label(
+                        sheet_id=newsheet.id,
+                        label=label,
+                        value=value,
+                    )
+
+                # Tether channel
+                await addsheettethergeneric(
+                    gspread_client, curr_sheet_link, ctx.guild, channel
                 )
 
-            # Batch update new sheet
-            new_sheet_updates = {
-                sheets_constants.TAB_CHAN_NAME_LOCATION: puzzle_name,
-            }
-            if puzzle_url:
-                new_sheet_updates[sheets_constants.TAB_URL_LOCATION] = puzzle_url
+                # Update channel topic
+                await channel.edit(topic=f"Tab Link - {final_sheet_link}")
 
-            for label, value in new_sheet_updates.items():
-                batch.update_cell_by_label(
-                    sheet_id=newsheet.id,
-                    label=label,
-                    value=value,
+                # Send messages to channel
+                try:
+                    embed = discord_utils.create_embed()
+                    embed.add_field(
+                        name="Success",
+                        value=f"Tab **{tab_name}** has been created at [{newsheet.spreadsheet.title}]({final_sheet_link}) spreadsheet.",
+                        inline=False,
+                    )
+                    msg = await channel.send(embed=embed)
+                    await discord_utils.pin_message(msg)
+
+                    if puzzle_url:
+                        embed = discord_utils.create_embed()
+                        embed.description = puzzle_url
+                        msg2 = await channel.send(embed=embed)
+                        embed_or_none = await discord_utils.pin_message(msg2)
+                        if embed_or_none is None:
+                            await msg2.add_reaction(emoji.emojize(":pushpin:"))
+                except Exception:
+                    pass
+            except Exception as e:
+                embed = discord_utils.create_embed()
+                embed.add_field(
+                    name="Failed",
+                    value=f"Error processing `{puzzle_name}`. Error: {str(e)}",
+                    inline=False,
                 )
 
-            # Tether channel
-            addsheettethergeneric(gspread_client, curr_sheet_link, ctx.guild, channel)
+                await discord_utils.send_message(ctx, embed)
+                worksheets[idx] = None
+                continue
 
-            # Update channel topic
-            await channel.edit(topic=f"Tab Link - {final_sheet_link}")
-
-            # Send messages to channel
-            try:
+        # Execute single batch update for ALL changes
+        try:
+            await gspread_client.batch_update(spreadsheet, batch.build())
+        except gspread.exceptions.APIError as e:
+            if hasattr(e, "response"):
+                error_json = e.response.json()
+                error_message = error_json.get("error", {}).get("message")
                 embed = discord_utils.create_embed()
                 embed.add_field(
-                    name="Success",
-                    value=f"Tab **{tab_name}** has been created at [{newsheet.spreadsheet.title}]({final_sheet_link}) spreadsheet.",
+                    name="Failed",
+                    value=f"Unknown GSheets API Error - `{error_message}`",
                     inline=False,
                 )
-                msg = await channel.send(embed=embed)
-                await discord_utils.pin_message(msg)
-
-                if puzzle_url:
-                    embed = discord_utils.create_embed()
-                    embed.description = puzzle_url
-                    msg2 = await channel.send(embed=embed)
-                    embed_or_none = await discord_utils.pin_message(msg2)
-                    if embed_or_none is None:
-                        await msg2.add_reaction(emoji.emojize(":pushpin:"))
-            except Exception:
-                pass
+                await discord_utils.send_message(ctx, embed)
+                return []
         except Exception as e:
             embed = discord_utils.create_embed()
             embed.add_field(
                 name="Failed",
-                value=f"Error processing `{puzzle_name}`. Error: {str(e)}",
+                value=f"Could not update sheets. Error: {str(e)}",
                 inline=False,
             )
-
             await discord_utils.send_message(ctx, embed)
-            worksheets[idx] = None
-            continue
+            return []
 
-    # Execute single batch update for ALL changes
-    try:
-        spreadsheet.batch_update(batch.build())
-    except gspread.exceptions.APIError as e:
-        if hasattr(e, "response"):
-            error_json = e.response.json()
-            error_message = error_json.get("error", {}).get("message")
-            embed = discord_utils.create_embed()
-            embed.add_field(
-                name="Failed",
-                value=f"Unknown GSheets API Error - `{error_message}`",
-                inline=False,
+        # Keep the shared Overview snapshot in sync with the rows we just added
+        for idx, (puzzle_name, _, _, channel) in enumerate(channels):
+            if worksheets[idx] is None:
+                continue
+            row_num = first_empty_row + idx
+            overview_wrapper.set_cell_value(puzzle_name_col + str(row_num), puzzle_name)
+            overview_wrapper.set_cell_value(
+                discord_channel_id_col + str(row_num), str(channel.id)
+            )
+            overview_wrapper.set_cell_value(
+                sheet_tab_id_col + str(row_num), str(worksheets[idx].id)
+            )
+            overview_wrapper.set_cell_value(
+                status_col + str(row_num), sheets_constants.UNSTARTED_NAME
             )
-            await discord_utils.send_message(ctx, embed)
-            return []
-    except Exception as e:
-        embed = discord_utils.create_embed()
-        embed.add_field(
-            name="Failed",
-            value=f"Could not update sheets. Error: {str(e)}",
-            inline=False,
-        )
-        await discord_utils.send_message(ctx, embed)
-        return []
 
     # Return results
     results = []
@@ -30,7 +30,7 @@ class LionCog(commands.Cog, name="Lion"):
         self.bot = bot
         self.lock = asyncio.Lock()
         self.gdrive_credentials = google_utils.get_gdrive_credentials()
-        self.gspread_client = google_utils.create_gspread_client()
+        self.gspread_client = google_utils.ASYNC_GSPREAD_CLIENT
 
     ################################
     # SOLVED COMMANDS WITHOUT LION #
@@ -131,10 +131,7 @@ class LionCog(commands.Cog, name="Lion"):
                 candidates.append(f"{cat_name} archive")
                 cat_name, _, _ = cat_name.rpartition(" ")
 
-            for cand in candidates:
-                archive_category = await discord_utils.find_category(ctx, cand)
-                if archive_category:
-                    break
+            archive_category = await discord_utils.find_first_category(ctx, candidates)
 
         else:
             archive_category = await discord_utils.find_category(ctx, archive_name)
@@ -223,10 +220,15 @@ class LionCog(commands.Cog, name="Lion"):
     ########################
 
     async def get_overview(
-        self, ctx: commands.Context, sheet_link: str
+        self,
+        ctx: commands.Context,
+        sheet_link: str,
+        max_age: float = sheet_utils.OVERVIEW_SNAPSHOT_TTL,
     ) -> sheet_utils.OverviewSheet | None:
         try:
-            overview_sheet = sheet_utils.OverviewSheet(self.gspread_client, sheet_link)
+            overview_sheet = await sheet_utils.OverviewSheet.open(
+                self.gspread_client, sheet_link, max_age=max_age
+            )
 
         # Error when we can't open the curr sheet link
         except gspread.exceptions.APIError as e:
@@ -269,7 +271,9 @@ class LionCog(commands.Cog, name="Lion"):
             if result is None:
                 return None
             curr_sheet_link = str(result.sheet_link)
-            return sheet_utils.OverviewSheet(self.gspread_client, curr_sheet_link)
+            return await sheet_utils.OverviewSheet.open(
+                self.gspread_client, curr_sheet_link
+            )
         except Exception:
             return None
 
@@ -279,8 +283,8 @@ class LionCog(commands.Cog, name="Lion"):
         curr_sheet = None
         overview = None
         try:
-            curr_sheet = self.gspread_client.open_by_url(sheet_link)
-            overview = curr_sheet.worksheet("Overview")
+            curr_sheet = await self.gspread_client.open_by_url(sheet_link)
+            overview = await self.gspread_client.worksheet(curr_sheet, "Overview")
         # Error when we can't open the curr sheet link
         except gspread.exceptions.APIError as e:
             error_json = e.response.json()
@@ -311,7 +315,9 @@ class LionCog(commands.Cog, name="Lion"):
 
         curr_chan_or_cat_cell = None
         # Search first column for the channel
-        curr_chan_or_cat_cell = overview.find(str(curr_chan_id), in_column=1)
+        curr_chan_or_cat_cell = await self.gspread_client.run(
+            overview.find, str(curr_chan_id), in_column=1
+        )
         if curr_chan_or_cat_cell is None:
             # If there is no tether for the specific channel, check if there is one for the category.
             embed = discord_utils.create_embed()
@@ -500,19 +506,17 @@ class LionCog(commands.Cog, name="Lion"):
 
             tab_ans_loc = sheets_constants.TAB_ANSWER_LOCATION
             tab_cell_label = sheets_constants.SHEET_TAB_ID_COLUMN + str(row_to_find)
-            tab_id = overview_sheet.get_cell_value(tab_cell_label)
-            puzzle_tab = overview_sheet.spreadsheet.get_worksheet_by_id(int(tab_id))
+            # The tab's id is all we need from the puzzle tab, so there's no need to fetch it
+            tab_id = int(overview_sheet.get_cell_value(tab_cell_label))
 
             batch_update_builder = batch_update_utils.BatchUpdateBuilder()
 
             if answer is not None and status_info.get("update_ans"):
                 batch_update_builder.update_cell_by_label(
-                    puzzle_tab.id, tab_ans_loc, answer.upper()
+                    tab_id, tab_ans_loc, answer.upper()
                 )
             elif not status_info.get("update_ans"):
-                batch_update_builder.update_cell_by_label(
-                    puzzle_tab.id, tab_ans_loc, ""
-                )
+                batch_update_builder.update_cell_by_label(tab_id, tab_ans_loc, "")
 
             curr_status = overview_sheet.get_cell_value(status_col + str(row_to_find))
             curr_stat_info = sheets_constants.status_dict.get(curr_status)
@@ -527,44 +531,30 @@ class LionCog(commands.Cog, name="Lion"):
             color = status_info.get("color")
             batch_update_builder.color_update(tab_id, color)
 
-            try:
-                overview_sheet.worksheet.spreadsheet.batch_update(
-                    batch_update_builder.build()
+            # The sheet write and the channel rename don't depend on each other, so they run at the same time
+            stages = [
+                self.update_status_sheet(
+                    overview_sheet,
+                    batch_update_builder,
+                    status_col + str(row_to_find),
+                    status,
                 )
-            except gspread.exceptions.APIError as e:
-                error_json = e.response.json()
-                error_status = error_json.get("error", {}).get("status")
-                if error_status == "PERMISSION_DENIED":
-                    embed.add_field(
-                        name="Failed",
-                        value="Could not update the sheet.",
-                        inline=False,
-                    )
-                else:
-                    raise e
-
-            embed.add_field(
-                name="Success",
-                value="The sheet was successfully updated.",
-                inline=False,
-            )
-
-            add_prefix = status_info.get("prefix")
-            past_prefix = curr_stat_info.get("prefix")
+            ]
+            if status != curr_status:
+                stages.append(
+                    self.update_status_channel(ctx, status_info, curr_stat_info)
+                )
+            results = await asyncio.gather(*stages)
 
-            if status == curr_status:
+            sheet_embed = results[0]
+            # Same status as before, so there's nothing to say unless the sheet couldn't be updated
+            if status == curr_status and sheet_embed.fields[0].name == "Success":
                 await ctx.message.add_reaction(emoji.emojize(":check_mark_button:"))
                 return
 
-            if add_prefix:
-                prefix_name = status_info.get("prefix_name")
-
-            if past_prefix and not add_prefix:
-                new_embed = await solved_utils.status_remove(ctx)
-                embed = discord_utils.merge_embed(embed, new_embed)
-            if add_prefix:
-                new_embed = await solved_utils.status_channel(ctx, prefix_name)
-                embed = discord_utils.merge_embed(embed, new_embed)
+            for new_embed in results:
+                if new_embed is not None:
+                    embed = discord_utils.merge_embed(embed, new_embed)
 
             await ctx.message.add_reaction(emoji.emojize(":check_mark_button:"))
             await discord_utils.send_message(ctx, embed)
@@ -581,6 +571,55 @@ class LionCog(commands.Cog, name="Lion"):
                 await discord_utils.send_message(ctx, embed)
                 return
 
+    async def update_status_sheet(
+        self,
+        overview_sheet: sheet_utils.OverviewSheet,
+        batch_update_builder: batch_update_utils.BatchUpdateBuilder,
+        status_cell: str,
+        status: str,
+    ) -> nextcord.Embed:
+        """The sheet half of statuslion: write the new status (and answer, and tab colour)"""
+        embed = discord_utils.create_embed()
+        try:
+            await self.gspread_client.batch_update(
+                overview_sheet.spreadsheet, batch_update_builder.build()
+            )
+            # Keep the shared Overview snapshot in sync with what we just wrote
+            overview_sheet.set_cell_value(status_cell, status)
+        except gspread.exceptions.APIError as e:
+            error_json = e.response.json()
+            error = error_json.get("error", {})
+            embed.add_field(
+                name="Failed",
+                value="Could not update the sheet."
+                if error.get("status") == "PERMISSION_DENIED"
+                else f"Unknown GSheets API Error - `{error.get('message')}`",
+                inline=False,
+            )
+            return embed
+
+        embed.add_field(
+            name="Success",
+            value="The sheet was successfully updated.",
+            inline=False,
+        )
+        return embed
+
+    async def update_status_channel(
+        self, ctx: commands.Context, status_info: dict, curr_stat_info: dict
+    ) -> nextcord.Embed | None:
+        """The Discord half of statuslion: swap the channel's status prefix. None if it doesn't need changing"""
+        add_prefix = status_info.get("prefix")
+        past_prefix = curr_stat_info.get("prefix")
+
+        if add_prefix:
+            return await solved_utils.status_channel(
+                ctx, status_info.get("prefix_name")
+            )
+        if past_prefix:
+            return await solved_utils.status_remove(ctx)
+        return None
+
     async def sheetmta_generic(self, ctx: commands.Context):
         """Just handles the sheet aspect of mtalion, moving the tab associated with ctx.channel to the end of the sheet"""
         embed = discord_utils.create_embed()
@@ -618,7 +657,9 @@ class LionCog(commands.Cog, name="Lion"):
         tab_id = overview_sheet.get_cell_value(sheet_tab_id_col + str(row_to_find))
 
         try:
-            worksheets = overview_sheet.spreadsheet.worksheets()
+            worksheets = await self.gspread_client.worksheets(
+                overview_sheet.spreadsheet
+            )
             puzzle_tab = next((w for w in worksheets if w.id == int(tab_id)), None)
             if puzzle_tab is None:
                 embed.add_field(
@@ -627,7 +668,7 @@ class LionCog(commands.Cog, name="Lion"):
                     inline=False,
                 )
             else:
-                puzzle_tab.update_index(len(worksheets))
+                await self.gspread_client.update_index(puzzle_tab, len(worksheets))
                 embed.add_field(
                     name="Success",
                     value="Moved tab to the end of the sheet!",
@@ -692,92 +733,108 @@ class LionCog(commands.Cog, name="Lion"):
 
             tab_name = chan_name.replace("#", "").replace("-", " ")
 
-            sheet = self.gspread_client.open_by_url(curr_sheet_link)
-            try:
-                overview_sheet = await self.get_overview(ctx, curr_sheet_link)
-            # Error when the sheet has no Overview tab
-            except gspread.exceptions.WorksheetNotFound:
-                embed.add_field(
-                    name="Failed",
-                    value=f"The [sheet]({curr_sheet_link}) has no tab named 'Overview'. "
-                    f"Did you forget to add one?",
-                    inline=False,
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
+            async with sheet_utils.OverviewSheet.append_lock(curr_sheet_link):
+                try:
+                    # Always re-read here, since we're about to append a row after the last one
+                    overview_sheet = await self.get_overview(
+                        ctx, curr_sheet_link, max_age=0
+                    )
+                # Error when the sheet has no Overview tab
+                except gspread.exceptions.WorksheetNotFound:
+                    embed.add_field(
+                        name="Failed",
+                        value=f"The [sheet]({curr_sheet_link}) has no tab named 'Overview'. "
+                        f"Did you forget to add one?",
+                        inline=False,
+                    )
+                    await discord_utils.send_message(ctx, embed)
+                    return
 
-            if not overview_sheet:
-                return
+                if not overview_sheet:
+                    return
 
-            overview_id = overview_sheet.worksheet.id
-            first_empty = len(overview_sheet.overview_data) + 1
+                overview_id = overview_sheet.worksheet.id
+                first_empty = len(overview_sheet.overview_data) + 1
 
-            discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
-            sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
-            puzz_name_col = overview_sheet.get_cell_value(
-                sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
-            )
-            status_col = overview_sheet.get_cell_value(
-                sheets_constants.STATUS_COLUMN_LOCATION
-            )
-            answer_col = overview_sheet.get_cell_value(
-                sheets_constants.ANSWER_COLUMN_LOCATION
-            )
+                discord_channel_id_col = sheets_constants.DISCORD_CHANNEL_ID_COLUMN
+                sheet_tab_id_col = sheets_constants.SHEET_TAB_ID_COLUMN
+                puzz_name_col = overview_sheet.get_cell_value(
+                    sheets_constants.PUZZLE_NAME_COLUMN_LOCATION
+                )
+                status_col = overview_sheet.get_cell_value(
+                    sheets_constants.STATUS_COLUMN_LOCATION
+                )
+                answer_col = overview_sheet.get_cell_value(
+                    sheets_constants.ANSWER_COLUMN_LOCATION
+                )
 
-            final_sheet_link = curr_sheet_link + "/edit#gid=" + str(newsheet.id)
+                final_sheet_link = curr_sheet_link + "/edit#gid=" + str(newsheet.id)
 
-            chan_name_for_sheet_ref = chan_name.replace("'", "''")
-            batch_update_builder = batch_update_utils.BatchUpdateBuilder()
+                chan_name_for_sheet_ref = chan_name.replace("'", "''")
+                batch_update_builder = batch_update_utils.BatchUpdateBuilder()
 
-            batch_update_builder.update_cell_by_label(
-                sheet_id=overview_id,
-                label=puzz_name_col + str(first_empty),
-                value=f'=HYPERLINK("{final_sheet_link}", "{chan_name}")',
-                is_formula=True,
-            )
+                batch_update_builder.update_cell_by_label(
+                    sheet_id=overview_id,
+                    label=puzz_name_col + str(first_empty),
+                    value=f'=HYPERLINK("{final_sheet_link}", "{chan_name}")',
+                    is_formula=True,
+                )
 
-            batch_update_builder.update_cell_by_label(
-                sheet_id=overview_id,
-                label=discord_channel_id_col + str(first_empty),
-                value=str(new_chan.id),
-            )
+                batch_update_builder.update_cell_by_label(
+                    sheet_id=overview_id,
+                    label=discord_channel_id_col + str(first_empty),
+                    value=str(new_chan.id),
+                )
 
-            batch_update_builder.update_cell_by_label(
-                sheet_id=overview_id,
-                label=sheet_tab_id_col + str(first_empty),
-                value=str(newsheet.id),
-            )
+                batch_update_builder.update_cell_by_label(
+                    sheet_id=overview_id,
+                    label=sheet_tab_id_col + str(first_empty),
+                    value=str(newsheet.id),
+                )
 
-            unstarted = sheets_constants.UNSTARTED_NAME
-            batch_update_builder.update_cell_by_label(
-                sheet_id=overview_id,
-                label=status_col + str(first_empty),
-                value=unstarted,
-            )
+                unstarted = sheets_constants.UNSTARTED_NAME
+                batch_update_builder.update_cell_by_label(
+                    sheet_id=overview_id,
+                    label=status_col + str(first_empty),
+                    value=unstarted,
+                )
 
-            batch_update_builder.unhide_sheet(sheet_id=newsheet.id)
+                batch_update_builder.unhide_sheet(sheet_id=newsheet.id)
 
-            chan_name_for_sheet_ref = tab_name.replace("'", "''")
-            tab_ans_loc = sheets_constants.TAB_ANSWER_LOCATION
-            chan_name_loc = sheets_constants.TAB_CHAN_NAME_LOCATION
-            url_loc = sheets_constants.TAB_URL_LOCATION
+                chan_name_for_sheet_ref = tab_name.replace("'", "''")
+                tab_ans_loc = sheets_constants.TAB_ANSWER_LOCATION
+                chan_name_loc = sheets_constants.TAB_CHAN_NAME_LOCATION
+                url_loc = sheets_constants.TAB_URL_LOCATION
 
-            batch_update_builder.update_cell_by_label(
-                sheet_id=overview_id,
-                label=answer_col + str(first_empty),
-                value=f"='{chan_name_for_sheet_ref}'!{tab_ans_loc}",
-                is_formula=True,
-            )
+                batch_update_builder.update_cell_by_label(
+                    sheet_id=overview_id,
+                    label=answer_col + str(first_empty),
+                    value=f"='{chan_name_for_sheet_ref}'!{tab_ans_loc}",
+                    is_formula=True,
+                )
 
-            batch_update_builder.update_cell_by_label(
-                sheet_id=newsheet.id, label=chan_name_loc, value=chan_name
-            )
-            if url:
                 batch_update_builder.update_cell_by_label(
-                    sheet_id=newsheet.id, label=url_loc, value=url
+                    sheet_id=newsheet.id, label=chan_name_loc, value=chan_name
                 )
+                if url:
+                    batch_update_builder.update_cell_by_label(
+                        sheet_id=newsheet.id, label=url_loc, value=url
+                    )
 
-            sheet.batch_update(batch_update_builder.build())
+                await self.gspread_client.batch_update(
+                    overview_sheet.spreadsheet, batch_update_builder.build()
+                )
+                # Keep the shared Overview snapshot in sync with the row we just added
+                overview_sheet.set_cell_value(
+                    puzz_name_col + str(first_empty), chan_name
+                )
+                overview_sheet.set_cell_value(
+                    discord_channel_id_col + str(first_empty), str(new_chan.id)
+                )
+                overview_sheet.set_cell_value(
+                    sheet_tab_id_col + str(first_empty), str(newsheet.id)
+                )
+                overview_sheet.set_cell_value(status_col + str(first_empty), unstarted)
 
             await ctx.message.add_reaction(emoji.emojize(":check_mark_button:"))
         except gspread.exceptions.APIError as e:
@@ -1053,7 +1110,7 @@ class LionCog(commands.Cog, name="Lion"):
     async def validate_template(self, ctx: commands.Context, proposed_sheet):
         embed = discord_utils.create_embed()
 
-        proposed_template = sheet_utils.get_sheet_from_key_or_link(
+        proposed_template = await sheet_utils.get_sheet_from_key_or_link(
             self.gspread_client, proposed_sheet
         )
 
@@ -1069,69 +1126,38 @@ class LionCog(commands.Cog, name="Lion"):
 
         curr_link = proposed_template.url
 
-        # Make sure the template tab exists on the sheet.
-        try:
-            curr_sheet = self.gspread_client.open_by_url(curr_link)
-            _template_id = curr_sheet.worksheet("Template").id
-        # Error when we can't open the curr sheet link
-        except gspread.exceptions.APIError as e:
-            error_json = e.response.json()
-            error_status = error_json.get("error", {}).get("status")
-            if error_status == "PERMISSION_DENIED":
+        # Make sure the Template, Meta Template and Overview tabs exist on the sheet.
+        # The sheet's tab metadata is cached, so this only costs one fetch for all three tabs
+        for tab_name in ["Template", "Meta Template", "Overview"]:
+            try:
+                await self.gspread_client.worksheet(proposed_template, tab_name)
+            # Error when we can't open the curr sheet link
+            except gspread.exceptions.APIError as e:
+                error_json = e.response.json()
+                error_status = error_json.get("error", {}).get("status")
+                if error_status == "PERMISSION_DENIED":
+                    embed = discord_utils.create_embed()
+                    embed.add_field(
+                        name="Failed",
+                        value=f"I'm unable to open the tethered [sheet]({curr_link}). "
+                        f"Did the permissions change?",
+                        inline=False,
+                    )
+                    await discord_utils.send_message(ctx, embed)
+                    return None
+                else:
+                    raise e
+            # Error when the sheet is missing one of the tabs
+            except gspread.exceptions.WorksheetNotFound:
                 embed = discord_utils.create_embed()
                 embed.add_field(
                     name="Failed",
-                    value=f"I'm unable to open the tethered [sheet]({curr_link}). "
-                    f"Did the permissions change?",
+                    value=f"The [sheet]({curr_link}) has no tab named '{tab_name}'. "
+                    f"Did you forget to add one?",
                     inline=False,
                 )
                 await discord_utils.send_message(ctx, embed)
                 return None
-            else:
-                raise e
-        # Error when the sheet has no template tab
-        except gspread.exceptions.WorksheetNotFound:
-            embed = discord_utils.create_embed()
-            embed.add_field(
-                name="Failed",
-                value=f"The [sheet]({curr_link}) has no tab named 'Template'. "
-                f"Did you forget to add one?",
-                inline=False,
-            )
-            await discord_utils.send_message(ctx, embed)
-            return None
-
-        # Make sure the Meta Template tab exists on the sheet.
-        try:
-            curr_sheet = self.gspread_client.open_by_url(curr_link)
-            _overview_id = curr_sheet.worksheet("Meta Template").id
-        # Error when the sheet has no Meta Template tab
-        except gspread.exceptions.WorksheetNotFound:
-            embed = discord_utils.create_embed()
-            embed.add_field(
-                name="Failed",
-                value=f"The [sheet]({curr_link}) has no tab named 'Meta Template'. "
-                f"Did you forget to add one?",
-                inline=False,
-            )
-            await discord_utils.send_message(ctx, embed)
-            return None
-
-        # Make sure the Overview tab exists on the sheet.
-        try:
-            curr_sheet = self.gspread_client.open_by_url(curr_link)
-            _overview_id = curr_sheet.worksheet("Overview").id
-        # Error when the sheet has no Overview tab
-        except gspread.exceptions.WorksheetNotFound:
-            embed = discord_utils.create_embed()
-            embed.add_field(
-                name="Failed",
-                value=f"The [sheet]({curr_link}) has no tab named 'Overview'. "
-                f"Did you forget to add one?",
-                inline=False,
-            )
-            await discord_utils.send_message(ctx, embed)
-            return None
 
         return proposed_template
 
@@ -1262,7 +1288,7 @@ class LionCog(commands.Cog, name="Lion"):
         if await self.validate_template(ctx, new_sheet.url) is None:
             return
 
-        proposed_sheet = sheet_utils.addsheettethergeneric(
+        proposed_sheet = await sheet_utils.addsheettethergeneric(
             self.gspread_client, new_sheet.url, ctx.guild, cat
         )
 
@@ -1338,7 +1364,7 @@ class LionCog(commands.Cog, name="Lion"):
         overview = None
 
         try:
-            overview = sheet.worksheet("Overview")
+            overview = await self.gspread_client.worksheet(sheet, "Overview")
         # Error when the sheet has no Overview tab
         except gspread.exceptions.WorksheetNotFound:
             embed = discord_utils.create_embed()
@@ -1352,7 +1378,7 @@ class LionCog(commands.Cog, name="Lion"):
             return None
 
         overview_hunturl_loc = sheets_constants.OVERVIEW_HUNTURL_LOCATION
-        overview.update_acell(label=overview_hunturl_loc, value=hunturl)
+        await self.gspread_client.update_acell(overview, overview_hunturl_loc, hunturl)
         return True
 
     # @command_predicates.is_verified()
@@ -1395,13 +1421,13 @@ class LionCog(commands.Cog, name="Lion"):
                 f_id = ""
 
         sheet = result.sheet_link
-        curr_sheet = self.gspread_client.open_by_url(sheet)
+        curr_sheet = await self.gspread_client.open_by_url(sheet)
 
         new_sheet = ""
 
         try:
-            new_sheet = self.gspread_client.copy(
-                file_id=curr_sheet.id,
+            new_sheet = await self.gspread_client.copy(
+                curr_sheet.id,
                 title=newname,
                 copy_permissions=True,
                 folder_id=(f_id or None),
@@ -1449,7 +1475,7 @@ class LionCog(commands.Cog, name="Lion"):
         if await self.validate_template(ctx, sheet_key_or_link) is None:
             return
 
-        proposed_sheet = sheet_utils.addsheettethergeneric(
+        proposed_sheet = await sheet_utils.addsheettethergeneric(
             self.gspread_client, sheet_key_or_link, ctx.guild, ctx.channel.category
         )
 
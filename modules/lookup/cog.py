@@ -1,7 +1,6 @@
-import googlesearch
+import aiohttp
+import asyncio
 import nextcord
-import urllib
-import re
 from utils.paging_utils import Pages
 from nextcord.ext import commands
 from utils import discord_utils, logging_utils
@@ -20,6 +19,9 @@ class LookupCog(commands.Cog, name="Lookup"):
     def __init__(self, bot):
         self.bot = bot
 
+    def cog_unload(self):
+        asyncio.ensure_future(lookup_utils.close_nutrimatic_session())
+
     @commands.command(name="search")
     async def search(self, ctx, target_site: str, *args):
         """
@@ -46,32 +48,14 @@ class LookupCog(commands.Cog, name="Lookup"):
             is_google_search = False
 
         original_query = " ".join(args)
-        # Don't add google to the query but add any other target site for easier access/SEO
-        if not is_google_search:
-            query_with_site = original_query + " " + target_site
-        else:
-            query_with_site = original_query
-        # Dude this loop is going to be horrible wtf
-        # If google:
-        #   Store all results as a list and print them out line by line in an embed
-        # If not google:
-        #   Find the first result that matches the target site and return that
-        #   If we can't find it, return the google query I think
-        results = []
-        for result in googlesearch.search(
-            query_with_site,
-            num=lookup_constants.QUERY_NUM,
-            stop=lookup_constants.QUERY_NUM,
-            pause=lookup_constants.PAUSE_TIME,
-        ):
-            if target_site in result:
-                embed.add_field(
-                    name=f"{target_site.capitalize()} Result for {original_query}",
-                    value=result,
-                )
-                await discord_utils.send_message(ctx, embed)
-                return
-            results.append(result)
+        results = await lookup_utils.search_query(original_query, target_site)
+        if not is_google_search and len(results) == 1 and target_site in results[0]:
+            embed.add_field(
+                name=f"{target_site.capitalize()} Result for {original_query}",
+                value=results[0],
+            )
+            await discord_utils.send_message(ctx, embed)
+            return
         if is_google_search:
             embed.add_field(
                 name=f"{target_site.capitalize()} Result for {original_query}",
@@ -96,7 +80,7 @@ class LookupCog(commands.Cog, name="Lookup"):
         await logging_utils.log_command("google", ctx.guild, ctx.channel, ctx.author)
         embed = discord_utils.create_embed()
 
-        results = lookup_utils.search_query(" ".join(args))
+        results = await lookup_utils.search_query(" ".join(args))
 
         embed.add_field(
             name=f"Google Result for {' '.join(args)}", value=f"{chr(10).join(results)}"
@@ -113,7 +97,7 @@ class LookupCog(commands.Cog, name="Lookup"):
         await logging_utils.log_command("wikipedia", ctx.guild, ctx.channel, ctx.author)
         embed = discord_utils.create_embed()
 
-        results = lookup_utils.search_query(
+        results = await lookup_utils.search_query(
             " ".join(args), target_site=lookup_constants.WIKI
         )
 
@@ -141,15 +125,7 @@ class LookupCog(commands.Cog, name="Lookup"):
         query = query.replace("\\", "")
 
         query_initial = query[:]
-        query = (
-            query_initial.replace("&", "%26")
-            .replace("+", "%2B")
-            .replace("#", "%23")
-            .replace(" ", "+")
-        )  # html syntax
-        url = "https://nutrimatic.org/?q=" + query + "&go=Go"
-        text = urllib.request.urlopen(url).read()
-        text1 = text.decode()
+        url = lookup_utils.nutrimatic_url(query_initial)
 
         # set up embed template
         embed = nextcord.Embed(
@@ -157,43 +133,26 @@ class LookupCog(commands.Cog, name="Lookup"):
         )
         embed.set_footer(text="Query: " + query_initial)
 
-        # parse for solution list
-        posA = [m.start() for m in re.finditer("<span", text1)]
-        posB = [m.start() for m in re.finditer("</span", text1)]
+        try:
+            solutions, weights, message = await lookup_utils.nutrimatic_search(
+                query_initial
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            embed.description = (
+                "Sorry! Nutrimatic didn't respond. Try the link instead."
+            )
+            await discord_utils.send_message(ctx, embed)
+            return
 
         # check for no solutions, send error
-        if not posA:
-            final = "None"
-            errA = [m.start() for m in re.finditer("<b>", text1)]
-            errB = [m.start() for m in re.finditer("</b>", text1)]
-            final = text1[errA[-1] + 3 : errB[-1]]
-            if final.find("font") != -1:
-                errA = [m.start() for m in re.finditer("<font", text1)]
-                errB = [m.start() for m in re.finditer("</font>", text1)]
-                final = text1[errA[-1] + 16 : errB[-1]]
-            embed.description = final
+        if not solutions:
+            embed.description = message if message is not None else "None"
             await discord_utils.send_message(ctx, embed)
             return
 
         # check for ending error message, usually bolded
         # max number of solutions on a nutrimatic page is 100
-        finalend = None
-        if len(posA) < 100:
-            try:
-                errA = [m.start() for m in re.finditer("<b>", text1)]
-                errB = [m.start() for m in re.finditer("</b>", text1)]
-                finalend = text1[errA[-1] + 3 : errB[-1]]
-            except:
-                pass
-
-        # prep solution and weights for paginator
-        solutions = []
-        weights = []
-        for n in range(0, min(len(posA), 200)):
-            word = text1[posA[n] + 36 : posB[n]]
-            size = float(text1[posA[n] + 23 : posA[n] + 32])
-            solutions.append(word)
-            weights.append(size)
+        finalend = message if len(solutions) < 100 else None
 
         p = Pages(
             ctx, solutions=solutions, weights=weights, embedTemp=embed, endflag=finalend
@@ -1,3 +1,5 @@
+import os
+
 ################
 #### LOOKUP ####
 ################
@@ -17,3 +19,15 @@ REGISTERED_SITES = {
     GOOGLE: GOOGLE,
     HPWIKI: HPWIKISITE,
 }
+# How long (seconds) search results are reused, and how many queries we keep results for
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_SIZE = 256
+
+# Point this at a local stand-in server (serving canned nutrimatic HTML) to test/benchmark without hitting nutrimatic.org
+NUTRIMATIC_URL = os.getenv("NUTRIMATIC_URL", "https://nutrimatic.org/")
+# Seconds we wait on nutrimatic before giving up
+NUTRIMATIC_TIMEOUT = 20
+# How many parsed nutrimatic results we keep around
+NUTRIMATIC_CACHE_SIZE = 128
+# Max number of solutions we show. A nutrimatic page has at most 100
+NUTRIMATIC_MAX_SOLUTIONS = 200
@@ -1,8 +1,107 @@
+import aiohttp
+import asyncio
 import googlesearch
+import re
+import time
+import urllib.parse
+from collections import OrderedDict
 from modules.lookup import lookup_constants
 
+# One pass over a nutrimatic page picks up both the solution spans and the bolded end/error message
+NUTRIMATIC_TOKEN_REGEX = re.compile(
+    r"<span[^>]*?font-size:\s*([\d.]+)em[^>]*>(.*?)</span>|<b>(.*?)</b>", re.DOTALL
+)
+NUTRIMATIC_FONT_REGEX = re.compile(r"<font[^>]*>(.*?)</font>", re.DOTALL)
 
-def search_query(original_query, target_site="google"):
+# Shared across all nutrimatic lookups so we reuse connections. Created on first use
+nutrimatic_session = None
+# normalized query -> (solutions, weights, message)
+nutrimatic_cache = OrderedDict()
+
+
+class GoogleSearchBackend:
+    """Searches Google with googlesearch. Blocking, so SearchClient runs it in a thread"""
+
+    def search(self, query: str) -> list:
+        return list(
+            googlesearch.search(
+                query,
+                num=lookup_constants.QUERY_NUM,
+                stop=lookup_constants.QUERY_NUM,
+                pause=lookup_constants.PAUSE_TIME,
+            )
+        )
+
+
+class FixtureSearchBackend:
+    """Serves canned results (query -> list of urls) instead of searching Google. For local testing"""
+
+    def __init__(self, results: dict):
+        self.results = results
+
+    def search(self, query: str) -> list:
+        return list(self.results.get(query, []))
+
+
+class SearchClient:
+    """
+    Runs searches on a backend (anything with a blocking search(query) -> list of urls) without blocking the event loop.
+
+    Identical queries that come in while one is already running wait on that search instead of starting their own,
+    and results are cached for SEARCH_CACHE_TTL seconds (at most SEARCH_CACHE_SIZE queries, least recently used dropped first).
+    """
+
+    def __init__(
+        self,
+        backend,
+        cache_ttl: float = lookup_constants.SEARCH_CACHE_TTL,
+        cache_size: int = lookup_constants.SEARCH_CACHE_SIZE,
+    ):
+        self.backend = backend
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # query -> (time fetched, results)
+        self.cache = OrderedDict()
+        # query -> task running the search
+        self.in_flight = {}
+
+    def set_backend(self, backend):
+        self.backend = backend
+        self.cache.clear()
+
+    async def search(self, query: str) -> list:
+        cached = self.cache.get(query)
+        if cached is not None:
+            if time.monotonic() - cached[0] <= self.cache_ttl:
+                self.cache.move_to_end(query)
+                return list(cached[1])
+            del self.cache[query]
+
+        search_task = self.in_flight.get(query)
+        if search_task is None:
+            search_task = asyncio.ensure_future(
+                asyncio.to_thread(self.backend.search, query)
+            )
+            self.in_flight[query] = search_task
+            search_task.add_done_callback(lambda _: self.in_flight.pop(query, None))
+            search_task.add_done_callback(lambda task: self._add_to_cache(query, task))
+        # Shielded so one command being cancelled doesn't cancel the search for everyone else waiting on it
+        return list(await asyncio.shield(search_task))
+
+    def _add_to_cache(self, query: str, search_task: asyncio.Task):
+        # Don't cache failed searches
+        if search_task.cancelled() or search_task.exception() is not None:
+            return
+        self.cache[query] = (time.monotonic(), search_task.result())
+        self.cache.move_to_end(query)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+
+SEARCH_CLIENT = SearchClient(GoogleSearchBackend())
+
+
+async def search_query(original_query, target_site="google"):
     """
     Command to search the interwebs! (google)
     """
@@ -20,21 +119,80 @@ def search_query(original_query, target_site="google"):
         query = original_query + " " + target_site
     else:
         query = original_query
-    # Dude this loop is going to be horrible wtf
     # If google:
-    #   Store all results as a list and print them out line by line in an embed
+    #   Return all results
     # If not google:
     #   Find the first result that matches the target site and return that
-    #   If we can't find it, return the google query I think
-    results = []
-    for result in googlesearch.search(
-        query,
-        num=lookup_constants.QUERY_NUM,
-        stop=lookup_constants.QUERY_NUM,
-        pause=lookup_constants.PAUSE_TIME,
-    ):
+    #   If we can't find it, return all the google results
+    results = await SEARCH_CLIENT.search(query)
+    for result in results:
         if target_site in result:
             return [result]
-        results.append(result)
 
     return results
+
+
+def nutrimatic_url(query: str) -> str:
+    """Link to the nutrimatic results page for the query"""
+    return (
+        lookup_constants.NUTRIMATIC_URL
+        + "?"
+        + urllib.parse.urlencode({"q": query, "go": "Go"})
+    )
+
+
+def parse_nutrimatic(text: str) -> tuple:
+    """
+    Pull the solutions out of a nutrimatic results page.
+    :return: (solutions, weights, message) where message is the last bolded line on the page
+    (the error if there are no solutions, otherwise something like "No more results"), or None
+    """
+    solutions = []
+    weights = []
+    message = None
+    for match in NUTRIMATIC_TOKEN_REGEX.finditer(text):
+        size, word, bold = match.groups()
+        if bold is not None:
+            message = bold
+        elif len(solutions) < lookup_constants.NUTRIMATIC_MAX_SOLUTIONS:
+            solutions.append(word)
+            weights.append(float(size))
+
+    if message is not None:
+        font = NUTRIMATIC_FONT_REGEX.search(message)
+        if font:
+            message = font.group(1)
+    return solutions, weights, message
+
+
+async def close_nutrimatic_session():
+    global nutrimatic_session
+    if nutrimatic_session is not None:
+        await nutrimatic_session.close()
+        nutrimatic_session = None
+
+
+async def nutrimatic_search(query: str) -> tuple:
+    """
+    Run the query on nutrimatic and parse the results. See parse_nutrimatic.
+    Results are kept in a small LRU cache, since the same query often gets rerun (or paged through) a few times.
+    """
+    global nutrimatic_session
+    query = query.strip()
+    if query in nutrimatic_cache:
+        nutrimatic_cache.move_to_end(query)
+        return nutrimatic_cache[query]
+
+    if nutrimatic_session is None or nutrimatic_session.closed:
+        nutrimatic_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=lookup_constants.NUTRIMATIC_TIMEOUT)
+        )
+    async with nutrimatic_session.get(nutrimatic_url(query)) as response:
+        response.raise_for_status()
+        text = await response.text()
+
+    result = parse_nutrimatic(text)
+    nutrimatic_cache[query] = result
+    if len(nutrimatic_cache) > lookup_constants.NUTRIMATIC_CACHE_SIZE:
+        nutrimatic_cache.popitem(last=False)
+    return result
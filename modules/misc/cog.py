@@ -3,7 +3,7 @@ import os
 from nextcord.ext import commands
 from emoji import EMOJI_DATA, emojize
 import emoji
-from utils import discord_utils, logging_utils, command_predicates
+from utils import discord_utils, emoji_utils, logging_utils, command_predicates
 
 """
 Misc module. A collection of Misc useful/fun commands. Also everything not in any other module.
@@ -57,7 +57,7 @@ class MiscCog(commands.Cog, name="Misc"):
         """Finds the custom emoji mentioned and uses it.
         This command works for normal as well as animated emojis, as long as the bot is in one server with that emoji.
 
-        Can accept multiple emojis delimited by spaces.
+        Can accept multiple emojis delimited by spaces. Custom emoji names aren't case sensitive.
 
         If you say `delete` after the emoji name, it deletes the original message (the message you used to call ~emoji).
 
@@ -117,15 +117,8 @@ class MiscCog(commands.Cog, name="Misc"):
             if emojiname.startswith("<") and emojiname.endswith(
                 ">"
             ):  # custom emoji format
-                try:
-                    emoji_id = int(emojiname.split(":")[-1][:-1])
-                    for guild in self.bot.guilds:
-                        emoji = nextcord.utils.get(guild.emojis, id=emoji_id)
-                        if emoji is not None:
-                            hasurl = True
-                            break
-                except (ValueError, IndexError):
-                    pass
+                emoji = emoji_utils.find_custom_emoji(emojiname)
+                hasurl = emoji is not None
 
             elif (
                 isinstance(emojiname, str) and emojiname in EMOJI_DATA
@@ -141,12 +134,8 @@ class MiscCog(commands.Cog, name="Misc"):
                     emoji = unicode_emoji
                     hasurl = False
                 else:  # try custom emoji
-                    emojiname_clean = emojiname[1:-1]
-                    for guild in self.bot.guilds:
-                        emoji = nextcord.utils.get(guild.emojis, name=emojiname_clean)
-                        if emoji is not None:
-                            hasurl = True
-                            break
+                    emoji = emoji_utils.find_custom_emoji(emojiname, ctx.guild)
+                    hasurl = emoji is not None
 
             else:  # try both unicode and custom emoji
                 emoji_with_colons = f":{emojiname}:"
@@ -156,14 +145,20 @@ class MiscCog(commands.Cog, name="Misc"):
                     emoji = unicode_emoji
                     hasurl = False
                 else:
-                    for guild in self.bot.guilds:
-                        emoji = nextcord.utils.get(guild.emojis, name=emojiname)
-                        if emoji is not None:
-                            hasurl = True
-                            break
+                    emoji = emoji_utils.find_custom_emoji(emojiname, ctx.guild)
+                    hasurl = emoji is not None
 
             if emoji is None:
-                failed_emojis.append(emojiname)
+                # Near misses on a custom emoji name are probably typos
+                suggestions = []
+                if not emojiname.startswith("<"):
+                    suggestions = emoji_utils.EMOJI_INDEX.suggest(emojiname.strip(":"))
+                if suggestions:
+                    failed_emojis.append(
+                        f"{emojiname} (did you mean {', '.join([f'`{name}`' for name in suggestions])}?)"
+                    )
+                else:
+                    failed_emojis.append(emojiname)
             else:
                 emojis.append((emoji, hasurl))
 
@@ -317,8 +312,8 @@ class MiscCog(commands.Cog, name="Misc"):
             value=f"- Use `{ctx.prefix}addperm level role` to add a permission to a role. Keep in mind only server admins or owners can use this command.\n"
             f"- Use `{ctx.prefix}removeperm level role` to remove a permission from a role.\n"
             f"- Example usage: `{ctx.prefix}addperm Solver @everyone`, `{ctx.prefix}addperm Trusted @Mods` etc.\n\n"
-            f"- Note: Even though permission categories *seem* like they're ordered, they're actually not! You may be the owner of the server but you'll still need "
-            f"to assign yourself the Verified/Solver/Trusted roles to use those commands!\n\n",
+            f"- Note: `Trusted` roles can also use `Verified` commands, and `Verified` roles can also use `Solver` commands. "
+            f"But you may be the owner of the server and you'll still need to assign yourself one of those roles to use those commands!\n\n",
             inline=False,
         )
         await discord_utils.send_message(ctx, embed)
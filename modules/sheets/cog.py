@@ -9,7 +9,7 @@ import shutil
 from nextcord.ext import commands
 from nextcord.ext.tasks import loop
 from googleapiclient import discovery
-from sqlalchemy.orm import Session
+from database import repositories
 from utils import sheets_constants
 from utils import discord_utils, google_utils, logging_utils, command_predicates
 from utils import sheet_utils
@@ -29,7 +29,7 @@ class SheetsCog(commands.Cog, name="Sheets"):
         self.bot = bot
         self.lock = asyncio.Lock()
         self.gdrive_credentials = google_utils.get_gdrive_credentials()
-        self.gspread_client = google_utils.create_gspread_client()
+        self.gspread_client = google_utils.ASYNC_GSPREAD_CLIENT
 
     # Reload the google sheet every hour
     @commands.Cog.listener()
@@ -68,7 +68,7 @@ class SheetsCog(commands.Cog, name="Sheets"):
             await discord_utils.send_message(ctx, embed)
             return
 
-        proposed_sheet = sheet_utils.addsheettethergeneric(
+        proposed_sheet = await sheet_utils.addsheettethergeneric(
             self.gspread_client, sheet_key_or_link, ctx.guild, ctx.channel.category
         )
 
@@ -119,7 +119,7 @@ class SheetsCog(commands.Cog, name="Sheets"):
         )
         embed = discord_utils.create_embed()
 
-        proposed_sheet = sheet_utils.addsheettethergeneric(
+        proposed_sheet = await sheet_utils.addsheettethergeneric(
             self.gspread_client, sheet_key_or_link, ctx.guild, ctx.channel
         )
 
@@ -185,11 +185,10 @@ class SheetsCog(commands.Cog, name="Sheets"):
         # If the tethering exists, remove it from the sheet.
         if curr_chan_or_cat_row is not None:
             sheet_link = curr_chan_or_cat_row.sheet_link
-            with Session(database.DATABASE_ENGINE) as session:
-                session.query(database.SheetTethers).filter_by(
-                    channel_or_cat_id=curr_chan_or_cat_row.channel_or_cat_id
-                ).delete()
-                session.commit()
+            await repositories.delete_sheet_tethers(
+                [curr_chan_or_cat_row.channel_or_cat_id]
+            )
+            database.SHEET_TETHERS.pop(curr_chan_or_cat_row.channel_or_cat_id, None)
             if tether_type == sheets_constants.THREAD and curr_thread_id is not None:
                 embed.add_field(
                     name="Success",
@@ -368,7 +367,9 @@ class SheetsCog(commands.Cog, name="Sheets"):
                 return
             sheet_url = tether_db_result.sheet_link
 
-        sheet = sheet_utils.get_sheet_from_key_or_link(self.gspread_client, sheet_url)
+        sheet = await sheet_utils.get_sheet_from_key_or_link(
+            self.gspread_client, sheet_url
+        )
         if sheet is None:
             embed.add_field(
                 name="Failed",
@@ -383,7 +384,7 @@ class SheetsCog(commands.Cog, name="Sheets"):
             request = service.files().export_media(
                 fileId=sheet.id, mimeType=sheets_constants.MIMETYPE
             )
-            response = request.execute()
+            response = await self.gspread_client.run(request.execute)
         except googleapiclient.errors.HttpError:
             embed.add_field(
                 name="Failed",
@@ -422,10 +423,7 @@ class SheetsCog(commands.Cog, name="Sheets"):
     @loop(hours=12)
     async def prune_tethers(self):
         """Function which runs periodically to remove all tethers to channels which have been deleted"""
-        with Session(database.DATABASE_ENGINE) as session:
-            result = session.query(database.SheetTethers)
-
-        listresults = list(result)
+        listresults = await repositories.get_sheet_tethers()
         to_delete = []
         not_in_server = set()
         for x in listresults:
@@ -452,11 +450,10 @@ class SheetsCog(commands.Cog, name="Sheets"):
         print(list(not_in_server))
 
         print()
+        if to_delete:
+            await repositories.delete_sheet_tethers([x[1] for x in to_delete])
         for x in to_delete:
-            session.query(database.SheetTethers).filter_by(
-                server_id=x[0], channel_or_cat_id=x[1]
-            ).delete()
-            session.commit()
+            database.SHEET_TETHERS.pop(x[1], None)
             print(f"Deleting tether at {x[0]} - {x[1]}")
         return to_delete
 
@@ -1,8 +1,11 @@
+import asyncio
+import database
 import geopy
 import datetime
 import os
 import zoneinfo
 
+from database import repositories
 from modules.time import time_utils
 from nextcord.ext import commands
 from utils import logging_utils, discord_utils
@@ -82,7 +85,7 @@ class TimeCog(commands.Cog, name="Time"):
         # Allow long input (e.g. St. Louis, Missouri, USA)
         location = " ".join(args)
 
-        timezone_dict = self.get_tz(location)
+        timezone_dict = await self.get_tz(location)
         # Unable to find the location in the geonames database
         if timezone_dict is None:
             embed.add_field(
@@ -104,8 +107,36 @@ class TimeCog(commands.Cog, name="Time"):
 
         await discord_utils.send_message(ctx, embed)
 
-    def get_tz(self, location: str) -> dict:
-        """Get timezone from a given string"""
+    async def get_tz(self, location: str) -> dict:
+        """
+        Get timezone (and current time there) from a given string.
+        Locations we've looked up before are remembered in the DB, so only new ones need GeoNames.
+        """
+        key = normalize_location(location)
+        timezone_id = database.TIMEZONE_LOCATIONS.get(key)
+        if timezone_id is not None:
+            try:
+                return get_local_time(timezone_id)
+            except zoneinfo.ZoneInfoNotFoundError:
+                pass
+
+        # geopy is blocking (two GeoNames round-trips), so keep it off the event loop
+        tz = await asyncio.to_thread(self.lookup_tz, location)
+        if tz is None:
+            return None
+        database.TIMEZONE_LOCATIONS[key] = tz["timezoneId"]
+        # Only saves us a lookup next time, so don't fail the command over it
+        try:
+            await repositories.set_timezone_location(key, tz["timezoneId"])
+        except Exception as e:
+            print(f"Couldn't save the timezone of {key}: {e}")
+        try:
+            return get_local_time(tz["timezoneId"])
+        except zoneinfo.ZoneInfoNotFoundError:
+            return tz
+
+    def lookup_tz(self, location: str) -> dict:
+        """Get timezone from a given string using GeoNames"""
         tz = None
         try:
             geocode = self.geopy_client.geocode(location)
@@ -116,6 +147,22 @@ class TimeCog(commands.Cog, name="Time"):
         return tz
 
 
+def normalize_location(location: str) -> str:
+    """So `New York`, `new york` and ` New  York` share one cache entry"""
+    return " ".join(location.lower().split())
+
+
+def get_local_time(timezone_id: str) -> dict:
+    """Same shape as the GeoNames timezone response (the parts we use), but computed locally"""
+    now = datetime.datetime.now(zoneinfo.ZoneInfo(timezone_id))
+    return {
+        "timezoneId": timezone_id,
+        "time": now.strftime("%Y-%m-%d %H:%M"),
+        "gmtOffset": (now.utcoffset() - now.dst()).total_seconds() / 3600,
+        "dstOffset": now.utcoffset().total_seconds() / 3600,
+    }
+
+
 def format_time(time):
     """Rearrange time str. Comes in as YYYY-MM-DD HH:MM, change to MM-DD-YYYY HH:MM"""
     date = datetime.datetime.strptime(time, "%Y-%m-%d %H:%M")
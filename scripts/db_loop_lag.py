@@ -0,0 +1,118 @@
+"""
+Measures how much DB queries from coroutines hold up the event loop, with latency added to every DB statement.
+
+"before" runs each query the way the bot used to, with a blocking Session on DATABASE_ENGINE inside the coroutine.
+"after" runs the same queries through database/repositories.py on the async engine.
+Meanwhile a ticker sleeps TICK seconds over and over and records how late it wakes up (the event loop lag).
+
+Usage (from the repo root): python scripts/db_loop_lag.py [--latency 50] [--queries 200] [--concurrency 10]
+Uses a throwaway SQLite DB unless DATABASE_URL is already set.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'loop_lag.db')}"
+    )
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from database import models, repositories  # noqa: E402
+
+# How often (seconds) the ticker checks in on the event loop
+TICK = 0.005
+
+
+def add_latency(engine, latency: float):
+    """Sleep `latency` seconds in whichever thread runs each statement (like a slow network round trip)"""
+
+    def slow_statement(_):
+        time.sleep(latency)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, _):
+        driver_connection = getattr(dbapi_connection, "driver_connection", None)
+        if driver_connection is not None and hasattr(dbapi_connection, "await_"):
+            # aiosqlite runs the statements in its own thread
+            dbapi_connection.await_(
+                driver_connection.set_trace_callback(slow_statement)
+            )
+        else:
+            dbapi_connection.set_trace_callback(slow_statement)
+
+
+async def measure(name: str, query, queries: int, concurrency: int):
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            started_at = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - started_at - TICK)
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def command(i: int):
+        async with slots:
+            await query(i)
+
+    ticker_task = asyncio.create_task(ticker())
+    started_at = time.perf_counter()
+    await asyncio.gather(*[command(i) for i in range(queries)])
+    elapsed = time.perf_counter() - started_at
+    done.set()
+    await ticker_task
+
+    lags.sort()
+    print(
+        f"{name:>6}: {queries} queries in {elapsed:.2f}s | loop lag "
+        f"p50 {statistics.median(lags) * 1000:.1f}ms, "
+        f"p99 {lags[int(len(lags) * 0.99)] * 1000:.1f}ms, "
+        f"max {lags[-1] * 1000:.1f}ms"
+    )
+
+
+async def sync_query(i: int):
+    # What the cogs used to do: a blocking query right on the event loop
+    with Session(models.DATABASE_ENGINE) as session:
+        session.get(models.Prefixes, i)
+
+
+async def async_query(i: int):
+    await repositories.get_prefix(i)
+
+
+async def main(latency: float, queries: int, concurrency: int):
+    for engine in [models.DATABASE_ENGINE, models.ASYNC_DATABASE_ENGINE.sync_engine]:
+        add_latency(engine, latency)
+    # Connections opened before the latency was added wouldn't have it
+    models.DATABASE_ENGINE.dispose()
+    await models.ASYNC_DATABASE_ENGINE.dispose()
+
+    print(
+        f"{latency * 1000:.0f}ms per statement, {concurrency} queries at a time, "
+        f"{models.DATABASE_ENGINE.dialect.name}"
+    )
+    await measure("before", sync_query, queries, concurrency)
+    await measure("after", async_query, queries, concurrency)
+    await models.ASYNC_DATABASE_ENGINE.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--latency", type=float, default=50, help="ms added to every statement"
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency / 1000, args.queries, args.concurrency))
@@ -1,4 +1,25 @@
+import asyncio
 import gspread
+import random
+import time
+
+# Requests that add or remove tabs, and tab properties that change what a tab lookup returns.
+# Any batch update containing these makes cached tab metadata stale.
+TAB_STRUCTURE_REQUESTS = {"addSheet", "duplicateSheet", "deleteSheet"}
+TAB_STRUCTURE_FIELDS = {"title", "index", "hidden"}
+
+
+def changes_tab_structure(body: dict) -> bool:
+    """Whether a batch update body adds, duplicates, deletes, renames, moves or (un)hides any tab"""
+    for request in body.get("requests", []):
+        if TAB_STRUCTURE_REQUESTS.intersection(request):
+            return True
+        update = request.get("updateSheetProperties")
+        if update is not None:
+            fields = {field.strip() for field in update.get("fields", "").split(",")}
+            if "*" in fields or TAB_STRUCTURE_FIELDS.intersection(fields):
+                return True
+    return False
 
 
 class BatchUpdateBuilder:
@@ -41,6 +62,7 @@ class BatchUpdateBuilder:
                 }
             }
         )
+
     def update_cell_by_label(self, sheet_id, label, value, is_formula=False):
         row, col = gspread.utils.a1_to_rowcol(label)
         self.update_cell_by_index(
@@ -111,3 +133,189 @@ class BatchUpdateBuilder:
         result = {"requests": self.requests}
         print(result)
         return result
+
+
+# The service account counts as a single user, so the Sheets per-user write quota (60/min) is the one we hit first
+PROJECT_WRITES_PER_MINUTE = 60
+PROJECT_WRITE_BURST = 10
+# Keep one busy hunt sheet from using up the whole project's quota
+SPREADSHEET_WRITES_PER_MINUTE = 30
+SPREADSHEET_WRITE_BURST = 5
+# Retries for quota (429) and unavailable (503) errors. Backoff doubles each time, with jitter
+RETRYABLE_ERROR_CODES = {429, 503}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 32
+
+
+class TokenBucket:
+    """Token bucket rate limiter. Holds up to `capacity` tokens, refilled at `per_minute` tokens a minute"""
+
+    def __init__(self, per_minute: float, capacity: int):
+        self.rate = per_minute / 60
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BatchUpdateScheduler:
+    """
+    Sits in front of Spreadsheet.batch_update so we stay inside the Sheets write quota.
+
+    Every write waits for a token from the project-wide bucket and from its spreadsheet's bucket.
+    Batch updates for the same spreadsheet that pile up while waiting are merged into one batchUpdate call.
+    Quota/unavailable errors are retried with jittered exponential backoff.
+    """
+
+    def __init__(self, run):
+        # Coroutine function that runs a blocking gspread call off the event loop
+        self.run = run
+        self.project_bucket = TokenBucket(
+            PROJECT_WRITES_PER_MINUTE, PROJECT_WRITE_BURST
+        )
+        # spreadsheet id -> TokenBucket
+        self.spreadsheet_buckets = {}
+        # spreadsheet id -> list of (body, future, time queued) waiting to be sent
+        self.queues = {}
+        # spreadsheet id -> task sending that spreadsheet's queue
+        self.senders = {}
+
+        self.payloads = 0
+        self.batch_calls = 0
+        self.total_wait = 0.0
+        self.retries = 0
+
+    async def _acquire(self, spreadsheet_id: str):
+        bucket = self.spreadsheet_buckets.get(spreadsheet_id)
+        if bucket is None:
+            bucket = TokenBucket(SPREADSHEET_WRITES_PER_MINUTE, SPREADSHEET_WRITE_BURST)
+            self.spreadsheet_buckets[spreadsheet_id] = bucket
+        await bucket.acquire()
+        await self.project_bucket.acquire()
+
+    async def _call_with_retries(self, func, *args, **kwargs):
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return await self.run(func, *args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                if e.code not in RETRYABLE_ERROR_CODES or attempt == MAX_RETRIES:
+                    raise
+                self.retries += 1
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    async def write(self, spreadsheet_id: str, func, *args, **kwargs):
+        """Rate limit and retry any other write (duplicating, deleting, moving tabs...)"""
+        await self._acquire(spreadsheet_id)
+        return await self._call_with_retries(func, *args, **kwargs)
+
+    async def batch_update(self, spreadsheet: gspread.Spreadsheet, body: dict) -> dict:
+        """Queue a batch update for the spreadsheet and wait until it (or a merged batch containing it) is sent"""
+        future = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(spreadsheet.id, []).append(
+            (body, future, time.monotonic())
+        )
+        self.payloads += 1
+        if spreadsheet.id not in self.senders:
+            self.senders[spreadsheet.id] = asyncio.ensure_future(
+                self._send_queue(spreadsheet)
+            )
+        return await future
+
+    async def _send_queue(self, spreadsheet: gspread.Spreadsheet):
+        try:
+            while self.queues.get(spreadsheet.id):
+                await self._acquire(spreadsheet.id)
+                # Everything that queued up while we waited for a token goes out together
+                pending = self.queues.pop(spreadsheet.id)
+                now = time.monotonic()
+                for _, _, queued_at in pending:
+                    self.total_wait += now - queued_at
+
+                # Send in queue order. Runs of plain batch updates are merged, but anything with extra options
+                # (e.g. includeSpreadsheetInResponse) is sent on its own
+                runs = []
+                for item in pending:
+                    if set(item[0]) == {"requests"} and runs and runs[-1][0]:
+                        runs[-1][1].append(item)
+                    else:
+                        runs.append((set(item[0]) == {"requests"}, [item]))
+                for i, (_, run) in enumerate(runs):
+                    # We already have a token for the first call
+                    if i > 0:
+                        await self._acquire(spreadsheet.id)
+                    if len(run) == 1:
+                        body, future, _ = run[0]
+                        await self._send_one(spreadsheet, body, future, acquire=False)
+                    else:
+                        await self._send_merged(spreadsheet, run)
+        finally:
+            self.senders.pop(spreadsheet.id, None)
+
+    async def _send_one(
+        self, spreadsheet: gspread.Spreadsheet, body, future, acquire: bool = True
+    ):
+        if acquire:
+            await self._acquire(spreadsheet.id)
+        self.batch_calls += 1
+        try:
+            response = await self._call_with_retries(spreadsheet.batch_update, body)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(response)
+
+    async def _send_merged(self, spreadsheet: gspread.Spreadsheet, pending: list):
+        merged = {"requests": [r for body, _, _ in pending for r in body["requests"]]}
+        self.batch_calls += 1
+        try:
+            response = await self._call_with_retries(spreadsheet.batch_update, merged)
+        except gspread.exceptions.APIError as e:
+            if e.code in RETRYABLE_ERROR_CODES:
+                # Out of retries. Sending each payload again would only make the quota trouble worse
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            # A batchUpdate is all or nothing, so one bad payload (e.g. a 400) sinks the whole merge.
+            # Send each on its own so every caller gets its own result or error
+            for body, future, _ in pending:
+                await self._send_one(spreadsheet, body, future)
+            return
+        except Exception as e:
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Hand each caller back the replies to its own requests
+        replies = response.get("replies", [])
+        start = 0
+        for body, future, _ in pending:
+            end = start + len(body["requests"])
+            if not future.done():
+                future.set_result({**response, "replies": replies[start:end]})
+            start = end
+
+    def get_stats(self) -> dict:
+        return {
+            "payloads": self.payloads,
+            "batch_calls": self.batch_calls,
+            "merge_ratio": self.payloads / self.batch_calls if self.batch_calls else 1,
+            "avg_wait": self.total_wait / self.payloads if self.payloads else 0,
+            "retries": self.retries,
+        }
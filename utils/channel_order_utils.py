@@ -0,0 +1,179 @@
+import nextcord
+
+"""
+Channel ordering utils. Works out the fewest channel position changes needed to put channels (or categories) in a
+given order, and sends them to Discord as a single bulk request instead of one request per channel.
+Used by the channel management commands (sortcat, shiftchan, movechan, shiftcat).
+"""
+
+
+def get_sorting_bucket(channel: nextcord.abc.GuildChannel) -> list:
+    """Every channel in the guild which shares positions with this one (text, voice or categories), in order"""
+    # Same grouping nextcord uses when it moves a channel
+    return sorted(
+        [
+            c
+            for c in channel.guild.channels
+            if c._sorting_bucket == channel._sorting_bucket
+        ],
+        key=lambda c: (c.position, c.id),
+    )
+
+
+def get_siblings(channel: nextcord.abc.GuildChannel) -> list:
+    """The channels which share positions with this one and are in the same category (itself included), in order"""
+    return [
+        c for c in get_sorting_bucket(channel) if c.category_id == channel.category_id
+    ]
+
+
+def get_longest_increasing(positions: list) -> set:
+    """Indexes of a longest run (not necessarily contiguous) of strictly increasing positions"""
+    # Patience sorting: tails[k] is the index ending the best run of length k + 1 found so far
+    tails = []
+    previous = [None] * len(positions)
+    for index, position in enumerate(positions):
+        low, high = 0, len(tails)
+        while low < high:
+            mid = (low + high) // 2
+            if positions[tails[mid]] < position:
+                low = mid + 1
+            else:
+                high = mid
+        previous[index] = tails[low - 1] if low > 0 else None
+        if low == len(tails):
+            tails.append(index)
+        else:
+            tails[low] = index
+    keep = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        keep.add(index)
+        index = previous[index]
+    return keep
+
+
+def plan_order(channels_in_order: list) -> dict:
+    """
+    {channel: new position} for the channels which need to move so the given channels end up in that order.
+
+    The longest run of channels already in order stays put, and the others are slotted into free positions
+    around them. If there isn't room for that, the channels swap around the positions they have between them
+    instead (renumbering the whole bucket if positions are duplicated, which Discord allows).
+    """
+    if not channels_in_order:
+        return {}
+    to_order = set(channels_in_order)
+    bucket = get_sorting_bucket(channels_in_order[0])
+    taken = {c.position for c in bucket if c not in to_order}
+
+    positions = [c.position for c in channels_in_order]
+    keep = get_longest_increasing(positions)
+    new_positions = list(positions)
+    lower = -1
+    index = 0
+    while index < len(positions):
+        if index in keep:
+            lower = positions[index]
+            index += 1
+            continue
+        # A run of channels to move, which must fit between the kept channels on either side
+        end = index
+        while end < len(positions) and end not in keep:
+            end += 1
+        upper = positions[end] if end < len(positions) else float("inf")
+        position = lower + 1
+        for moving in range(index, end):
+            while position in taken:
+                position += 1
+            if position >= upper:
+                return plan_slots(channels_in_order, bucket)
+            new_positions[moving] = position
+            position += 1
+        lower = new_positions[end - 1]
+        index = end
+    return {
+        c: position
+        for c, position in zip(channels_in_order, new_positions)
+        if c.position != position
+    }
+
+
+def plan_slots(channels_in_order: list, bucket: list) -> dict:
+    """{channel: new position}, giving the channels the positions they take up between them now, in order"""
+    to_order = set(channels_in_order)
+    next_in_order = iter(channels_in_order)
+    new_bucket = [next(next_in_order) if c in to_order else c for c in bucket]
+
+    positions = [c.position for c in bucket]
+    if len(set(positions)) != len(positions):
+        positions = range(len(bucket))
+    return {
+        c: position
+        for c, position in zip(new_bucket, positions)
+        if c.position != position
+    }
+
+
+class ChannelMoves:
+    """
+    Position and category changes for a guild's channels, sent all at once.
+
+    Keeps count of the channels moved and the requests it took, so commands can report them.
+    """
+
+    def __init__(self, guild: nextcord.Guild):
+        self.guild = guild
+        # channel id -> position update sent to Discord
+        self.updates = {}
+        self.moves = 0
+        self.requests = 0
+
+    def order(self, channels_in_order: list):
+        """Put the channels in that order (among the positions they have now)"""
+        for channel, position in plan_order(channels_in_order).items():
+            self.updates.setdefault(channel.id, {"id": channel.id})["position"] = (
+                position
+            )
+
+    def move_to_category(
+        self,
+        channels: list,
+        category: nextcord.CategoryChannel,
+        sync_permissions: bool = False,
+    ):
+        """Move the channels into the category, keeping their positions"""
+        for channel in channels:
+            self.updates.setdefault(channel.id, {"id": channel.id}).update(
+                parent_id=category.id, lock_permissions=sync_permissions
+            )
+
+    async def apply(self, reason: str = None) -> int:
+        """Send the changes in one request. Returns how many channels were changed"""
+        if not self.updates:
+            return 0
+        payload = list(self.updates.values())
+        self.updates = {}
+        # nextcord has no public bulk channel update, it uses this itself to move channels
+        await self.guild._state.http.bulk_channel_update(
+            self.guild.id, payload, reason=reason
+        )
+        self.moves += len(payload)
+        self.requests += 1
+        return len(payload)
+
+    def summary(self) -> str:
+        return (
+            f"Moved {self.moves} channel{'s' if self.moves != 1 else ''} in "
+            f"{self.requests} request{'s' if self.requests != 1 else ''}."
+        )
+
+
+def shifted_order(channel, after=None) -> list:
+    """The channel's siblings in their current order, with the channel moved to just after `after` (or to the top if None)"""
+    if after == channel:
+        return get_siblings(channel)
+    ordered = [c for c in get_siblings(channel) if c != channel]
+    index = 0 if after is None else ordered.index(after) + 1
+    ordered.insert(index, channel)
+    return ordered
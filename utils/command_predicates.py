@@ -1,5 +1,7 @@
 from nextcord.ext import commands
+import constants
 import database
+from database import models
 
 """
 Commands predicate utils. Informs all the functions on the rest of the modules what level of access the function caller has.
@@ -7,6 +9,20 @@ Currently set to multiple granularities we need most. See ~addperm and the rest
 Used throughout the bot.
 """
 
+# Which Permission Categories pass each check. Trusted roles can do anything Verified roles can,
+# and Verified roles anything Solver roles can. Tester is separate.
+PERMISSION_HIERARCHY = {
+    models.SOLVER: (models.SOLVER, models.VERIFIED, models.TRUSTED),
+    models.VERIFIED: (models.VERIFIED, models.TRUSTED),
+    models.TRUSTED: (models.TRUSTED,),
+    models.TESTER: (models.TESTER,),
+}
+
+# guild id -> {Permission Category: frozenset of role ids which pass it}
+GUILD_PERMISSION_INDEX = {}
+# (guild id, member id) -> frozenset of Permission Categories the member passes
+MEMBER_PERMISSIONS = {}
+
 
 def is_bot_owner():
     """
@@ -59,81 +75,92 @@ def is_guild_owner():
     return commands.check(predicate)
 
 
-def is_tester():
+def get_guild_permission_index(guild_id: int) -> dict:
+    """{Permission Category: frozenset of role ids which pass it} for the guild, built from the database caches"""
+    index = GUILD_PERMISSION_INDEX.get(guild_id)
+    if index is None:
+        caches = {
+            models.VERIFIED: database.VERIFIEDS,
+            models.TRUSTED: database.TRUSTEDS,
+            models.SOLVER: database.SOLVERS,
+            models.TESTER: database.TESTERS,
+        }
+        index = {
+            permissions: frozenset().union(
+                *[caches[category].get(guild_id, ()) for category in categories]
+            )
+            for permissions, categories in PERMISSION_HIERARCHY.items()
+        }
+        GUILD_PERMISSION_INDEX[guild_id] = index
+    return index
+
+
+def get_member_permissions(member) -> frozenset:
+    """The Permission Categories a member passes, remembered until their roles or the guild's permissions change"""
+    key = (member.guild.id, member.id)
+    member_permissions = MEMBER_PERMISSIONS.get(key)
+    if member_permissions is None:
+        role_ids = {role.id for role in member.roles}
+        member_permissions = frozenset(
+            permissions
+            for permissions, allowed in get_guild_permission_index(
+                member.guild.id
+            ).items()
+            if not allowed.isdisjoint(role_ids)
+        )
+        if len(MEMBER_PERMISSIONS) >= constants.PERMISSION_MEMO_SIZE:
+            MEMBER_PERMISSIONS.clear()
+        MEMBER_PERMISSIONS[key] = member_permissions
+    return member_permissions
+
+
+def clear_permissions(guild_id: int = None, member_id: int = None):
+    """
+    Forget what we worked out about the guild's permissions (or just one member's, or everyone's if no guild is given).
+    Call whenever the guild's Permission Categories, or the member's roles, change.
+    """
+    if guild_id is None:
+        GUILD_PERMISSION_INDEX.clear()
+        MEMBER_PERMISSIONS.clear()
+        return
+    if member_id is not None:
+        MEMBER_PERMISSIONS.pop((guild_id, member_id), None)
+        return
+    GUILD_PERMISSION_INDEX.pop(guild_id, None)
+    for key in [key for key in MEMBER_PERMISSIONS if key[0] == guild_id]:
+        del MEMBER_PERMISSIONS[key]
+
+
+def has_permission(permissions: str, or_bot_owner: bool = False):
+    """
+    Has a role in the Permission Category (or a higher one, see PERMISSION_HIERARCHY).
+    """
+
     async def predicate(ctx):
         if ctx.message.guild is None:
             return False
-        if ctx.guild.id in database.TESTERS:
-            for role in ctx.author.roles:
-                role_id = role.id
-                if role_id in database.TESTERS[ctx.guild.id]:
-                    return True
-            return False
-        else:
-            return False
+        if or_bot_owner and await ctx.bot.is_owner(ctx.author):
+            return True
+        return permissions in get_member_permissions(ctx.author)
 
     return commands.check(predicate)
 
 
-def is_solver():
-    async def predicate(ctx):
-        if ctx.message.guild is None:
-            return False
-        if ctx.guild.id in database.SOLVERS:
-            for role in ctx.author.roles:
-                role_id = role.id
-                if role_id in database.SOLVERS[ctx.guild.id]:
-                    return True
-            return False
-        else:
-            return False
+def is_tester():
+    return has_permission(models.TESTER)
 
-    return commands.check(predicate)
 
+def is_solver():
+    return has_permission(models.SOLVER)
 
-def is_verified():
-    async def predicate(ctx):
-        if ctx.message.guild is None:
-            return False
-        if ctx.guild.id in database.VERIFIEDS:
-            for role in ctx.author.roles:
-                role_id = role.id
-                if role_id in database.VERIFIEDS[ctx.guild.id]:
-                    return True
-            return False
-        else:
-            return False
 
-    return commands.check(predicate)
+def is_verified():
+    return has_permission(models.VERIFIED)
 
 
 def is_trusted():
-    async def predicate(ctx):
-        if ctx.message.guild is None:
-            return False
-        if ctx.guild.id in database.TRUSTEDS:
-            for role in ctx.author.roles:
-                role_id = role.id
-                if role_id in database.TRUSTEDS[ctx.guild.id]:
-                    return True
-            return False
-
-    return commands.check(predicate)
+    return has_permission(models.TRUSTED)
 
 
 def is_trusted_or_bot_owner():
-    async def predicate(ctx):
-        if ctx.message.guild is None:
-            return False
-
-        if await ctx.bot.is_owner(ctx.author):
-            return True
-
-        if ctx.guild.id in database.TRUSTEDS:
-            for role in ctx.author.roles:
-                role_id = role.id
-                if role_id in database.TRUSTEDS[ctx.guild.id]:
-                    return True
-            return False
-
-    return commands.check(predicate)
+    return has_permission(models.TRUSTED, or_bot_owner=True)
@@ -1,7 +1,9 @@
+import asyncio
 import nextcord
 from nextcord.ext import commands
-from typing import List, Union
+from typing import Awaitable, Callable, Hashable, List, Union
 import constants
+from utils import name_index_utils
 
 """
 Discord utils. Lots of little functions required for making smoother discord operations,
@@ -394,7 +396,7 @@ async def find_category(
     ctx: commands.Context,
     category_name: nextcord.CategoryChannel | str,
 ) -> nextcord.CategoryChannel | None:
-    """Uses nextcord.py's CategoryChannelConverter to convert the name to a discord CategoryChannel
+    """Find the discord CategoryChannel with that name
     Arguments:
         - ctx (nextcord.ext.commands.Context): The command's context
         - category_name (str): The name of the category
@@ -403,21 +405,24 @@ async def find_category(
     if isinstance(category_name, nextcord.CategoryChannel) or category_name is None:
         return category_name
 
-    # Since we have a lot of lookups, collect categories first
-    # We do want to find the most specific category first, so we search unnormalized
-    cat_names = set(cat.name for cat in ctx.guild.categories)
-    candidates = (
-        category_name,
-        category_name.upper(),
-        category_name.title(),
-        category_name.capitalize(),
-        category_name.lower(),
+    # Ignores case, but an exact match wins
+    return name_index_utils.find_by_name(
+        ctx.guild, "channels", category_name, nextcord.CategoryChannel
     )
-    for cand in candidates:
-        if cand in cat_names:
-            return await commands.CategoryChannelConverter().convert(ctx, cand)
 
-    return None
+
+async def find_first_category(
+    ctx: commands.Context, category_names: list
+) -> nextcord.CategoryChannel | None:
+    """Find the category for the first of the names that has one, e.g. when trying several ways an archive could be named
+    Arguments:
+        - ctx (nextcord.ext.commands.Context): The command's context
+        - category_names (list): The names to try, in order
+    Returns:
+        - category (nextcord.CategoryChannel): the category or None if none of them were found"""
+    return name_index_utils.find_first_by_name(
+        ctx.guild, "channels", category_names, nextcord.CategoryChannel
+    )
 
 
 async def find_chan_or_thread(
@@ -440,6 +445,19 @@ async def find_chan_or_thread(
     ):
         return chan_name
 
+    # Names come from the index. Mentions and ids are left to the converters, which look those up directly
+    chan_or_thread = name_index_utils.find_by_name(
+        ctx.guild, "channels", chan_name, nextcord.TextChannel
+    ) or name_index_utils.find_by_name(ctx.guild, "threads", chan_name)
+    if chan_or_thread is None:
+        chan_or_thread = name_index_utils.find_by_name(
+            ctx.guild, "channels", chan_name, nextcord.ForumChannel
+        )
+    if chan_or_thread is not None or not (
+        chan_name.startswith("<") or chan_name.isdigit()
+    ):
+        return chan_or_thread
+
     for converter in (
         commands.TextChannelConverter,
         commands.ThreadConverter,
@@ -472,10 +490,7 @@ async def find_role(
 
     if (isinstance(role_name, nextcord.Role)) or role_name is None:
         return role_name
-    for role in ctx.guild.roles:
-        if role.name.lower() == role_name.lower():
-            return role
-    return None
+    return name_index_utils.find_by_name(ctx.guild, "roles", role_name)
 
 
 async def find_user(
@@ -490,22 +505,8 @@ async def find_user(
 
     if (isinstance(user_name, nextcord.Member)) or user_name is None:
         return user_name
-    guild_users = ctx.guild.members
-    for user in guild_users:
-        # Not quite sure the difference between user.name and user.display_name, probably waiting on nextcord 3.0 to hash this
-        if user.name is not None and user.name.lower() == user_name.lower():
-            return user
-        if (
-            user.display_name is not None
-            and user.display_name.lower() == user_name.lower()
-        ):
-            return user
-        if (
-            user.global_name is not None
-            and user.global_name.lower() == user_name.lower()
-        ):
-            return user
-    return None
+    # Matches the username, display name (nickname) or global name, ignoring case
+    return name_index_utils.find_by_name(ctx.guild, "members", user_name)
 
 
 ########
@@ -553,3 +554,140 @@ async def pin_message(message: nextcord.Message) -> nextcord.Embed:
         return embed
 
     return None
+
+
+################
+# BULK CHANGES #
+################
+
+
+def describe_http_error(error: nextcord.HTTPException) -> str:
+    """A short reason for a failed Discord request, for showing to users"""
+    if isinstance(error, nextcord.Forbidden):
+        return "I don't have permission to do that."
+    if isinstance(error, nextcord.NotFound):
+        return "It doesn't exist anymore."
+    return f"Discord returned an error ({error.status}: {error.text or 'no details'})."
+
+
+async def run_bulk(
+    items: list,
+    action: Callable[..., Awaitable],
+    route: Callable[..., Hashable] = None,
+    ctx: commands.Context = None,
+    progress_name: str = "In Progress",
+) -> tuple:
+    """Run action(item) for every item at once, instead of one after another.
+    The changes must not depend on each other.
+
+    Discord rate limits each route (e.g. each channel's edits, or a guild's role assignments) separately, and nextcord
+    makes requests on the same route wait their turn. So items on the same route (as given by `route`) only get a few
+    requests in flight at a time, leaving the rest of BULK_MAX_CONCURRENCY free for the other routes.
+    If `ctx` is given and there are many items, keeps a progress message up to date in its channel while running.
+    Arguments:
+        - items (list): The things to change (channels, members...)
+        - action (Callable): Makes the change to one item
+        - route (Callable): The rate limit bucket an item's request goes to. Defaults to the same one for every item
+        - ctx (commands.Context): Where to show progress
+        - progress_name (str): Title of the progress message
+    Returns:
+        - succeeded (list): The items which were changed, in the order given
+        - failed (list): (item, nextcord.HTTPException) for each item which wasn't, in the order given
+    """
+    route_limits = {}
+    limit = asyncio.Semaphore(constants.BULK_MAX_CONCURRENCY)
+    results = [None] * len(items)
+    done = 0
+
+    async def run_one(index, item):
+        nonlocal done
+        key = route(item) if route is not None else None
+        if key not in route_limits:
+            route_limits[key] = asyncio.Semaphore(constants.BULK_ROUTE_CONCURRENCY)
+        # Take the route's slot first, so items waiting on a busy route don't hold up the others
+        async with route_limits[key], limit:
+            try:
+                await action(item)
+            except nextcord.HTTPException as e:
+                results[index] = e
+        done += 1
+
+    tasks = [asyncio.ensure_future(run_one(i, item)) for i, item in enumerate(items)]
+    progress_msg = None
+    try:
+        if ctx is not None and len(items) >= constants.BULK_PROGRESS_THRESHOLD:
+            # Progress is only a nicety, so carry on if we can't show it
+            try:
+                progress_msg = await ctx.send(
+                    embed=create_progress_embed(progress_name, done, len(items))
+                )
+            except nextcord.HTTPException:
+                pass
+        pending = tasks
+        while pending and progress_msg is not None:
+            _, pending = await asyncio.wait(
+                pending, timeout=constants.BULK_PROGRESS_INTERVAL
+            )
+            if pending:
+                try:
+                    await progress_msg.edit(
+                        embed=create_progress_embed(progress_name, done, len(items))
+                    )
+                except nextcord.HTTPException:
+                    pass
+        await asyncio.gather(*tasks)
+    finally:
+        # Only left running if something went wrong
+        for task in tasks:
+            task.cancel()
+        if progress_msg is not None:
+            try:
+                await progress_msg.delete()
+            except nextcord.HTTPException:
+                pass
+
+    succeeded = [item for item, error in zip(items, results) if error is None]
+    failed = [(item, error) for item, error in zip(items, results) if error is not None]
+    return succeeded, failed
+
+
+def create_progress_embed(name: str, done: int, total: int) -> nextcord.Embed:
+    """Embed showing how far along a bulk change is"""
+    embed = create_embed()
+    embed.add_field(
+        name=name,
+        value=f"Done {done} of {total}. If I run into any errors, I'll let you know at the end.",
+        inline=False,
+    )
+    return embed
+
+
+def add_bulk_summary(
+    embed: nextcord.Embed,
+    succeeded: list,
+    failed: list,
+    success_message: Callable[[list], str] = None,
+    describe: Callable[..., str] = str,
+) -> nextcord.Embed:
+    """Add the outcome of run_bulk to an embed: one Success field, and one Failed field listing each failure
+    Arguments:
+        - embed (nextcord.Embed)
+        - succeeded, failed (list): As returned by run_bulk
+        - success_message (Callable): Makes the Success field from the items which succeeded. Skipped if there are
+          none, or if not given
+        - describe (Callable): Names a failed item (e.g. its mention)
+    Returns:
+        - embed (nextcord.Embed)
+    """
+    if succeeded and success_message is not None:
+        embed.add_field(name="Success", value=success_message(succeeded), inline=False)
+    if failed:
+        embed.add_field(
+            name="Failed",
+            value="\n".join(
+                f"{describe(item)}: {describe_http_error(error)}"
+                for item, error in failed
+            ),
+            inline=False,
+        )
+    return embed
@@ -0,0 +1,137 @@
+import bisect
+import difflib
+import nextcord
+from typing import Iterable, Union
+
+"""
+Emoji utils. Keeps an index of the custom emojis in every guild the bot is in, by id and by name, so commands
+can find an emoji without searching every guild. Built in on_ready and kept up to date by the guild emoji events.
+Used by `~emoji` and `~steal`.
+"""
+
+
+class EmojiIndex:
+    """
+    Every custom emoji the bot can see, by id and by lowercased name.
+    """
+
+    def __init__(self):
+        self.by_id = {}
+        # lowercased name -> emojis with that name, in the order their guilds were added
+        self.by_name = {}
+        # guild id -> that guild's emojis, so they can be swapped out when the guild changes them
+        self.by_guild = {}
+        # Sorted lowercased names, for prefix matches. Rebuilt on the first search after a change
+        self.sorted_names = None
+
+    def build(self, guilds: Iterable[nextcord.Guild]):
+        """Index every guild's emojis from scratch"""
+        self.by_id.clear()
+        self.by_name.clear()
+        self.by_guild.clear()
+        self.sorted_names = None
+        for guild in guilds:
+            self.set_guild(guild.id, guild.emojis)
+
+    def set_guild(self, guild_id: int, emojis: Iterable[nextcord.Emoji]):
+        """Replace the guild's emojis (e.g. when it joins, or adds/removes/renames an emoji)"""
+        self.remove_guild(guild_id)
+        emojis = tuple(emojis)
+        self.by_guild[guild_id] = emojis
+        for emoji in emojis:
+            self.by_id[emoji.id] = emoji
+            self.by_name.setdefault(emoji.name.lower(), []).append(emoji)
+        self.sorted_names = None
+
+    def remove_guild(self, guild_id: int):
+        for emoji in self.by_guild.pop(guild_id, ()):
+            self.by_id.pop(emoji.id, None)
+            name = emoji.name.lower()
+            same_name = [e for e in self.by_name.get(name, []) if e.id != emoji.id]
+            if same_name:
+                self.by_name[name] = same_name
+            else:
+                self.by_name.pop(name, None)
+        self.sorted_names = None
+
+    def get(self, emoji_id: int) -> nextcord.Emoji:
+        """The emoji with that id, or None"""
+        return self.by_id.get(emoji_id)
+
+    def find(self, name: str, guild: nextcord.Guild = None) -> nextcord.Emoji:
+        """The emoji with that name, or None.
+        Prefers an exact case match, then an emoji from `guild` (e.g. where the command was used)"""
+        candidates = self.by_name.get(name.lower())
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda e: (
+                e.name != name,
+                guild is None or e.guild_id != guild.id,
+            ),
+        )
+
+    def startswith(self, prefix: str, limit: int = 5) -> list:
+        """Up to `limit` emoji names (lowercased) starting with the prefix, in alphabetical order"""
+        if self.sorted_names is None:
+            self.sorted_names = sorted(self.by_name)
+        prefix = prefix.lower()
+        names = []
+        index = bisect.bisect_left(self.sorted_names, prefix)
+        while (
+            index < len(self.sorted_names)
+            and len(names) < limit
+            and self.sorted_names[index].startswith(prefix)
+        ):
+            names.append(self.sorted_names[index])
+            index += 1
+        return names
+
+    def suggest(self, name: str, limit: int = 5) -> list:
+        """Emoji names (lowercased) close to one we couldn't find: ones it's the start of, then near misses"""
+        names = self.startswith(name, limit)
+        if len(names) < limit:
+            for close in difflib.get_close_matches(
+                name.lower(), self.by_name, n=limit, cutoff=0.75
+            ):
+                if close not in names and len(names) < limit:
+                    names.append(close)
+        return names
+
+
+EMOJI_INDEX = EmojiIndex()
+
+
+def find_custom_emoji(emoji_str: str, guild: nextcord.Guild = None) -> nextcord.Emoji:
+    """Find a custom emoji the bot can see, given as `<:name:id>`, `:name:`, a name or an id. None if there isn't one
+    Arguments:
+        - emoji_str (str): The emoji, as typed
+        - guild (nextcord.Guild): Guild whose emoji we prefer, if several share a name
+    Returns:
+        - emoji (nextcord.Emoji)"""
+    if emoji_str.startswith("<") and emoji_str.endswith(">"):
+        try:
+            return EMOJI_INDEX.get(int(emoji_str.split(":")[-1][:-1]))
+        except (ValueError, IndexError):
+            return None
+    if emoji_str.isdigit():
+        emoji = EMOJI_INDEX.get(int(emoji_str))
+        if emoji is not None:
+            return emoji
+    if len(emoji_str) > 2 and emoji_str.startswith(":") and emoji_str.endswith(":"):
+        emoji_str = emoji_str[1:-1]
+    return EMOJI_INDEX.find(emoji_str, guild)
+
+
+def find_any_custom_emoji(
+    emoji_str: str,
+) -> Union[nextcord.Emoji, nextcord.PartialEmoji]:
+    """Like find_custom_emoji, but `<:name:id>` also works for emojis from servers the bot isn't in.
+    Those only have a name, id and url. None if there isn't one"""
+    emoji = find_custom_emoji(emoji_str)
+    if emoji is None and emoji_str.startswith("<") and emoji_str.endswith(">"):
+        partial_emoji = nextcord.PartialEmoji.from_str(emoji_str)
+        if partial_emoji.is_custom_emoji():
+            return partial_emoji
+    return emoji
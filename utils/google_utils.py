@@ -1,5 +1,11 @@
+import asyncio
 import gspread
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from utils import batch_update_utils
 
 # import pandas as pd
 from oauth2client.service_account import ServiceAccountCredentials
@@ -23,6 +29,12 @@ JSON_PARAMS = [
     "client_x509_cert_url",
 ]
 
+# Max number of gspread calls that can be in flight at once. Anything past this queues up in the executor
+SHEETS_EXECUTOR_WORKERS = 8
+# How many spreadsheets (and their tab title/id/index metadata) we keep open, and for how long (seconds)
+SPREADSHEET_CACHE_SIZE = 64
+SPREADSHEET_CACHE_TTL = 300
+
 
 def create_gspread_client() -> gspread.Client:
     """
@@ -88,4 +100,286 @@ def get_sheet_link(sheet: gspread.Spreadsheet, tab: gspread.Worksheet = None) ->
         return sheet.url
 
 
+class AsyncSheetsClient:
+    """
+    Async facade over a gspread client. gspread is fully synchronous, so every call is sent to a
+    bounded thread pool instead of running on (and freezing) the event loop.
+
+    Keeps track of how many calls are queued/running and how long each kind of call takes.
+
+    Opened spreadsheets and their tab metadata are kept in a small TTL/LRU cache keyed by spreadsheet ID,
+    so looking up the Overview/Template tabs does not cost a metadata fetch every command.
+    Anything we do that adds, deletes, moves or unhides tabs drops the cached tab metadata.
+
+    Writes go through a BatchUpdateScheduler, which keeps us inside the Sheets write quota,
+    merges batch updates queued up for the same spreadsheet and retries 429/503 errors.
+    """
+
+    def __init__(
+        self,
+        gspread_client: gspread.Client,
+        max_workers: int = SHEETS_EXECUTOR_WORKERS,
+        cache_size: int = SPREADSHEET_CACHE_SIZE,
+        cache_ttl: float = SPREADSHEET_CACHE_TTL,
+    ):
+        self.gspread_client = gspread_client
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gspread"
+        )
+        # Counters are touched from the worker threads, so they need a lock
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        # call name -> [count, errors, total seconds, max seconds, total seconds spent queued]
+        self.call_stats = {}
+
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # spreadsheet ID -> {"spreadsheet", "tabs" (list of tab properties, or None), "opened_at"}
+        self.spreadsheet_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self.scheduler = batch_update_utils.BatchUpdateScheduler(self.run)
+
+    async def run(self, func, *args, **kwargs):
+        """Run any (blocking) gspread function in the executor and await its result"""
+        name = getattr(func, "__name__", repr(func))
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+        timings = {}
+        # "started" once call() takes the job off the queue, "abandoned" if we gave up waiting before that
+        state = {}
+
+        def call():
+            started_at = time.perf_counter()
+            with self._lock:
+                if state.get("abandoned"):
+                    return None
+                state["started"] = True
+                self.queued -= 1
+                self.running += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings["wait"] = started_at - submitted_at
+                timings["duration"] = time.perf_counter() - started_at
+                with self._lock:
+                    self.running -= 1
+
+        failed = False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                # Cancelled while still queued, so call() never took it off the queue
+                if not state.get("started"):
+                    state["abandoned"] = True
+                    self.queued -= 1
+            if timings:
+                self._record(name, timings["wait"], timings["duration"], failed)
+
+    def _record(self, name: str, wait: float, duration: float, failed: bool):
+        stats = self.call_stats.setdefault(name, [0, 0, 0.0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += int(failed)
+        stats[2] += duration
+        stats[3] = max(stats[3], duration)
+        stats[4] += wait
+
+    #####################
+    # SPREADSHEET CACHE #
+    #####################
+
+    def _get_cache_entry(self, key: str) -> dict | None:
+        entry = self.spreadsheet_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry["opened_at"] > self.cache_ttl:
+            del self.spreadsheet_cache[key]
+            return None
+        self.spreadsheet_cache.move_to_end(key)
+        return entry
+
+    def _add_cache_entry(self, spreadsheet: gspread.Spreadsheet) -> dict:
+        entry = {
+            "spreadsheet": spreadsheet,
+            "tabs": None,
+            "opened_at": time.monotonic(),
+        }
+        self.spreadsheet_cache[spreadsheet.id] = entry
+        self.spreadsheet_cache.move_to_end(spreadsheet.id)
+        while len(self.spreadsheet_cache) > self.cache_size:
+            self.spreadsheet_cache.popitem(last=False)
+        return entry
+
+    async def _open_cached(self, key: str, open_func, key_or_url: str):
+        entry = self._get_cache_entry(key)
+        if entry is not None:
+            self.cache_hits += 1
+            return entry["spreadsheet"]
+        self.cache_misses += 1
+        spreadsheet = await self.run(open_func, key_or_url)
+        self._add_cache_entry(spreadsheet)
+        return spreadsheet
+
+    async def _get_tabs(
+        self, spreadsheet: gspread.Spreadsheet, refresh: bool = False
+    ) -> tuple[list, bool]:
+        """Returns the properties of every tab in the spreadsheet, and whether they were just fetched"""
+        entry = self._get_cache_entry(spreadsheet.id) or self._add_cache_entry(
+            spreadsheet
+        )
+        if entry["tabs"] is not None and not refresh:
+            self.cache_hits += 1
+            return entry["tabs"], False
+        self.cache_misses += 1
+        metadata = await self.run(spreadsheet.fetch_sheet_metadata)
+        entry["tabs"] = [sheet["properties"] for sheet in metadata["sheets"]]
+        return entry["tabs"], True
+
+    async def _find_tab(
+        self, spreadsheet: gspread.Spreadsheet, key: str, value, not_found: str
+    ) -> gspread.Worksheet:
+        # A miss on cached tabs might just mean someone added the tab since, so re-fetch once before giving up
+        tabs, fresh = await self._get_tabs(spreadsheet)
+        properties = next((tab for tab in tabs if tab[key] == value), None)
+        if properties is None and not fresh:
+            tabs, _ = await self._get_tabs(spreadsheet, refresh=True)
+            properties = next((tab for tab in tabs if tab[key] == value), None)
+        if properties is None:
+            raise gspread.exceptions.WorksheetNotFound(not_found)
+        return gspread.Worksheet(
+            spreadsheet, dict(properties), spreadsheet.id, spreadsheet.client
+        )
+
+    def invalidate_tabs(self, spreadsheet: gspread.Spreadsheet):
+        """Forget the cached tab metadata of a spreadsheet, e.g. after tabs were added or moved"""
+        entry = self.spreadsheet_cache.get(spreadsheet.id)
+        if entry is not None:
+            entry["tabs"] = None
+
+    ###########################
+    # AWAITABLE GSPREAD CALLS #
+    ###########################
+
+    async def open_by_url(self, url: str) -> gspread.Spreadsheet:
+        try:
+            key = gspread.utils.extract_id_from_url(url)
+        except gspread.exceptions.NoValidUrlKeyFound:
+            # Let gspread raise its usual error
+            return await self.run(self.gspread_client.open_by_url, url)
+        return await self._open_cached(key, self.gspread_client.open_by_url, url)
+
+    async def open_by_key(self, key: str) -> gspread.Spreadsheet:
+        return await self._open_cached(key, self.gspread_client.open_by_key, key)
+
+    async def copy(self, file_id: str, **kwargs) -> gspread.Spreadsheet:
+        return await self.run(self.gspread_client.copy, file_id, **kwargs)
+
+    async def worksheet(
+        self, spreadsheet: gspread.Spreadsheet, title: str
+    ) -> gspread.Worksheet:
+        return await self._find_tab(spreadsheet, "title", title, title)
+
+    async def worksheets(self, spreadsheet: gspread.Spreadsheet) -> list:
+        """All tabs of the spreadsheet. Always fetched fresh, since callers use this to work out tab order"""
+        tabs, _ = await self._get_tabs(spreadsheet, refresh=True)
+        return [
+            gspread.Worksheet(
+                spreadsheet, dict(tab), spreadsheet.id, spreadsheet.client
+            )
+            for tab in tabs
+        ]
+
+    async def get_worksheet_by_id(
+        self, spreadsheet: gspread.Spreadsheet, worksheet_id: int
+    ) -> gspread.Worksheet:
+        return await self._find_tab(
+            spreadsheet, "sheetId", int(worksheet_id), f"id {worksheet_id} not found"
+        )
+
+    async def duplicate_sheet(
+        self, spreadsheet: gspread.Spreadsheet, **kwargs
+    ) -> gspread.Worksheet:
+        try:
+            return await self.scheduler.write(
+                spreadsheet.id, spreadsheet.duplicate_sheet, **kwargs
+            )
+        finally:
+            self.invalidate_tabs(spreadsheet)
+
+    async def del_worksheet(
+        self, spreadsheet: gspread.Spreadsheet, worksheet: gspread.Worksheet
+    ):
+        try:
+            return await self.scheduler.write(
+                spreadsheet.id, spreadsheet.del_worksheet, worksheet
+            )
+        finally:
+            self.invalidate_tabs(spreadsheet)
+
+    async def update_index(self, worksheet: gspread.Worksheet, index: int):
+        try:
+            return await self.scheduler.write(
+                worksheet.spreadsheet_id, worksheet.update_index, index
+            )
+        finally:
+            self.invalidate_tabs(worksheet.spreadsheet)
+
+    async def update_acell(self, worksheet: gspread.Worksheet, label: str, value):
+        return await self.scheduler.write(
+            worksheet.spreadsheet_id, worksheet.update_acell, label, value
+        )
+
+    async def delete_rows(self, worksheet: gspread.Worksheet, start_index: int):
+        return await self.scheduler.write(
+            worksheet.spreadsheet_id, worksheet.delete_rows, start_index
+        )
+
+    async def get(self, worksheet: gspread.Worksheet, *args, **kwargs) -> list:
+        return await self.run(worksheet.get, *args, **kwargs)
+
+    async def batch_update(self, spreadsheet: gspread.Spreadsheet, body: dict) -> dict:
+        try:
+            return await self.scheduler.batch_update(spreadsheet, body)
+        finally:
+            if batch_update_utils.changes_tab_structure(body):
+                self.invalidate_tabs(spreadsheet)
+
+    ###########
+    # METRICS #
+    ###########
+
+    def get_stats(self) -> dict:
+        """Snapshot of the executor's queue depth and per-call latencies (in seconds)"""
+        with self._lock:
+            queued, running = self.queued, self.running
+        calls = {}
+        for name, (count, errors, total, slowest, waited) in self.call_stats.items():
+            calls[name] = {
+                "count": count,
+                "errors": errors,
+                "avg": total / count,
+                "max": slowest,
+                "avg_wait": waited / count,
+            }
+        return {
+            "workers": self.max_workers,
+            "queued": queued,
+            "running": running,
+            "calls": calls,
+            "cached_spreadsheets": len(self.spreadsheet_cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "writes": self.scheduler.get_stats(),
+        }
+
+
 GSPREAD_CLIENT = create_gspread_client()
+ASYNC_GSPREAD_CLIENT = AsyncSheetsClient(GSPREAD_CLIENT)
@@ -0,0 +1,134 @@
+import nextcord
+from typing import Callable
+
+"""
+Name index utils. Per-guild indexes of channels (categories included), threads, roles and members by their
+normalized (casefolded) names, so the discord_utils finds don't have to scan the whole guild on every lookup.
+Each index is built the first time it's needed, and kept up to date by the gateway events in bot.py.
+"""
+
+# kind -> (the guild's objects of that kind by id, the names an object can be found by)
+# We read nextcord's own dicts, so checking whether an index is missing anything doesn't copy them
+KINDS = {
+    "channels": (lambda guild: guild._channels, lambda channel: [channel.name]),
+    "threads": (lambda guild: guild._threads, lambda thread: [thread.name]),
+    "roles": (lambda guild: guild._roles, lambda role: [role.name]),
+    # Same order find_user used to check them in
+    "members": (
+        lambda guild: guild._members,
+        lambda member: [member.name, member.display_name, member.global_name],
+    ),
+}
+
+
+def normalize(name: str) -> str:
+    return name.casefold()
+
+
+class NameIndex:
+    """
+    One guild's objects of one kind, by normalized name.
+    """
+
+    def __init__(self, get_names: Callable[..., list]):
+        self.get_names = get_names
+        # normalized name -> {id: object}
+        self.by_name = {}
+        # id -> the normalized names the object is under, so it can be removed after a rename
+        self.keys_by_id = {}
+
+    def add(self, obj):
+        """Add the object, or re-index it under its current names"""
+        self.remove(obj.id)
+        keys = {normalize(name) for name in self.get_names(obj) if name}
+        self.keys_by_id[obj.id] = keys
+        for key in keys:
+            self.by_name.setdefault(key, {})[obj.id] = obj
+
+    def remove(self, obj_id: int):
+        for key in self.keys_by_id.pop(obj_id, ()):
+            objs = self.by_name[key]
+            objs.pop(obj_id, None)
+            if not objs:
+                del self.by_name[key]
+
+    def get(self, name: str) -> list:
+        """Every object with that normalized name"""
+        return list(self.by_name.get(normalize(name), {}).values())
+
+
+# (guild id, kind) -> NameIndex
+NAME_INDEXES = {}
+
+
+def get_index(guild: nextcord.Guild, kind: str) -> NameIndex:
+    """The guild's index of that kind, (re)built if it's new or is missing objects nextcord has"""
+    get_objects, get_names = KINDS[kind]
+    objects = get_objects(guild)
+    index = NAME_INDEXES.get((guild.id, kind))
+    # Some changes (e.g. thread list syncs) don't come with an event, but they do change the count
+    if index is None or len(index.keys_by_id) != len(objects):
+        index = NameIndex(get_names)
+        for obj in objects.values():
+            index.add(obj)
+        NAME_INDEXES[(guild.id, kind)] = index
+    return index
+
+
+def find_by_name(
+    guild: nextcord.Guild, kind: str, name: str, types: tuple = None
+) -> object:
+    """The guild's object of that kind (and optionally those types) with that name, ignoring case. None if there isn't one.
+    Prefers an exact case match, then whichever name of the object matched first (for members), then the lowest
+    position (the first one the old linear searches would have found)"""
+    index = get_index(guild, kind)
+    get_objects, get_names = KINDS[kind]
+    objects = get_objects(guild)
+    key = normalize(name)
+    best, best_rank = None, None
+    for obj in index.get(name):
+        # Don't trust an index entry nextcord has since dropped or renamed
+        current = objects.get(obj.id)
+        if current is None:
+            index.remove(obj.id)
+            continue
+        names = get_names(current)
+        matched = [i for i, n in enumerate(names) if n and normalize(n) == key]
+        if not matched:
+            index.add(current)
+            continue
+        if types is not None and not isinstance(current, types):
+            continue
+        rank = (name not in names, matched[0], getattr(current, "position", 0))
+        if best_rank is None or rank < best_rank:
+            best, best_rank = current, rank
+    return best
+
+
+def find_first_by_name(
+    guild: nextcord.Guild, kind: str, names: list, types: tuple = None
+) -> object:
+    """The object for the first of the names which has one, or None. For trying a list of candidate names"""
+    for name in names:
+        obj = find_by_name(guild, kind, name, types)
+        if obj is not None:
+            return obj
+    return None
+
+
+def update_object(guild: nextcord.Guild, kind: str, obj):
+    """Index a new or changed object. Guilds whose index hasn't been built yet will pick it up when it is"""
+    index = NAME_INDEXES.get((guild.id, kind))
+    if index is not None:
+        index.add(obj)
+
+
+def remove_object(guild: nextcord.Guild, kind: str, obj_id: int):
+    index = NAME_INDEXES.get((guild.id, kind))
+    if index is not None:
+        index.remove(obj_id)
+
+
+def drop_guild(guild_id: int):
+    for kind in KINDS:
+        NAME_INDEXES.pop((guild_id, kind), None)
@@ -1,10 +1,13 @@
+import asyncio
+import time
+import weakref
 from utils import sheets_constants
 from utils import discord_utils
+from utils import google_utils
 import nextcord
 import gspread
 import database
-from sqlalchemy.sql.expression import insert
-from sqlalchemy.orm import Session
+from database import repositories
 from typing import Union
 import emoji
 
@@ -21,15 +24,15 @@ Used in any modules that uses sheets (sheets, lion, hydra...)
 #########################
 
 
-def addsheettethergeneric(
-    gspread_client,
+async def addsheettethergeneric(
+    gspread_client: google_utils.AsyncSheetsClient,
     sheet_key_or_link: str,
     curr_guild: nextcord.Guild,
     curr_catorchan: Union[nextcord.CategoryChannel, nextcord.TextChannel],
 ) -> gspread.Spreadsheet:
     """Add a sheet to the current channel"""
     # We accept both sheet keys or full links
-    proposed_sheet = get_sheet_from_key_or_link(gspread_client, sheet_key_or_link)
+    proposed_sheet = await get_sheet_from_key_or_link(gspread_client, sheet_key_or_link)
 
     # If we can't open the sheet, send an error and return
     if not proposed_sheet:
@@ -38,27 +41,26 @@ def addsheettethergeneric(
     # If the channel already has a sheet, then we update it.
     # Otherwise, we add the channel to our master sheet to establish the tether
 
-    with Session(database.DATABASE_ENGINE) as session:
-        result = (
-            session.query(database.SheetTethers)
-            .filter_by(channel_or_cat_id=curr_catorchan.id)
-            .first()
+    await repositories.set_sheet_tether(
+        curr_guild.id,
+        curr_guild.name,
+        curr_catorchan.id,
+        curr_catorchan.name,
+        proposed_sheet.url,
+    )
+
+    # Update the tether cache too
+    cached_tether = database.SHEET_TETHERS.get(curr_catorchan.id)
+    if cached_tether is not None:
+        cached_tether.sheet_link = proposed_sheet.url
+    else:
+        database.SHEET_TETHERS[curr_catorchan.id] = database.SheetTethers(
+            server_id=curr_guild.id,
+            server_name=curr_guild.name,
+            channel_or_cat_name=curr_catorchan.name,
+            channel_or_cat_id=curr_catorchan.id,
+            sheet_link=proposed_sheet.url,
         )
-        # If there is already an entry, we just need to update it.
-        if result is not None:
-            result.sheet_link = proposed_sheet.url
-        # Otherwise, we need to create an entry
-        else:
-            stmt = insert(database.SheetTethers).values(
-                server_id=curr_guild.id,
-                server_name=curr_guild.name,
-                channel_or_cat_name=curr_catorchan.name,
-                channel_or_cat_id=curr_catorchan.id,
-                sheet_link=proposed_sheet.url,
-            )
-            session.execute(stmt)
-        # Commits change
-        session.commit()
     return proposed_sheet
 
 
@@ -241,50 +243,52 @@ async def chancrabgeneric(
     )
     await discord_utils.send_message(ctx, embed)
 
-    addsheettethergeneric(gspread_client, curr_sheet_link, ctx.message.guild, new_chan)
+    await addsheettethergeneric(
+        gspread_client, curr_sheet_link, ctx.message.guild, new_chan
+    )
     return curr_sheet_link, newsheet, new_chan
 
 
+def _tether_key(chan_or_cat_id) -> int | None:
+    """Tether ids get passed around as both str and int (and sometimes None)"""
+    try:
+        return int(chan_or_cat_id)
+    except (TypeError, ValueError):
+        return None
+
+
 def findsheettether(curr_cat_id: int, curr_chan_id: int, curr_thread_id: int = None):
     """For finding the appropriate sheet tethering for a given category or channel"""
-    result = None
-    tether_type = None
-    # Search DB for the sheet tether, if there is one
-    with Session(database.DATABASE_ENGINE) as session:
-        # Search for channel's tether
-        result = (
-            session.query(database.SheetTethers)
-            .filter_by(channel_or_cat_id=curr_thread_id)
-            .first()
-        )
+    # Thread tethers win over channel tethers, which win over category tethers
+    for tether_id, tether_type in (
+        (curr_thread_id, sheets_constants.THREAD),
+        (curr_chan_id, sheets_constants.CHANNEL),
+        (curr_cat_id, sheets_constants.CATEGORY),
+    ):
+        result = database.SHEET_TETHERS.get(_tether_key(tether_id))
         if result is not None:
-            tether_type = sheets_constants.THREAD
-        else:
-            result = (
-                session.query(database.SheetTethers)
-                .filter_by(channel_or_cat_id=curr_chan_id)
-                .first()
-            )
-            # If we miss on the channel ID, try the category ID
-            if result is not None:
-                tether_type = sheets_constants.CHANNEL
-            else:
-                result = (
-                    session.query(database.SheetTethers)
-                    .filter_by(channel_or_cat_id=curr_cat_id)
-                    .first()
-                )
-                tether_type = sheets_constants.CATEGORY
-    return result, tether_type
+            return result, tether_type
+    return None, sheets_constants.CATEGORY
+
+
+def findsheettethers(channels: list) -> dict:
+    """Bulk version of findsheettether. Resolves the tethers of a whole list of channels in one pass.
+
+    Returns a dict of channel id -> (tether or None, tether type)
+    """
+    return {
+        channel.id: findsheettether(channel.category_id, channel.id)
+        for channel in channels
+    }
 
 
-def get_sheet_from_key_or_link(
-    gspread_client, sheet_key_or_link: str
+async def get_sheet_from_key_or_link(
+    gspread_client: google_utils.AsyncSheetsClient, sheet_key_or_link: str
 ) -> gspread.Spreadsheet:
     """Takes in a string, which could be a google sheet key or URL"""
     # Assume the str is a URL
     try:
-        sheet = gspread_client.open_by_url(sheet_key_or_link)
+        sheet = await gspread_client.open_by_url(sheet_key_or_link)
         return sheet
     except gspread.exceptions.APIError:
         return None
@@ -293,7 +297,7 @@ def get_sheet_from_key_or_link(
         pass
     # Assume the str is a sheet key
     try:
-        sheet = gspread_client.open_by_key(sheet_key_or_link)
+        sheet = await gspread_client.open_by_key(sheet_key_or_link)
         return sheet
     # Entity Not Found
     except gspread.exceptions.APIError:
@@ -327,9 +331,10 @@ async def sheetcreatetabgeneric(
         # Make sure the template/metatemplate tab exists on the sheet.
         template_index = 0
         try:
-            curr_sheet = gspread_client.open_by_url(curr_sheet_link)
-            template_id = curr_sheet.worksheet(template_or_meta).id
-            template_index = curr_sheet.worksheet(template_or_meta).index
+            curr_sheet = await gspread_client.open_by_url(curr_sheet_link)
+            template_tab = await gspread_client.worksheet(curr_sheet, template_or_meta)
+            template_id = template_tab.id
+            template_index = template_tab.index
         # Error when we can't open the curr sheet link
         except gspread.exceptions.APIError as e:
             error_json = e.response.json()
@@ -359,7 +364,7 @@ async def sheetcreatetabgeneric(
             return curr_sheet_link, newsheet
         # Make sure tab_name does not exist
         try:
-            curr_sheet.worksheet(tab_name)
+            await gspread_client.worksheet(curr_sheet, tab_name)
             # If there is a tab with the given name, that's an error!
             embed = discord_utils.create_embed()
             embed.add_field(
@@ -382,7 +387,8 @@ async def sheetcreatetabgeneric(
             else:
                 i = 1
 
-            newsheet = curr_sheet.duplicate_sheet(
+            newsheet = await gspread_client.duplicate_sheet(
+                curr_sheet,
                 source_sheet_id=template_id,
                 new_sheet_name=tab_name,
                 insert_sheet_index=template_index + i,
@@ -418,30 +424,131 @@ async def sheetcreatetabgeneric(
             return
 
 
+# How long (in seconds) a loaded Overview tab is shared between commands before we read it again
+OVERVIEW_SNAPSHOT_TTL = 15
+# sheet url -> (time the load started, task loading the OverviewSheet)
+OVERVIEW_SNAPSHOTS = {}
+# sheet url -> lock held while appending rows to its Overview tab. Entries go away once nobody holds or waits on them
+OVERVIEW_APPEND_LOCKS = weakref.WeakValueDictionary()
+
+
 class OverviewSheet:
-    def __init__(self, gspread_client: gspread.Client, sheet_url: str):
+    """
+    Snapshot of a sheet's Overview tab.
+
+    Snapshots are shared: commands on the same sheet within OVERVIEW_SNAPSHOT_TTL seconds reuse (or wait on)
+    one read of the tab instead of each downloading it. Whenever the bot writes to the Overview tab itself,
+    it should also update the snapshot with set_cell_value, so the next command sees its own changes.
+    """
+
+    def __init__(self, gspread_client: google_utils.AsyncSheetsClient, sheet_url: str):
         self.gspread_client = gspread_client
         self.sheet_url = sheet_url
         self.exception = None
 
-        self.spreadsheet = self.gspread_client.open_by_url(sheet_url)
-        self.worksheet = self.spreadsheet.worksheet("Overview")
+        self.spreadsheet = None
+        self.worksheet = None
+        self.overview_data = []
+        # Discord channel id (as str) -> 1-indexed row on the Overview tab
+        self.channel_rows = {}
+
+    @classmethod
+    async def open(
+        cls,
+        gspread_client: google_utils.AsyncSheetsClient,
+        sheet_url: str,
+        max_age: float = OVERVIEW_SNAPSHOT_TTL,
+    ) -> "OverviewSheet":
+        """Get a snapshot of the sheet's Overview tab that is at most max_age seconds old.
+
+        Use max_age=0 when about to append rows, since someone may have added rows by hand in the meantime,
+        and hold append_lock(sheet_url) until the rows are written.
+        Raises the same gspread errors as opening the sheet directly.
+        """
+        now = time.monotonic()
+        for url, (started_at, _) in list(OVERVIEW_SNAPSHOTS.items()):
+            if now - started_at > OVERVIEW_SNAPSHOT_TTL:
+                del OVERVIEW_SNAPSHOTS[url]
+
+        cached = OVERVIEW_SNAPSHOTS.get(sheet_url)
+        if cached is not None and now - cached[0] <= max_age:
+            load_task = cached[1]
+        else:
+            load_task = asyncio.ensure_future(cls._load(gspread_client, sheet_url))
+            OVERVIEW_SNAPSHOTS[sheet_url] = (now, load_task)
+
+        try:
+            # Shielded so one command being cancelled doesn't cancel the read for everyone else waiting on it
+            return await asyncio.shield(load_task)
+        except Exception:
+            # Don't hand out a failed load to the next command
+            if OVERVIEW_SNAPSHOTS.get(sheet_url, (None, None))[1] is load_task:
+                del OVERVIEW_SNAPSHOTS[sheet_url]
+            raise
+
+    @classmethod
+    async def _load(
+        cls, gspread_client: google_utils.AsyncSheetsClient, sheet_url: str
+    ) -> "OverviewSheet":
+        overview_sheet = cls(gspread_client, sheet_url)
+        overview_sheet.spreadsheet = await gspread_client.open_by_url(sheet_url)
+        overview_sheet.worksheet = await gspread_client.worksheet(
+            overview_sheet.spreadsheet, "Overview"
+        )
 
         # Cache all data on the overview sheet
-        self.overview_data = self.worksheet.get()
+        overview_sheet.overview_data = await gspread_client.get(
+            overview_sheet.worksheet
+        )
+        for i, row in enumerate(overview_sheet.overview_data):
+            if row and row[0]:
+                # Users expect 1-indexed rows. If a channel shows up twice, the first row wins
+                overview_sheet.channel_rows.setdefault(row[0], i + 1)
+        return overview_sheet
+
+    @staticmethod
+    def append_lock(sheet_url: str) -> asyncio.Lock:
+        """Lock to hold from reading the Overview tab (with max_age=0) until the appended rows are written,
+        so two commands appending to the same sheet don't both pick the same empty row"""
+        lock = OVERVIEW_APPEND_LOCKS.get(sheet_url)
+        if lock is None:
+            lock = asyncio.Lock()
+            OVERVIEW_APPEND_LOCKS[sheet_url] = lock
+        return lock
+
+    @staticmethod
+    def invalidate(sheet_url: str):
+        """Drop the shared snapshot of a sheet, e.g. after deleting rows from its Overview tab"""
+        OVERVIEW_SNAPSHOTS.pop(sheet_url, None)
 
     def get_cell_value(self, label: str) -> str:
         row, col = gspread.utils.a1_to_rowcol(label)
         return self.overview_data[row - 1][col - 1]
 
+    def set_cell_value(self, label: str, value: str):
+        """Write-through for the snapshot. Call after the bot itself has updated the cell on the sheet"""
+        row, col = gspread.utils.a1_to_rowcol(label)
+        while len(self.overview_data) < row:
+            self.overview_data.append([])
+        row_values = self.overview_data[row - 1]
+        while len(row_values) < col:
+            row_values.append("")
+        old_value = row_values[col - 1]
+        row_values[col - 1] = value
+
+        # Column A holds the Discord channel ids
+        if col == 1:
+            if self.channel_rows.get(old_value) == row:
+                del self.channel_rows[old_value]
+            if value:
+                self.channel_rows.setdefault(value, row)
+
     def find_row_of_channel(
         self, ctx: Context
     ) -> tuple[int, None] | tuple[None, nextcord.Embed]:
-        chan_id = str(ctx.channel.id)
-        for i, row in enumerate(self.overview_data):
-            if chan_id == row[0]:
-                # Users expect 1-indexed rows
-                return i + 1, None
+        row = self.channel_rows.get(str(ctx.channel.id))
+        if row is not None:
+            return row, None
 
         # I don't like Go-style errors, but I also don't want to make this async...
         embed = discord_utils.create_embed()
@@ -1,4 +1,7 @@
+import asyncio
+import constants
 import nextcord
+import time
 from nextcord.ext import commands
 from utils import sheets_constants
 from utils import discord_utils
@@ -22,7 +25,7 @@ def add_prefix(channel, prefix: str):
         for other_prefix in [
             op for op in sheets_constants.solved_prefixes if op + "-" != prefix
         ]:
-            p = Prefix(channel, other_prefix)
+            p = Prefix(channel, other_prefix + "-")
             if p.has_prefix():
                 new_channel_name = p.remove_prefix()
         if new_channel_name is None:
@@ -45,22 +48,102 @@ def remove_prefix(channel, prefix: str) -> str:
     return new_channel_name
 
 
+###################
+# CHANNEL RENAMES #
+###################
+
+# channel id -> when we last renamed it (time.monotonic()), within the last CHANNEL_RENAME_WINDOW
+RECENT_RENAMES = {}
+# channel id -> the name it'll get once the rename limit allows. Only the latest status change is kept
+PENDING_RENAMES = {}
+# channel id -> task which will rename it
+RENAME_TASKS = {}
+
+
+def get_channel_name(channel) -> str:
+    """The channel's name, counting a rename which is still waiting on the rename limit"""
+    return PENDING_RENAMES.get(channel.id, channel.name)
+
+
+def get_rename_delay(channel_id: int) -> float:
+    """Seconds until we can rename the channel without hitting Discord's rename limit"""
+    now = time.monotonic()
+    recent = [
+        renamed_at
+        for renamed_at in RECENT_RENAMES.get(channel_id, [])
+        if now - renamed_at < constants.CHANNEL_RENAME_WINDOW
+    ]
+    RECENT_RENAMES[channel_id] = recent
+    if len(recent) < constants.CHANNEL_RENAME_LIMIT:
+        return 0
+    return recent[0] + constants.CHANNEL_RENAME_WINDOW - now
+
+
+async def rename_channel(channel, new_name: str) -> float:
+    """Rename the channel, or if Discord won't let us yet, schedule it for when it will.
+    Renames asked for while one is scheduled replace it, so a channel whose status changes a few times in a row
+    is only renamed once, to the latest name.
+    Returns 0 if it was renamed now, otherwise how many seconds until it will be"""
+    if channel.id in PENDING_RENAMES:
+        PENDING_RENAMES[channel.id] = new_name
+        return max(get_rename_delay(channel.id), 0.0)
+    delay = get_rename_delay(channel.id)
+    if delay <= 0:
+        # Counted before the request, so renames at the same time don't both think there's room
+        renamed_at = time.monotonic()
+        RECENT_RENAMES[channel.id].append(renamed_at)
+        try:
+            await channel.edit(name=new_name)
+        except nextcord.HTTPException:
+            RECENT_RENAMES[channel.id].remove(renamed_at)
+            raise
+        return 0
+    PENDING_RENAMES[channel.id] = new_name
+    RENAME_TASKS[channel.id] = asyncio.create_task(rename_later(channel, delay))
+    return delay
+
+
+async def rename_later(channel, delay: float):
+    await asyncio.sleep(delay)
+    new_name = PENDING_RENAMES.pop(channel.id, None)
+    RENAME_TASKS.pop(channel.id, None)
+    # It may have been changed back in the meantime
+    if new_name is None or new_name == channel.name:
+        return
+    RECENT_RENAMES.setdefault(channel.id, []).append(time.monotonic())
+    try:
+        await channel.edit(name=new_name)
+    except nextcord.HTTPException as e:
+        print(f"Couldn't rename {channel.name} to {new_name}: {e}")
+
+
+def describe_rename(channel, delay: float) -> str:
+    """Tell users when a deferred rename will happen"""
+    if delay <= 0:
+        return ""
+    return (
+        f" Discord only allows {constants.CHANNEL_RENAME_LIMIT} channel renames every "
+        f"{constants.CHANNEL_RENAME_WINDOW // 60} minutes, so {channel.mention} will be renamed "
+        f"<t:{int(time.time() + delay)}:R>."
+    )
+
+
 async def status_channel(ctx: commands.Context, status_prefix):
     embed = discord_utils.create_embed()
-    new_channel_name = add_prefix(ctx.channel, status_prefix + "-")
+    new_channel_name = add_prefix(get_channel_name(ctx.channel), status_prefix + "-")
     if new_channel_name:
         try:
-            await ctx.channel.edit(name=new_channel_name)
+            delay = await rename_channel(ctx.channel, new_channel_name)
         except nextcord.Forbidden:
             embed.add_field(
                 name="Failed",
                 value=f"Unable to prepend `{status_prefix}` to {ctx.channel.mention}. Do I have the `manage_channels` permissions?",
             )
-            await discord_utils.send_message(ctx, embed)
-            return
+            return embed
         embed.add_field(
             name="Success",
-            value=f"Marking {ctx.channel.mention} as {status_prefix}!",
+            value=f"Marking {ctx.channel.mention} as {status_prefix}!"
+            + describe_rename(ctx.channel, delay),
             inline=False,
         )
     else:
@@ -77,12 +160,20 @@ async def status_remove(ctx: commands.Context):
     channel = ctx.message.channel
     prefixes = sheets_constants.solved_prefixes
     for prefix in prefixes:
-        new_channel_name = remove_prefix(ctx.message.channel, prefix + "-")
+        new_channel_name = remove_prefix(get_channel_name(channel), prefix + "-")
         if new_channel_name:
-            await channel.edit(name=new_channel_name)
+            try:
+                delay = await rename_channel(channel, new_channel_name)
+            except nextcord.Forbidden:
+                embed.add_field(
+                    name="Failed",
+                    value=f"Unable to remove `{prefix}` from {channel.mention}. Do I have the `manage_channels` permissions?",
+                )
+                return embed
             embed.add_field(
                 name="Success",
-                value=f"Marking {channel.mention} as un-{prefix}!",
+                value=f"Marking {channel.mention} as un-{prefix}!"
+                + describe_rename(channel, delay),
                 inline=False,
             )
             return embed